@@ -9,6 +9,7 @@ different repository structures and configurations.
 
 import sys
 import argparse
+import hashlib
 import subprocess
 import shutil
 import traceback
@@ -42,14 +43,33 @@ def _lazy_import(module_name: str, class_name: Optional[str] = None):
             from tools.change_detector import detect_changes
             _lazy_imports[module_name] = detect_changes
         elif module_name == 'godot_exporter':
-            from tools.godot_exporter import GodotExporter, create_fallback_export
-            _lazy_imports[module_name] = {'GodotExporter': GodotExporter, 'create_fallback_export': create_fallback_export}
+            from tools.godot_exporter import GodotExporter, GodotWorkerPool, create_fallback_export
+            _lazy_imports[module_name] = {'GodotExporter': GodotExporter, 'GodotWorkerPool': GodotWorkerPool, 'create_fallback_export': create_fallback_export}
+        elif module_name == 'export_cache':
+            from tools.export_cache import ExportCache
+            _lazy_imports[module_name] = ExportCache
+        elif module_name == 'project_index':
+            from tools.project_index import ProjectIndex
+            _lazy_imports[module_name] = ProjectIndex
+        elif module_name == 'deploy_manifest':
+            from tools.deploy_manifest import DeployManifest
+            _lazy_imports[module_name] = DeployManifest
+        elif module_name == 'preset_manager':
+            from tools.preset_manager import PresetManager
+            _lazy_imports[module_name] = PresetManager
+        elif module_name == 'import_cache':
+            from tools.import_cache import ImportCache
+            _lazy_imports[module_name] = ImportCache
+        elif module_name == 'export_scheduler':
+            from tools.export_scheduler import ExportHistory, ExportScheduler
+            _lazy_imports[module_name] = {'ExportHistory': ExportHistory, 'ExportScheduler': ExportScheduler}
         elif module_name == 'parallel_manager':
-            from tools.parallel_manager import ParallelManager
-            _lazy_imports[module_name] = ParallelManager
+            from tools.parallel_manager import ParallelManager, AdmissionController
+            _lazy_imports[module_name] = {'ParallelManager': ParallelManager, 'AdmissionController': AdmissionController}
         elif module_name == 'sidebar_generator':
             from tools.sidebar_generator import generate_sidebar
-            _lazy_imports[module_name] = generate_sidebar
+            from tools.readme_titles import write_if_changed
+            _lazy_imports[module_name] = {'generate_sidebar': generate_sidebar, 'write_if_changed': write_if_changed}
         elif module_name == 'embed_injector':
             from tools.embed_injector import inject_embeds
             _lazy_imports[module_name] = inject_embeds
@@ -106,6 +126,32 @@ Examples:
         help='Number of parallel jobs (default: auto-detected based on CPU/memory, use -j 0 for all cores)'
     )
     
+    parser.add_argument(
+        '--worker-pool',
+        action='store_true',
+        help='Export through workers with warm Godot user directories kept in <cache_dir>/godot_workers'
+    )
+    
+    parser.add_argument(
+        '--worker-memory-limit',
+        type=int,
+        help='Kill a pool export whose memory use exceeds this many MB'
+    )
+    
+    parser.add_argument(
+        '--import-cache-size',
+        type=int,
+        default=2048,
+        help='Size budget in MB for the shared Godot import cache (default: 2048)'
+    )
+    
+    parser.add_argument(
+        '--export-cache-size',
+        type=int,
+        default=4096,
+        help='Size budget in MB for the export cache; least recently used exports are evicted (default: 4096)'
+    )
+    
     # Build mode options
     parser.add_argument(
         'target',
@@ -128,6 +174,13 @@ Examples:
         help='Verify Godot environment is properly set up'
     )
     
+    parser.add_argument(
+        '--toolchain-cache',
+        type=Path,
+        metavar='FILE',
+        help='Restore the Godot toolchain store from this tarball before setup and pack it back after (for CI caches)'
+    )
+    
     # Change detection options
     parser.add_argument(
         '--force-rebuild',
@@ -141,6 +194,24 @@ Examples:
         help='Base reference for change detection (default: HEAD~1)'
     )
     
+    parser.add_argument(
+        '--no-git',
+        action='store_true',
+        help='Detect changes from an incremental filesystem index instead of Git'
+    )
+    
+    parser.add_argument(
+        '--deploy-manifest',
+        type=Path,
+        help='Manifest of the last deploy to diff against in CI (default: <cache_dir>/deploy_manifest.json)'
+    )
+    
+    parser.add_argument(
+        '--no-publish-manifest',
+        action='store_true',
+        help='Do not publish the deploy manifest from the artifact target (for artifacts that are not deployed)'
+    )
+    
     parser.add_argument(
         '--no-change-detection',
         action='store_true',
@@ -160,6 +231,32 @@ Examples:
         help='Output directory for artifacts'
     )
     
+    parser.add_argument(
+        '--staging-mode',
+        choices=['auto', 'hardlink', 'reflink', 'copy'],
+        default='auto',
+        help='How project files are staged into the artifact: auto tries hardlink, then reflink, then copy (default: auto)'
+    )
+    
+    parser.add_argument(
+        '--no-shared-engine',
+        action='store_true',
+        help='Keep a separate copy of the engine files in every web export of the artifact'
+    )
+    
+    parser.add_argument(
+        '--precompress',
+        action='store_true',
+        help='Write .gz (and .br with the brotli package) siblings of compressible artifact files'
+    )
+    
+    parser.add_argument(
+        '--validation-report',
+        type=Path,
+        metavar='FILE',
+        help='Write the artifact validation result as JSON to FILE'
+    )
+    
     # Behavioral flags
     parser.add_argument(
         '--dry-run',
@@ -185,6 +282,12 @@ Examples:
         help='Clean build artifacts before building'
     )
     
+    parser.add_argument(
+        '--purge-cache',
+        action='store_true',
+        help='With clean, also delete the build caches and indexes in the cache dir'
+    )
+    
     parser.add_argument(
         '--preview',
         action='store_true',
@@ -200,6 +303,17 @@ Examples:
     return parser
 
 
+def create_deploy_manifest(args, config, project_root: Path, project_index, progress: ProgressReporter):
+    """Deploy manifest handle that invalidates every project when the build inputs change"""
+    config_file = args.config if args.config and args.config.exists() else project_root / "build_config.json"
+    build_inputs = {
+        'godot_version': config.godot_version or "",
+        'build_config': hashlib.sha256(config_file.read_bytes()).hexdigest() if config_file.exists() else "",
+    }
+    manifest_file = args.deploy_manifest or project_root / config.structure.cache_dir / "deploy_manifest.json"
+    return _lazy_import('deploy_manifest')(manifest_file, project_index, build_inputs, progress)
+
+
 def main():
     """Main entry point"""
     parser = create_argument_parser()
@@ -248,7 +362,9 @@ def main():
             success = _lazy_import('environment_manager', 'setup_godot_environment')(
                 config.godot_version,
                 force_reinstall=args.force_rebuild,
-                progress_reporter=progress
+                progress_reporter=progress,
+                toolchain_cache=args.toolchain_cache,
+                template_platforms=config.export_platforms or None
             )
             return 0 if success else 1
         
@@ -289,11 +405,17 @@ def main():
             cache_dir = project_root / (config.structure.cache_dir or ".")
             
             artifact_dir = artifact_manager.prepare_documentation_artifact(
-                project_root, projects_dir, output_dir
+                project_root, projects_dir, output_dir,
+                staging_mode=args.staging_mode,
+                share_engines=not args.no_shared_engine,
+                precompress=args.precompress
             )
             
             # Validate artifact with tolerance for partial failures
             issues = artifact_manager.validate_for_deployment(artifact_dir, config)
+            if args.validation_report:
+                artifact_manager.last_validation.write_json(args.validation_report)
+                progress.info(f"📝 Validation report written to {args.validation_report}")
             if issues:
                 # Check if failures are within acceptable limits
                 allow_partial = (hasattr(config, 'deployment') and 
@@ -301,26 +423,43 @@ def main():
                 
                 if allow_partial:
                     progress.warning(f"⚠️ Artifact has {len(issues)} issues but partial failures are allowed")
-                    progress.success(f"✅ Deployment artifact ready at: {artifact_dir}")
-                    return 0
                 else:
                     progress.error(f"❌ Artifact validation failed: {len(issues)} critical issues")
                     return 1
-            else:
-                progress.success(f"✅ Deployment artifact ready at: {artifact_dir}")
-                return 0
+            
+            # Publish the manifest of the build that went into this artifact and
+            # ship it with the site so later runs can diff against it
+            if config.structure.cache_dir and not args.no_publish_manifest:
+                project_index_file = None
+                if config.enable_caching is not False:
+                    project_index_file = cache_dir / "project_index.json"
+                project_index = _lazy_import('project_index').load_or_build(projects_dir, project_index_file, progress)
+                deploy_manifest = create_deploy_manifest(args, config, project_root, project_index, progress)
+                manifest_file = deploy_manifest.publish(
+                    cache_dir / "deploy_manifest.pending.json", cache_dir / "deploy_manifest.json"
+                )
+                if manifest_file:
+                    artifact_manager.ship_deploy_manifest(artifact_dir, manifest_file)
+            
+            progress.success(f"✅ Deployment artifact ready at: {artifact_dir}")
+            return 0
         
         # Handle cleaning
         if args.clean or args.target == 'clean':
             progress.info("🧹 Cleaning build artifacts...")
             
-            # Clean cache directory
+            # The cache dir holds incremental state (export/import caches, deploy
+            # manifest, export history, indexes); only --purge-cache removes it
             import shutil
-            cache_dir_val = config.structure.cache_dir or "."
-            cache_dir = project_root / cache_dir_val
-            if cache_dir.exists():
-                shutil.rmtree(cache_dir)
-                cache_dir.mkdir(parents=True, exist_ok=True)
+            if config.structure.cache_dir:
+                cache_dir = project_root / config.structure.cache_dir
+                if args.purge_cache and cache_dir.exists():
+                    shutil.rmtree(cache_dir)
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    progress.info(f"🗑️  Purged build caches in {cache_dir}")
+                else:
+                    # A pending deploy manifest describes exports that are removed below
+                    (cache_dir / "deploy_manifest.pending.json").unlink(missing_ok=True)
             
             # Clean project artifacts
             projects_dir_val = config.structure.projects_dir or "."
@@ -333,23 +472,62 @@ def main():
             if args.target == 'clean':
                 return 0
         
+        # Index the projects tree once; every stage below reads from it instead
+        # of walking the tree again. The index is persisted in the cache dir so
+        # the next run only re-lists directories whose mtime changed.
+        projects_dir = project_root / (config.structure.projects_dir or ".")
+        project_index_file = None
+        if config.enable_caching is not False and config.structure.cache_dir:
+            project_index_file = project_root / config.structure.cache_dir / "project_index.json"
+        project_index = _lazy_import('project_index').load_or_build(projects_dir, project_index_file, progress)
+        
+        # Commit, project hashes and export cache entries of the last successful deploy
+        deploy_manifest = None
+        if args.deploy_manifest or config.structure.cache_dir:
+            deploy_manifest = create_deploy_manifest(args, config, project_root, project_index, progress)
+        
         # Detect changes (unless disabled)
-        changed_projects = set()
+        # None means every project is exported
+        changed_projects = None
         if not args.no_change_detection and not args.force_rebuild:
             progress.info("🔍 Detecting changes...")
+            change_index = None
+            graph_cache = None
+            if config.structure.cache_dir:
+                change_index = project_root / config.structure.cache_dir / "change_index.bin"
+                graph_cache = project_root / config.structure.cache_dir / "project_graph.json"
             changes = _lazy_import('change_detector')(
                 project_root,
                 args.base_ref,
                 args.force_rebuild,
-                use_git=True,
-                progress_reporter=progress
+                use_git=not args.no_git,
+                progress_reporter=progress,
+                cache_file=change_index,
+                projects_dir=projects_dir,
+                project_index=project_index,
+                graph_cache=graph_cache,
+                deploy_manifest=deploy_manifest
             )
             
-            if not changes.build_system_changed and not changes.docs_changed and not changes.changed_projects:
+            # Exports left behind by removed projects would otherwise be deployed
+            import shutil
+            for project_rel in sorted(changes.deleted_projects):
+                project_dir = projects_dir / project_rel
+                leftover = project_dir / "exports"
+                if leftover.is_dir() and not (project_dir / "project.godot").exists():
+                    shutil.rmtree(leftover)
+                    progress.info(f"🗑️  Removed exports of deleted project {project_rel}")
+                project_index.refresh(project_dir)
+            
+            if (not changes.build_system_changed and not changes.docs_changed
+                    and not changes.changed_projects and not changes.deleted_projects):
                 progress.success("✅ No changes detected - skipping build")
                 return 0
             
-            changed_projects = changes.changed_projects
+            # Build system changes rebuild everything; otherwise export only the
+            # projects the dependency graph maps the changes to
+            if not changes.build_system_changed:
+                changed_projects = changes.changed_projects
         
         # Determine Godot binary name - prefer system Godot if available
         import shutil
@@ -377,20 +555,23 @@ def main():
         for key, value in env_dict.items():
             setattr(env, key.lower(), value)
         
+        def project_rel(project_dir):
+            return project_dir.relative_to(projects_dir).as_posix()
+        
+        def needs_export(project_file):
+            """Whether an incremental build has to export this project"""
+            if project_rel(project_file.parent) in changed_projects:
+                return True
+            # Projects without an export are built regardless of the change set
+            return not project_index.has_file(project_file.parent / "exports" / "web" / "index.html")
+        
         if args.preview:
             progress.info("📋 Build Plan Preview:")
-            # Memory-efficient preview - don't load all files at once
-            projects_dir = project_root / (config.structure.projects_dir or ".")
             
-            # Use generator for memory efficiency
             def project_generator():
-                for project_file in projects_dir.rglob("project.godot"):
-                    if not changed_projects:
+                for project_file in project_index.project_files():
+                    if changed_projects is None or needs_export(project_file):
                         yield project_file
-                    else:
-                        project_rel = str(project_file.parent.relative_to(projects_dir))
-                        if any(project_rel.startswith(changed) for changed in changed_projects):
-                            yield project_file
             
             # Count and preview first 10 without loading all into memory
             project_count = 0
@@ -414,20 +595,60 @@ def main():
                 
                 # Import the real Godot exporter
                 try:
+                    # Content-addressed export and import caches (disabled with --no-cache)
+                    export_cache = None
+                    import_cache = None
+                    if config.enable_caching is not False and config.structure.cache_dir:
+                        export_cache = _lazy_import('export_cache')(
+                            project_root / config.structure.cache_dir, progress, args.export_cache_size
+                        )
+                        import_cache = _lazy_import('import_cache')(
+                            project_root / config.structure.cache_dir, args.import_cache_size, progress
+                        )
+                    
+                    # Web preset merged into each project, with overrides from build_config.json
+                    preset_manager = _lazy_import('preset_manager')(
+                        vars(config.export_presets), projects_dir, progress
+                    )
+                    
                     exporter = _lazy_import('godot_exporter', 'GodotExporter')(
                         godot_binary=godot_binary,  # Use the detected system binary
-                        progress_reporter=progress
+                        progress_reporter=progress,
+                        export_cache=export_cache,
+                        template_version=config.godot_version or "",
+                        import_cache=import_cache,
+                        project_index=project_index,
+                        preset_manager=preset_manager
                     )
                 except ImportError:
                     progress.error("❌ Failed to import Godot exporter")
                     return 1
                 
                 # Find all Godot projects
-                projects_dir = project_root / (config.structure.projects_dir or ".")
-                project_files = list(projects_dir.rglob("project.godot"))
+                project_files = project_index.project_files()
+                all_project_count = len(project_files)
+                if changed_projects is not None and all_project_count:
+                    affected = {project_rel(pf.parent) for pf in project_files} & changed_projects
+                    unexported = {project_rel(pf.parent) for pf in project_files
+                                  if project_rel(pf.parent) not in affected and needs_export(pf)}
+                    progress.info(f"🎯 {len(affected)} of {all_project_count} projects affected by the changes")
+                    
+                    # Unchanged projects without an export (e.g. a fresh CI checkout) come
+                    # straight from the export cache entries the deploy manifest lists
+                    if unexported and deploy_manifest and export_cache and not args.dry_run:
+                        restored = deploy_manifest.restore_exports(export_cache, unexported)
+                        if restored:
+                            progress.info(f"♻️  {len(restored)} unchanged projects restored from the export cache")
+                        unexported -= restored
+                    if unexported:
+                        progress.info(f"📦 {len(unexported)} unchanged projects have no export yet - exporting them")
+                    
+                    project_files = [pf for pf in project_files if project_rel(pf.parent) in affected | unexported]
                 
-                if not project_files:
+                if not all_project_count:
                     progress.warning("⚠️ No Godot projects found in {}".format(projects_dir))
+                elif not project_files:
+                    progress.info(f"✅ No projects need exporting - skipping exports")
                 else:
                     progress.info(f"📦 Found {len(project_files)} projects to process")
                     
@@ -447,14 +668,14 @@ def main():
                                 export_dir = project_dir / "exports" / "web"
                                 export_dir.mkdir(parents=True, exist_ok=True)
                                 create_fallback_export(project_dir, export_dir)
+                                project_index.refresh(project_dir)
+                                if deploy_manifest:
+                                    deploy_manifest.invalidate(project_rel(project_dir))
                             
                             progress.warning("⚠️ Created fallback exports. Install Godot for real game exports.")
                         else:
-                            # Use parallel export with intelligent job management
-                            parallel_manager = _lazy_import('parallel_manager')()
-                            optimal_jobs = parallel_manager.get_adaptive_job_count(
-                                project_count=len(project_files)
-                            )
+                            # Use parallel export with memory-aware admission control
+                            parallel_manager = _lazy_import('parallel_manager', 'ParallelManager')()
                             
                             # Allow override for full CPU utilization
                             if args.jobs == 0:
@@ -466,17 +687,64 @@ def main():
                                 max_godot_jobs = args.jobs
                             else:
                                 # Default: use conservative limit for stability
-                                max_godot_jobs = optimal_jobs if optimal_jobs <= 8 else 8
+                                max_godot_jobs = min(parallel_manager.cpu_count, 8)
+                            
+                            # Memory is governed at runtime by the admission controller, so the
+                            # static count only caps concurrency by CPU
+                            final_jobs = max(1, min(max_godot_jobs, len(project_files)))
+                            admission = _lazy_import('parallel_manager', 'AdmissionController')(final_jobs)
+                            progress.info(f"⚡ Using up to {final_jobs} memory-admitted parallel Godot export jobs (CPU: {parallel_manager.cpu_count}, Memory: {parallel_manager.available_memory:.1f}GB)")
+                            
+                            # Optionally route exports through long-lived workers
+                            worker_pool = None
+                            if args.worker_pool:
+                                worker_dir = None
+                                if config.structure.cache_dir:
+                                    worker_dir = project_root / config.structure.cache_dir / "godot_workers"
+                                worker_pool = _lazy_import('godot_exporter', 'GodotWorkerPool')(
+                                    exporter,
+                                    workers=final_jobs,
+                                    memory_ceiling_mb=args.worker_memory_limit,
+                                    work_dir=worker_dir
+                                )
                             
-                            final_jobs = min(optimal_jobs, max_godot_jobs) if args.jobs != 0 else max_godot_jobs
-                            progress.info(f"⚡ Using {final_jobs} adaptive parallel Godot export jobs (CPU: {parallel_manager.cpu_count}, Memory: {parallel_manager.available_memory:.1f}GB)")
+                            # Order exports longest-first from recorded export history
+                            scheduler = None
+                            if config.structure.cache_dir:
+                                history = _lazy_import('export_scheduler', 'ExportHistory')(
+                                    project_root / config.structure.cache_dir / "export_history.json", progress
+                                )
+                                scheduler = _lazy_import('export_scheduler', 'ExportScheduler')(
+                                    history, projects_dir, progress, project_index
+                                )
                             
                             # Export projects in parallel
-                            results = exporter.export_projects_parallel(
-                                project_files,
-                                max_workers=final_jobs,
-                                force_rebuild=args.force_rebuild
-                            )
+                            try:
+                                results = exporter.export_projects_parallel(
+                                    project_files,
+                                    max_workers=final_jobs,
+                                    force_rebuild=args.force_rebuild,
+                                    worker_pool=worker_pool,
+                                    scheduler=scheduler,
+                                    admission=admission
+                                )
+                            finally:
+                                if worker_pool:
+                                    worker_pool.close()
+                                if args.verbose:
+                                    progress.info(f"📝 Export presets: {preset_manager.written} rewritten, {preset_manager.unchanged} unchanged")
+                                if export_cache:
+                                    export_cache.evict()
+                                if import_cache:
+                                    import_cache.save()
+                                    if args.verbose:
+                                        progress.info(f"📦 Import cache: {import_cache.seeded} assets seeded, {import_cache.harvested} harvested")
+                            
+                            # Remember which cache entry each export came from for the deploy manifest
+                            if deploy_manifest:
+                                for result in results:
+                                    if result.success and result.cache_key:
+                                        deploy_manifest.record_export(project_rel(result.project_path), result.cache_key)
                             
                             # Generate summary
                             summary = exporter.get_export_summary(results)
@@ -491,6 +759,9 @@ def main():
                                         export_dir = result.project_path / "exports" / "web"
                                         export_dir.mkdir(parents=True, exist_ok=True)
                                         create_fallback_export(result.project_path, export_dir)
+                                        project_index.refresh(result.project_path)
+                                        if deploy_manifest:
+                                            deploy_manifest.invalidate(project_rel(result.project_path))
                                 
                                 if summary['successful'] > 0:
                                     progress.warning(f"⚠️ {summary['successful']} succeeded, {summary['failed']} failed with fallbacks")
@@ -498,6 +769,8 @@ def main():
                                     return 1
                             else:
                                 progress.success(f"✅ Successfully exported {summary['successful']} projects")
+                                if summary['cached']:
+                                    progress.info(f"♻️  {summary['cached']} exports restored from cache")
                                 progress.info(f"📊 Total size: {summary['total_export_size']:,} bytes, "
                                             f"avg time: {summary['average_export_time']:.1f}s per project")
             
@@ -517,10 +790,15 @@ def main():
                             progress.info("ℹ️ Sidebar generation disabled in configuration; skipping sidebar generation.")
                         else:
                             # Use the sidebar generator tool
-                            generate_sidebar = _lazy_import('sidebar_generator')
-                            projects_dir = project_root / (config.structure.projects_dir or ".")
+                            generate_sidebar = _lazy_import('sidebar_generator', 'generate_sidebar')
+                            title_index_file = link_cache_file = None
+                            if project_index_file:
+                                title_index_file = project_index_file.with_name("readme_titles.json")
+                                link_cache_file = project_index_file.with_name("readme_links.json")
                             sidebar_content, errors = generate_sidebar(
-                                projects_dir, config, validate=True, verbose=args.verbose, use_hierarchy=True
+                                projects_dir, config, validate=True, verbose=args.verbose, use_hierarchy=True,
+                                project_index=project_index, title_index_file=title_index_file,
+                                link_cache_file=link_cache_file
                             )
 
                             if errors:
@@ -531,8 +809,10 @@ def main():
                                     progress.warning(f"   ... and {len(errors) - 3} more")
 
                             sidebar_output = project_root / "_sidebar.md"
-                            sidebar_output.write_text(sidebar_content)
-                            progress.success(f"✅ Documentation sidebar generated: {sidebar_output}")
+                            if _lazy_import('sidebar_generator', 'write_if_changed')(sidebar_output, sidebar_content):
+                                progress.success(f"✅ Documentation sidebar generated: {sidebar_output}")
+                            else:
+                                progress.success(f"✅ Documentation sidebar unchanged: {sidebar_output}")
             
             # Inject embeds for final/production builds
             if args.target in ['final', 'all']:
@@ -543,9 +823,10 @@ def main():
                 else:
                     # Use the embed injector tool
                     inject_embeds = _lazy_import('embed_injector')
-                    projects_dir = project_root / (config.structure.projects_dir or ".")
+                    embed_state_file = project_index_file.with_name("embed_state.json") if project_index_file else None
                     stats, errors = inject_embeds(
-                        projects_dir, dry_run=False, verbose=args.verbose
+                        projects_dir, dry_run=False, verbose=args.verbose, project_index=project_index,
+                        state_file=embed_state_file
                     )
                     
                     if errors:
@@ -564,14 +845,21 @@ def main():
         if not config.dry_run_mode:
             progress.info("🔍 Verifying build results...")
             artifact_manager = _lazy_import('artifact_manager')(progress)
-            projects_dir = project_root / (config.structure.projects_dir or ".")
-            verification = artifact_manager.verify_build_results(projects_dir)
+            verification = artifact_manager.verify_build_results(projects_dir, project_index)
             
             if verification['success_rate'] == 100:
                 progress.success(f"✅ All {verification['total_projects']} projects built successfully!")
             else:
                 progress.warning(f"⚠️  {verification['complete_exports']}/{verification['total_projects']} projects built ({verification['success_rate']:.1f}% success rate)")
         
+        if project_index_file and not config.dry_run_mode:
+            project_index.save(project_index_file)
+        
+        # Record what this build produced; the artifact target publishes it once the artifact is valid
+        if (deploy_manifest and config.structure.cache_dir and not config.dry_run_mode
+                and args.target in ['build', 'all', 'final']):
+            deploy_manifest.save_pending(project_root / config.structure.cache_dir / "deploy_manifest.pending.json")
+        
         progress.success("✅ Build completed successfully!")
         return 0
         
@@ -34,6 +34,15 @@ class DeploymentConfig:
     exclude_templates: Optional[bool] = None
 
 
+@dataclass
+class ExportPresetConfig:
+    # Web preset keys and preset options applied to every project
+    preset: Dict[str, Any] = field(default_factory=dict)
+    options: Dict[str, Any] = field(default_factory=dict)
+    # Project path or glob (relative to projects_dir) -> {"preset": {...}, "options": {...}}
+    projects: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
 @dataclass
 class BuildSystemConfig:
     project_name: Optional[str] = None
@@ -48,11 +57,14 @@ class BuildSystemConfig:
     enable_caching: Optional[bool] = None
     verbose_output: Optional[bool] = None
     dry_run_mode: Optional[bool] = None
+    # Platforms whose export templates are installed (empty: web only)
+    export_platforms: List[str] = field(default_factory=list)
     structure: StructureConfig = field(default_factory=StructureConfig)
     project_include_patterns: List[str] = field(default_factory=list)
     project_exclude_patterns: List[str] = field(default_factory=list)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     deployment: DeploymentConfig = field(default_factory=DeploymentConfig)
+    export_presets: ExportPresetConfig = field(default_factory=ExportPresetConfig)
 
     @classmethod
     def from_json_file(cls, config_path: Path) -> 'BuildSystemConfig':
@@ -61,14 +73,17 @@ class BuildSystemConfig:
         structure_data = data.pop('structure', {})
         logging_data = data.pop('logging', {})
         deployment_data = data.pop('deployment', {})
+        export_presets_data = data.pop('export_presets', {})
         structure = StructureConfig(**structure_data)
         logging = LoggingConfig(**logging_data)
         deployment = DeploymentConfig(**deployment_data)
+        export_presets = ExportPresetConfig(**export_presets_data)
         return cls(
             **data,
             structure=structure,
             logging=logging,
-            deployment=deployment
+            deployment=deployment,
+            export_presets=export_presets
         )
 
     def apply_to_environment(self, env_dict: Dict[str, Any]) -> None:
@@ -17,12 +17,26 @@ from dataclasses import dataclass
 
 try:
     from .progress_reporter import ProgressReporter
+    from .project_index import ProjectIndex
+    from .deploy_manifest import ARTIFACT_MANIFEST_NAME
+    from .tree_stats import TreeStats, scan_tree
+    from .artifact_staging import ArtifactStager
+    from .engine_dedupe import EngineDedupeResult, dedupe_engines, shared_engine_dir
+    from .precompress import CompressionResult, Precompressor, is_sibling, remove_precompressed
+    from .artifact_validator import ExportCheck, ValidationReport, scan_artifact, validate_artifact
 except ImportError:
     # Fallback for CLI execution
     import sys
     import os
     sys.path.append(os.path.dirname(__file__))
     from progress_reporter import ProgressReporter
+    from project_index import ProjectIndex
+    from deploy_manifest import ARTIFACT_MANIFEST_NAME
+    from tree_stats import TreeStats, scan_tree
+    from artifact_staging import ArtifactStager
+    from engine_dedupe import EngineDedupeResult, dedupe_engines, shared_engine_dir
+    from precompress import CompressionResult, Precompressor, is_sibling, remove_precompressed
+    from artifact_validator import ExportCheck, ValidationReport, scan_artifact, validate_artifact
 
 
 @dataclass
@@ -39,6 +53,10 @@ class ArtifactManager:
     
     def __init__(self, progress_reporter: Optional[ProgressReporter] = None):
         self.progress = progress_reporter or ProgressReporter()
+        # Statistics recorded while preparing artifacts, keyed by resolved artifact dir
+        self.artifact_stats: Dict[Path, TreeStats] = {}
+        self.compression_results: Dict[Path, CompressionResult] = {}
+        self.last_validation: Optional[ValidationReport] = None
         
     def clean_build_artifacts(self, projects_dir: Path) -> int:
         """Clean existing build artifacts from projects directory"""
@@ -78,60 +96,68 @@ class ArtifactManager:
         self.progress.success(f"✅ Cleaned {artifacts_cleaned} build artifacts")
         return artifacts_cleaned
     
-    def verify_build_results(self, projects_dir: Path) -> Dict[str, Any]:
+    def verify_build_results(self, projects_dir: Path,
+                             project_index: Optional[ProjectIndex] = None) -> Dict[str, Any]:
         """Verify and analyze build results"""
         
         self.progress.info("🔍 Verifying build results...")
         
-        # Count projects
-        project_files = list(projects_dir.rglob("project.godot"))
-        total_projects = len(project_files)
+        if project_index is not None and project_index.root != projects_dir:
+            project_index = None
         
-        # Count exports
-        export_indices = list(projects_dir.rglob("*/exports/*/index.html"))
-        total_exports = len(export_indices)
-        
-        # Count export directories
-        export_dirs = list(projects_dir.rglob("exports"))
-        export_dirs = [d for d in export_dirs if d.is_dir()]
-        
-        # Analyze web exports specifically
-        web_exports = []
-        for export_index in export_indices:
-            export_dir = export_index.parent
+        if project_index is not None:
+            project_files = project_index.project_files()
+            total_projects = len(project_files)
+            export_indices = [d / "index.html"
+                              for pf in project_files
+                              for d in project_index.export_dirs(pf.parent)
+                              if project_index.has_file(d / "index.html")]
+            export_dir_count = sum(1 for pf in project_files if project_index.export_dirs(pf.parent))
             
             # Check for required web export files
-            has_wasm = any(export_dir.glob("*.wasm"))
-            has_pck = any(export_dir.glob("*.pck"))
-            has_js = any(export_dir.glob("*.js"))
-            
-            web_exports.append({
-                "path": str(export_index.relative_to(projects_dir)),
-                "dir": str(export_dir.relative_to(projects_dir)),
-                "has_wasm": has_wasm,
-                "has_pck": has_pck,
-                "has_js": has_js,
-                "complete": has_wasm and has_pck and has_js
-            })
+            checks = []
+            for export_index in export_indices:
+                export_dir = export_index.parent
+                suffixes = {path.suffix for path, _, _ in project_index.iter_tree(export_dir)
+                            if path.parent == export_dir}
+                check = ExportCheck(
+                    path=export_index.relative_to(projects_dir).as_posix(),
+                    project=export_dir.parent.parent.relative_to(projects_dir).as_posix(),
+                    has_wasm=".wasm" in suffixes,
+                    has_pck=".pck" in suffixes,
+                    has_js=".js" in suffixes,
+                )
+                if not (check.has_wasm and check.has_js) and shared_engine_dir(export_index) is not None:
+                    # Engine deduplicated into the artifact's shared engine directory
+                    check.has_wasm = check.has_js = True
+                checks.append(check)
+        else:
+            # One walk finds projects, export dirs and export contents
+            scan = scan_artifact(projects_dir)
+            total_projects = len(scan.projects)
+            export_dir_count = scan.export_dirs
+            checks = scan.exports
+        total_exports = len(checks)
+        web_exports = [check.to_dict() for check in checks]
         
         # Count complete vs incomplete exports
         complete_exports = sum(1 for export in web_exports if export["complete"])
         
         results = {
             "total_projects": total_projects,
-            "export_dirs": len(export_dirs),
+            "export_dirs": export_dir_count,
             "total_exports": total_exports,
             "complete_exports": complete_exports,
             "incomplete_exports": total_exports - complete_exports,
             "success_rate": (complete_exports / total_projects * 100) if total_projects > 0 else 0,
             "web_exports": web_exports[:5],  # Sample of exports for debugging
-            "export_paths": [str(p.relative_to(projects_dir)) for p in export_indices[:5]]
+            "export_paths": [check.path for check in checks[:5]]
         }
         
         # Report results
         self.progress.info(f"📊 Build verification results:")
         self.progress.info(f"  📋 Total projects: {total_projects}")
-        self.progress.info(f"  📁 Export directories: {len(export_dirs)}")
+        self.progress.info(f"  📁 Export directories: {export_dir_count}")
         self.progress.info(f"  🌐 Total exports: {total_exports}")
         self.progress.info(f"  ✅ Complete exports: {complete_exports}")
         self.progress.info(f"  ⚠️  Incomplete exports: {total_exports - complete_exports}")
@@ -147,8 +173,18 @@ class ArtifactManager:
     def prepare_documentation_artifact(self, 
                                      root_dir: Path, 
                                      projects_dir: Path,
-                                     output_dir: Optional[Path] = None) -> Path:
-        """Prepare documentation site artifact for deployment"""
+                                     output_dir: Optional[Path] = None,
+                                     staging_mode: str = "auto",
+                                     share_engines: bool = True,
+                                     precompress: bool = False) -> Path:
+        """Prepare documentation site artifact for deployment
+
+        Project directories are staged incrementally by hardlink, reflink or
+        copy (see artifact_staging), so a rerun only touches changed files.
+        With share_engines, web exports built with the same engine load it
+        from one shared engine/<hash>/ directory (see engine_dedupe).
+        With precompress, .gz/.br siblings are kept current (see precompress).
+        """
         self.progress.info("📦 Preparing documentation artifact...")
 
         if output_dir is None:
@@ -165,6 +201,9 @@ class ArtifactManager:
             "docsify-embed-godot.js"
         ]
 
+        # Statistics are recorded as files are copied instead of walking the artifact afterwards
+        stats = TreeStats()
+
         # Copy documentation files
         copied_files = []
         for doc_file in doc_files:
@@ -172,11 +211,12 @@ class ArtifactManager:
             if src_path.exists():
                 dest_path = output_dir / doc_file
                 shutil.copy2(src_path, dest_path)
+                stats.add(doc_file, src_path.stat().st_size)
                 copied_files.append(doc_file)
                 self.progress.info(f"  📄 Copied {doc_file}")
 
-        # Copy all top-level project directories (ending with '-projects' or '-extended')
-        self.progress.info(f"  📁 Copying all project directories...")
+        # Stage all top-level project directories (ending with '-projects' or '-extended')
+        self.progress.info(f"  📁 Staging all project directories...")
         exclude_patterns = {
             ".git", ".gitignore", ".gitmodules",
             ".import", "*.tmp", "*.log", 
@@ -202,17 +242,28 @@ class ArtifactManager:
             return ignored
 
         # Find all top-level project dirs
+        stager = ArtifactStager(staging_mode, self.progress)
         for child in root_dir.iterdir():
             if child.is_dir() and (child.name.endswith('-projects') or child.name.endswith('-extended')):
-                dest_dir = output_dir / child.name
-                if dest_dir.exists():
-                    shutil.rmtree(dest_dir)
-                shutil.copytree(child, dest_dir, ignore=ignore_patterns)
-                self.progress.info(f"    📁 Copied {child.name}")
+                # Precompressed siblings only exist in the artifact; keep them for reuse
+                stager.sync_tree(child, output_dir / child.name, ignore=ignore_patterns,
+                                 keep=is_sibling if precompress else None)
+                self.progress.info(f"    📁 Staged {child.name}")
 
-        # Calculate artifact info
-        total_size = sum(f.stat().st_size for f in output_dir.rglob("*") if f.is_file())
-        total_files = len(list(output_dir.rglob("*")))
+        staging = stager.result
+        stats.merge(staging.stats)
+        self.progress.info(f"  🔗 Staged {staging.summary()}")
+
+        if share_engines:
+            self.share_engine_files(output_dir, stats)
+
+        if precompress:
+            self.precompress_files(output_dir, stats)
+        else:
+            removed = remove_precompressed(output_dir)
+            if removed:
+                self.progress.info(f"  🗑️  Removed {removed} precompressed files from an earlier run")
+        self.artifact_stats[output_dir.resolve()] = stats
 
         # Verify artifact contents (check all copied project dirs)
         total_projects = 0
@@ -228,11 +279,41 @@ class ArtifactManager:
         self.progress.info(f"  📄 Documentation files: {len(copied_files)}")
         self.progress.info(f"  🎮 Projects: {total_projects}")
         self.progress.info(f"  🌐 Web exports: {total_exports}")
-        self.progress.info(f"  📁 Total files: {total_files}")
-        self.progress.info(f"  💾 Total size: {self._format_size(total_size)}")
+        self.progress.info(f"  📁 Total files: {stats.file_count}")
+        self.progress.info(f"  💾 Total size: {self._format_size(stats.total_size)}")
+        for ext, info in list(stats.to_dict()["by_extension"].items())[:5]:
+            self.progress.info(f"     {ext}: {info['files']} files, {self._format_size(info['size'])}")
 
         return output_dir
     
+    def ship_deploy_manifest(self, artifact_dir: Path, manifest_file: Path):
+        """Ship the deploy manifest so the next build can diff against the live site"""
+        shutil.copy2(manifest_file, artifact_dir / ARTIFACT_MANIFEST_NAME)
+        self.progress.info(f"  📄 Copied deploy manifest")
+    
+    def share_engine_files(self, artifact_dir: Path, stats: Optional[TreeStats] = None) -> EngineDedupeResult:
+        """Move engine files shared by several web exports into artifact_dir/engine/<hash>/"""
+        roots = [child for child in artifact_dir.iterdir()
+                 if child.is_dir() and (child.name.endswith('-projects') or child.name.endswith('-extended'))]
+        result = dedupe_engines(artifact_dir, roots, stats)
+        if result.engines:
+            self.progress.info(f"  ♻️  {result.exports} exports share {result.engines} engine(s), "
+                               f"saving {self._format_size(result.bytes_saved)}")
+        if result.removed_engines:
+            self.progress.info(f"  🗑️  Removed {result.removed_engines} unused engine(s)")
+        return result
+    
+    def precompress_files(self, artifact_dir: Path, stats: Optional[TreeStats] = None) -> CompressionResult:
+        """Write .gz/.br siblings for compressible files in the artifact"""
+        result = Precompressor(progress_reporter=self.progress).run(artifact_dir, stats)
+        self.compression_results[artifact_dir.resolve()] = result
+        self.progress.info(f"  🗜️  Precompressed {result.compressed} files, {result.skipped} already current")
+        for name, info in result.to_dict().items():
+            if isinstance(info, dict):
+                self.progress.info(f"     {name}: {self._format_size(result.original_size)} → "
+                                   f"{self._format_size(info['size'])} ({info['ratio']:.0%})")
+        return result
+    
     def create_deployment_summary(self, artifact_dir: Path) -> Dict[str, Any]:
         """Create a summary of deployment artifact"""
         
@@ -244,12 +325,16 @@ class ArtifactManager:
         else:
             projects_dir = projects_dirs[0]
         
+        # Reuse the statistics recorded while preparing this artifact, else scan it once
+        stats = self.artifact_stats.get(artifact_dir.resolve()) or scan_tree(artifact_dir)
         summary = {
             "artifact_path": str(artifact_dir),
             "created_at": str(artifact_dir.stat().st_mtime),
-            "total_size": sum(f.stat().st_size for f in artifact_dir.rglob("*") if f.is_file()),
-            "total_files": len(list(artifact_dir.rglob("*"))),
+            **stats.to_dict(),
         }
+        compression = self.compression_results.get(artifact_dir.resolve())
+        if compression is not None:
+            summary["compression"] = compression.to_dict()
         
         # Add build verification if projects exist
         if projects_dir.exists():
@@ -266,90 +351,39 @@ class ArtifactManager:
         return summary
     
     def validate_for_deployment(self, artifact_dir: Path, config=None) -> List[str]:
-        """Validate artifact is ready for deployment"""
+        """Validate artifact is ready for deployment
+
+        The artifact is walked once (see artifact_validator); the full report
+        is kept in self.last_validation for writing as JSON.
+        """
         
         self.progress.info("🔍 Validating artifact for deployment...")
         
-        issues = []
-        warnings = []
+        max_failure_rate = (config and hasattr(config, 'deployment') and
+                            getattr(config.deployment, 'max_failure_rate', 10.0)) or 10.0
+        report = validate_artifact(artifact_dir, max_failure_rate)
+        self.last_validation = report
         
-        # Check for required documentation files
-        required_docs = ["index.html", "_sidebar.md"]
-        for doc in required_docs:
-            if not (artifact_dir / doc).exists():
-                issues.append(f"Missing required documentation file: {doc}")
-        
-        # Check for projects directory
-        projects_dirs = [d for d in artifact_dir.iterdir() if d.is_dir() and 'project' in d.name.lower()]
-        if not projects_dirs:
-            issues.append("No projects directory found in artifact")
-        else:
-            projects_dir = projects_dirs[0]
-            
-            # Count total projects and exports
-            total_projects = len(list(projects_dir.rglob("project.godot")))
-            export_indices = list(projects_dir.rglob("*/exports/*/index.html"))
-            export_count = len(export_indices)
-            
-            if export_count == 0:
-                issues.append("No web exports found in projects")
-            else:
-                # Check individual exports and collect warnings (not critical issues)
-                incomplete_exports = []
-                for export_index in export_indices:
-                    export_dir = export_index.parent
-                    project_rel_path = export_dir.relative_to(projects_dir).parent.parent
-                    
-                    missing_files = []
-                    if not any(export_dir.glob("*.wasm")):
-                        missing_files.append("WASM")
-                    if not any(export_dir.glob("*.pck")):
-                        missing_files.append("PCK")
-                    
-                    if missing_files:
-                        incomplete_exports.append(f"{project_rel_path} (missing: {', '.join(missing_files)})")
-                
-                # Report incomplete exports as warnings if within acceptable limits
-                if incomplete_exports:
-                    failure_rate = (len(incomplete_exports) / total_projects) * 100
-                    max_failure_rate = (config and hasattr(config, 'deployment') and 
-                                      getattr(config.deployment, 'max_failure_rate', 10.0)) or 10.0
-                    
-                    if failure_rate <= max_failure_rate:
-                        self.progress.warning(f"⚠️  {len(incomplete_exports)} incomplete exports ({failure_rate:.1f}% failure rate, within {max_failure_rate:.1f}% limit)")
-                        for export in incomplete_exports[:5]:  # Show first 5
-                            warnings.append(f"Incomplete export: {export}")
-                        if len(incomplete_exports) > 5:
-                            warnings.append(f"... and {len(incomplete_exports) - 5} more incomplete exports")
-                    else:
-                        self.progress.error(f"❌ Too many incomplete exports: {failure_rate:.1f}% exceeds {max_failure_rate:.1f}% limit")
-                        issues.extend([f"Incomplete export: {export}" for export in incomplete_exports])
-        
-        # Check for Godot binaries and templates that shouldn't be included
-        exclude_patterns = ["godot", "*.tpz", "export_templates", ".godot"]
-        excluded_items = []
-        for pattern in exclude_patterns:
-            found_items = list(artifact_dir.rglob(pattern))
-            if found_items:
-                excluded_items.extend(found_items)
-        
-        if excluded_items:
-            warnings.append(f"Found {len(excluded_items)} items that should be excluded (Godot binaries/templates)")
+        incomplete = len(report.incomplete_exports)
+        if incomplete and report.failure_rate <= max_failure_rate:
+            self.progress.warning(f"⚠️  {incomplete} incomplete exports ({report.failure_rate:.1f}% failure rate, within {max_failure_rate:.1f}% limit)")
+        elif incomplete:
+            self.progress.error(f"❌ Too many incomplete exports: {report.failure_rate:.1f}% exceeds {max_failure_rate:.1f}% limit")
         
         # Report validation results
-        if warnings:
-            self.progress.warning(f"⚠️  Validation completed with {len(warnings)} warnings:")
-            for warning in warnings:
+        if report.warnings:
+            self.progress.warning(f"⚠️  Validation completed with {len(report.warnings)} warnings:")
+            for warning in report.warnings:
                 self.progress.warning(f"  - {warning}")
         
-        if issues:
-            self.progress.error(f"❌ Validation failed with {len(issues)} critical issues:")
-            for issue in issues:
+        if report.issues:
+            self.progress.error(f"❌ Validation failed with {len(report.issues)} critical issues:")
+            for issue in report.issues:
                 self.progress.error(f"  - {issue}")
         else:
             self.progress.success("✅ Artifact validation passed")
         
-        return issues
+        return report.issues
     
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format"""
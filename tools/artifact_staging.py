@@ -0,0 +1,189 @@
+"""
+Artifact Staging
+================
+
+Stages project directories into the artifact directory without duplicating
+file data. Files are hardlinked when source and staging directory share a
+filesystem, cloned with a reflink (FICLONE) where the filesystem supports it,
+and copied otherwise. Staging is incremental: files already staged by a
+previous run (same inode, or same size and mtime) are left alone and files
+that left the source are removed.
+
+Hardlinked files share their data with the source tree, so anything that
+edits staged files must replace them (write a temp file and rename) rather
+than modify them in place.
+"""
+
+import os
+import shutil
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Set, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    from .progress_reporter import ProgressReporter
+    from .tree_stats import TreeStats
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    from tree_stats import TreeStats
+
+
+STAGING_MODES = ("auto", "hardlink", "reflink", "copy")
+
+# ioctl request cloning a whole file on Linux (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+PathLike = Union[str, os.PathLike]
+
+
+@dataclass
+class StagingResult:
+    """What a staging run did"""
+    linked: int = 0
+    cloned: int = 0
+    copied: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    bytes_copied: int = 0
+    stats: TreeStats = field(default_factory=TreeStats)  # every staged file
+
+    def summary(self) -> str:
+        return (f"{self.stats.file_count} files: {self.linked} linked, {self.cloned} cloned, "
+                f"{self.copied} copied ({self.bytes_copied:,} bytes), {self.unchanged} unchanged, "
+                f"{self.removed} removed")
+
+
+def reflink(src: PathLike, dst: PathLike):
+    """Clone src into a new file dst sharing its data blocks"""
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+
+
+class ArtifactStager:
+    """Incrementally mirrors directories into a staging area by link, reflink or copy"""
+
+    def __init__(self, mode: str = "auto", progress_reporter: Optional[ProgressReporter] = None):
+        """
+        Create a stager
+
+        Args:
+            mode: "auto" tries hardlink, then reflink, then copy; "hardlink" and
+                "reflink" try only that method before copying; "copy" always copies
+            progress_reporter: Progress reporter
+        """
+        if mode not in STAGING_MODES:
+            raise ValueError(f"Unknown staging mode '{mode}', expected one of {', '.join(STAGING_MODES)}")
+        self.mode = mode
+        self.progress = progress_reporter or ProgressReporter()
+        self.result = StagingResult()
+        # (source device, staging device) pairs a method already failed for
+        self._no_link: Set[Tuple[int, int]] = set()
+        self._no_reflink: Set[Tuple[int, int]] = set()
+
+    def sync_tree(self, src: PathLike, dst: PathLike, ignore: Optional[Callable] = None,
+                  keep: Optional[Callable[[str], bool]] = None) -> StagingResult:
+        """
+        Mirror src into dst, touching only what changed
+
+        Args:
+            src: Source directory
+            dst: Staging directory for it (created if missing)
+            ignore: Same as shutil.copytree's ignore(dir, names)
+            keep: Called with the name of each file only present in dst; True
+                keeps it (files generated in the staging area)
+
+        Returns:
+            Accumulated result of every sync_tree call on this stager
+        """
+        self._sync_dir(os.fspath(src), os.fspath(dst), ignore, keep)
+        return self.result
+
+    def _sync_dir(self, src_dir: str, dst_dir: str, ignore: Optional[Callable],
+                  keep: Optional[Callable[[str], bool]]):
+        with os.scandir(src_dir) as entries:
+            entries = list(entries)
+        ignored = set(ignore(src_dir, [entry.name for entry in entries])) if ignore else set()
+
+        if os.path.lexists(dst_dir) and not os.path.isdir(dst_dir):
+            os.unlink(dst_dir)
+        os.makedirs(dst_dir, exist_ok=True)
+        dst_dev = os.stat(dst_dir).st_dev
+        with os.scandir(dst_dir) as existing_entries:
+            existing: Dict[str, os.DirEntry] = {entry.name: entry for entry in existing_entries}
+
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            dst_path = os.path.join(dst_dir, entry.name)
+            old = existing.pop(entry.name, None)
+
+            # Symlinks are followed, as shutil.copytree does by default
+            if entry.is_dir():
+                if old is not None and not old.is_dir(follow_symlinks=False):
+                    os.unlink(old.path)
+                self._sync_dir(entry.path, dst_path, ignore, keep)
+                continue
+
+            src_stat = entry.stat()
+            if old is not None:
+                if old.is_dir(follow_symlinks=False):
+                    shutil.rmtree(old.path)
+                else:
+                    old_stat = old.stat(follow_symlinks=False)
+                    if os.path.samestat(src_stat, old_stat) or (
+                            old_stat.st_size == src_stat.st_size and old_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                        self.result.unchanged += 1
+                        self.result.stats.add(entry.name, src_stat.st_size)
+                        continue
+                    os.unlink(old.path)
+
+            self._place(entry.path, dst_path, src_stat, dst_dev)
+            self.result.stats.add(entry.name, src_stat.st_size)
+
+        # Whatever is left was removed from the source (or is now ignored)
+        for old in existing.values():
+            if old.is_dir(follow_symlinks=False):
+                shutil.rmtree(old.path)
+            elif keep is not None and keep(old.name):
+                continue
+            else:
+                os.unlink(old.path)
+            self.result.removed += 1
+
+    def _place(self, src: str, dst: str, src_stat: os.stat_result, dst_dev: int):
+        devices = (src_stat.st_dev, dst_dev)
+
+        if self.mode in ("auto", "hardlink") and devices not in self._no_link and src_stat.st_dev == dst_dev:
+            try:
+                os.link(src, dst)
+                self.result.linked += 1
+                return
+            except OSError as e:
+                # e.g. filesystems without hardlinks or a link count limit
+                self._no_link.add(devices)
+                self.progress.warning(f"⚠️  Hardlinking into staging failed ({e.strerror}), falling back")
+
+        if self.mode in ("auto", "reflink") and fcntl is not None and devices not in self._no_reflink:
+            try:
+                reflink(src, dst)
+                shutil.copystat(src, dst)
+                self.result.cloned += 1
+                return
+            except OSError:
+                self._no_reflink.add(devices)
+                if os.path.lexists(dst):
+                    os.unlink(dst)
+
+        shutil.copy2(src, dst)
+        self.result.copied += 1
+        self.result.bytes_copied += src_stat.st_size
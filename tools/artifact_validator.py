@@ -0,0 +1,242 @@
+"""
+Artifact Validator
+==================
+
+Checks a deployment artifact (or a projects tree) with one os.scandir walk.
+Projects, web export completeness, excluded items (Godot binaries,
+templates, editor data) and documentation files are all collected in the
+same pass, so adding a check does not add a walk. The report serializes to
+JSON for CI.
+"""
+
+import os
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from .engine_dedupe import shared_engine_dir
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from engine_dedupe import shared_engine_dir
+
+
+REQUIRED_DOCS = ["index.html", "_sidebar.md"]
+DOC_FILES = ["index.html", "_sidebar.md", "README.md", "docsify-embed-godot.js"]
+
+# Items that must not ship: matched by exact name or suffix, never descended into
+EXCLUDED_NAMES = {"godot", "export_templates", ".godot"}
+EXCLUDED_SUFFIXES = (".tpz",)
+
+DEFAULT_MAX_FAILURE_RATE = 10.0
+
+# Incomplete exports listed individually in warnings before summarizing the rest
+MAX_LISTED_WARNINGS = 5
+
+
+@dataclass
+class ExportCheck:
+    """Completeness of one web export (a dir exports/<platform>/ with an index.html)"""
+    path: str  # index.html, relative to the scanned root
+    project: str  # project dir, relative to the scanned root
+    has_wasm: bool
+    has_pck: bool
+    has_js: bool
+    shared_engine: Optional[str] = None  # engine dir the export loads, if deduplicated
+
+    @property
+    def missing(self) -> List[str]:
+        return [name for name, present in (("WASM", self.has_wasm), ("PCK", self.has_pck)) if not present]
+
+    @property
+    def complete(self) -> bool:
+        return self.has_wasm and self.has_pck and self.has_js
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"path": self.path, "dir": os.path.dirname(self.path), "project": self.project,
+                "has_wasm": self.has_wasm, "has_pck": self.has_pck, "has_js": self.has_js,
+                "shared_engine": self.shared_engine, "complete": self.complete}
+
+
+@dataclass
+class ArtifactScan:
+    """Everything one walk of a tree found"""
+    root: Path
+    projects: List[str] = field(default_factory=list)  # project dirs with a project.godot
+    export_dirs: int = 0  # directories named "exports"
+    exports: List[ExportCheck] = field(default_factory=list)
+    excluded: List[str] = field(default_factory=list)
+    docs: List[str] = field(default_factory=list)  # DOC_FILES present at the root
+    projects_dirs: List[str] = field(default_factory=list)  # top-level dirs holding projects
+
+
+def scan_artifact(root: Path, is_projects_dir: Optional[Callable[[str], bool]] = None) -> ArtifactScan:
+    """
+    Walk root once and collect what validation and verification need
+
+    Args:
+        root: Artifact or projects directory
+        is_projects_dir: Called with each top-level directory name; projects and
+            exports are only counted inside directories it accepts. None treats
+            root itself as the projects directory.
+
+    Returns:
+        ArtifactScan with relative posix paths, sorted
+    """
+    root = Path(root)
+    scan = ArtifactScan(root)
+    # (relative dir, whether it lies inside a projects dir)
+    stack = [("", is_projects_dir is None)]
+
+    while stack:
+        rel_dir, in_projects = stack.pop()
+        abs_dir = os.path.join(root, rel_dir) if rel_dir else os.fspath(root)
+        try:
+            with os.scandir(abs_dir) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+
+        files = set()
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if entry.name in EXCLUDED_NAMES or entry.name.endswith(EXCLUDED_SUFFIXES):
+                scan.excluded.append(rel_path)
+                continue
+            if is_dir:
+                inside = in_projects
+                if not rel_dir and is_projects_dir is not None and is_projects_dir(entry.name):
+                    scan.projects_dirs.append(entry.name)
+                    inside = True
+                if inside and entry.name == "exports":
+                    scan.export_dirs += 1
+                stack.append((rel_path, inside))
+            else:
+                files.add(entry.name)
+
+        if not rel_dir:
+            scan.docs = [doc for doc in DOC_FILES if doc in files]
+        if not in_projects:
+            continue
+
+        if "project.godot" in files:
+            scan.projects.append(rel_dir)
+
+        # exports/<platform>/index.html below some project
+        parent, _, _ = rel_dir.rpartition("/")
+        if "index.html" in files and parent.rpartition("/")[2] == "exports" and "/" in parent:
+            suffixes = {os.path.splitext(name)[1] for name in files}
+            export = ExportCheck(
+                path=f"{rel_dir}/index.html",
+                project=parent.rpartition("/")[0],
+                has_wasm=".wasm" in suffixes,
+                has_pck=".pck" in suffixes,
+                has_js=".js" in suffixes,
+            )
+            if not (export.has_wasm and export.has_js):
+                engine_dir = shared_engine_dir(Path(abs_dir) / "index.html")
+                if engine_dir is not None:
+                    export.shared_engine = Path(os.path.relpath(engine_dir, root)).as_posix()
+                    export.has_wasm = export.has_js = True
+            scan.exports.append(export)
+
+    scan.projects.sort()
+    scan.exports.sort(key=lambda export: export.path)
+    scan.excluded.sort()
+    scan.projects_dirs.sort()
+    return scan
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of validating an artifact for deployment"""
+    scan: ArtifactScan
+    max_failure_rate: float
+    issues: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+    @property
+    def incomplete_exports(self) -> List[ExportCheck]:
+        return [export for export in self.scan.exports if export.missing]
+
+    @property
+    def failure_rate(self) -> float:
+        projects = len(self.scan.projects)
+        return len(self.incomplete_exports) / projects * 100 if projects else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form for CI"""
+        return {
+            "artifact": str(self.scan.root),
+            "valid": self.valid,
+            "issues": self.issues,
+            "warnings": self.warnings,
+            "projects_dirs": self.scan.projects_dirs,
+            "total_projects": len(self.scan.projects),
+            "total_exports": len(self.scan.exports),
+            "complete_exports": sum(1 for export in self.scan.exports if export.complete),
+            "incomplete_exports": [{"project": export.project, "missing": export.missing}
+                                   for export in self.incomplete_exports],
+            "failure_rate": round(self.failure_rate, 2),
+            "max_failure_rate": self.max_failure_rate,
+            "shared_engine_exports": sum(1 for export in self.scan.exports if export.shared_engine),
+            "excluded_items": self.scan.excluded,
+            "documentation_files": self.scan.docs,
+        }
+
+    def write_json(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def validate_artifact(artifact_dir: Path, max_failure_rate: float = DEFAULT_MAX_FAILURE_RATE) -> ValidationReport:
+    """
+    Validate an artifact for deployment with a single walk
+
+    Args:
+        artifact_dir: Prepared artifact
+        max_failure_rate: Percentage of projects with incomplete exports
+            tolerated as warnings instead of issues
+
+    Returns:
+        ValidationReport
+    """
+    scan = scan_artifact(artifact_dir, lambda name: 'project' in name.lower())
+    report = ValidationReport(scan, max_failure_rate)
+
+    for doc in REQUIRED_DOCS:
+        if doc not in scan.docs:
+            report.issues.append(f"Missing required documentation file: {doc}")
+
+    if not scan.projects_dirs:
+        report.issues.append("No projects directory found in artifact")
+    elif not scan.exports:
+        report.issues.append("No web exports found in projects")
+    else:
+        incomplete = [f"{export.project} (missing: {', '.join(export.missing)})"
+                      for export in report.incomplete_exports]
+        if incomplete and report.failure_rate <= max_failure_rate:
+            report.warnings.extend(f"Incomplete export: {export}" for export in incomplete[:MAX_LISTED_WARNINGS])
+            if len(incomplete) > MAX_LISTED_WARNINGS:
+                report.warnings.append(f"... and {len(incomplete) - MAX_LISTED_WARNINGS} more incomplete exports")
+        elif incomplete:
+            report.issues.extend(f"Incomplete export: {export}" for export in incomplete)
+
+    if scan.excluded:
+        report.warnings.append(f"Found {len(scan.excluded)} items that should be excluded (Godot binaries/templates)")
+
+    return report
@@ -8,21 +8,54 @@ This module provides smart analysis of what needs to be rebuilt.
 
 import os
 import subprocess
-import hashlib
 import json
+import re
+import struct
+import threading
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Iterable, Iterator
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 try:
     from .progress_reporter import ProgressReporter
+    from .project_graph import ProjectGraph
+    from . import file_hasher
 except ImportError:
     # Fallback for CLI execution
     import sys
     import os
     sys.path.append(os.path.dirname(__file__))
     from progress_reporter import ProgressReporter
+    from project_graph import ProjectGraph
+    import file_hasher
+
+
+# Build-system and docs files tracked outside the projects dir; every file
+# inside it is tracked, since any of them may be an export input
+TRACKED_SUFFIXES = {".py", ".sh", ".json", ".yml", ".yaml", ".md", ".html", ".js"}
+TRACKED_NAMES = {"project.godot", "export_presets.cfg", "SConstruct"}
+
+# Directories never descended into. Outside the projects dir, directories
+# named *cache hold build state as well; inside it, only dot-prefixed ones do
+PRUNED_DIRS = {".git", ".godot", ".import", "exports", "__pycache__"}
+
+# Binary stat index: header (with the hash algorithm), then one record per
+# file of <path length><path><inode><mtime_ns><size><content hash>
+INDEX_MAGIC = b"GCDX"
+INDEX_VERSION = 2
+INDEX_HEADER = struct.Struct("<4sH16sI")
+INDEX_RECORD = struct.Struct("<QqQ16s")
+INDEX_PATH_LEN = struct.Struct("<H")
+
+
+# Bounds on how much of a large diff is kept in memory and logged
+MAX_RECORDED_FILES = 1000
+MAX_LOGGED_FILES = 20
+
+GIT_HASH_PATTERN = re.compile(r'^[0-9a-f]{40,64}$')
+GIT_STATUS_NAMES = {"A": "added", "C": "copied", "D": "deleted", "M": "modified",
+                    "R": "renamed", "T": "type changed", "U": "unmerged"}
 
 
 @dataclass
@@ -34,13 +67,45 @@ class ChangeInfo:
     docs_changed: bool
     force_rebuild: bool
     reason: str
+    # Projects (relative to the projects dir) whose project.godot was removed
+    deleted_projects: Set[str] = field(default_factory=set)
+    # changed_files holds at most MAX_RECORDED_FILES entries
+    total_changed_files: int = 0
 
 
 class ChangeDetector:
     """Detects changes that require rebuilding"""
     
-    def __init__(self, progress_reporter: Optional[ProgressReporter] = None):
+    def __init__(self, progress_reporter: Optional[ProgressReporter] = None,
+                 projects_dir: Optional[Path] = None,
+                 project_index=None,
+                 graph_cache: Optional[Path] = None,
+                 deploy_manifest=None):
+        """
+        Create a change detector
+        
+        Args:
+            progress_reporter: Progress reporter
+            projects_dir: Directory containing the Godot projects (default: repo_dir)
+            project_index: Shared ProjectIndex of projects_dir
+            graph_cache: Persisted reference cache for the project dependency graph
+            deploy_manifest: DeployManifest of the last successful deploy, used
+                instead of git history in CI
+        """
         self.progress = progress_reporter or ProgressReporter()
+        self.projects_dir = projects_dir
+        self.project_index = project_index
+        self.graph_cache = graph_cache
+        self.deploy_manifest = deploy_manifest
+        self._graph: Optional[ProjectGraph] = None
+    
+    def project_graph(self, repo_dir: Path) -> ProjectGraph:
+        """Dependency graph of the projects, built on first use"""
+        if self._graph is None:
+            self._graph = ProjectGraph.build(
+                self.projects_dir or repo_dir, self.project_index, self.graph_cache, self.progress
+            )
+        return self._graph
         
     def detect_git_changes(self, 
                           repo_dir: Path, 
@@ -61,13 +126,22 @@ class ChangeDetector:
                 reason="Force rebuild requested"
             )
         
-        # Check for CI environment - force rebuild in CI to ensure fresh builds
-        # This is critical for CI/CD pipelines that use shallow clones (fetch-depth: 1)
-        # where change detection may fail due to limited git history
+        # Check for CI environment. CI pipelines use shallow clones (fetch-depth: 1)
+        # where git history is unreliable, so diff against the manifest of the
+        # last successful deploy and only force a full rebuild without one
         ci_indicators = ['CI', 'GITHUB_ACTIONS', 'GITLAB_CI', 'TRAVIS', 'CIRCLECI', 'JENKINS_URL']
         is_ci = any(os.environ.get(var) for var in ci_indicators)
         
         if is_ci:
+            stored = None
+            if self.deploy_manifest is not None:
+                # Hash the projects before exports touch them; the pending manifest records these
+                stored = self.deploy_manifest.load()
+                self.deploy_manifest.project_hashes()
+            if stored:
+                self.progress.info("🤖 CI environment detected - diffing against the last deploy manifest")
+                return self.detect_manifest_changes(stored)
+            
             self.progress.info("🤖 CI environment detected - forcing full rebuild for reliable deployment")
             return ChangeInfo(
                 changed_files=[],
@@ -79,89 +153,56 @@ class ChangeDetector:
             )
         
         try:
-            # First, check if the base_ref exists
-            ref_check = subprocess.run(
-                ["git", "rev-parse", "--verify", base_ref],
+            # One round trip resolves the work tree root, HEAD and the base commit.
+            # On an unknown base_ref git still prints the lines it could resolve.
+            rev_parse = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel", "HEAD", f"{base_ref}^{{commit}}"],
                 cwd=repo_dir,
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            
-            if ref_check.returncode != 0:
-                self.progress.warning(f"⚠️  Reference '{base_ref}' not found, using fallback strategy")
-                # Try to use the first commit or current state
-                try:
-                    # Get first commit hash
-                    first_commit = subprocess.run(
-                        ["git", "rev-list", "--max-parents=0", "HEAD"],
-                        cwd=repo_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    if first_commit.returncode == 0 and first_commit.stdout.strip():
-                        base_ref = first_commit.stdout.strip()
-                        self.progress.info(f"🔄 Using first commit as base: {base_ref[:8]}")
-                    else:
-                        # No commits or git history, force full rebuild
-                        self.progress.info("🔄 No git history found, forcing full rebuild")
-                        return ChangeInfo(
-                            changed_files=[],
-                            changed_projects=set(),
-                            build_system_changed=True,
-                            docs_changed=True,
-                            force_rebuild=True,
-                            reason="No git history - first build"
-                        )
-                except:
-                    # Git operations failed, fall back to full rebuild
-                    return ChangeInfo(
-                        changed_files=[],
-                        changed_projects=set(),
-                        build_system_changed=True,
-                        docs_changed=True,
-                        force_rebuild=True,
-                        reason="Git operations failed - assuming all changed"
-                    )
-            
-            # Get changed files since base_ref
-            result = subprocess.run(
-                ["git", "diff", "--name-only", base_ref, "HEAD"],
-                cwd=repo_dir,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                self.progress.warning(f"⚠️  Git diff failed: {result.stderr}")
-                # Fall back to full rebuild
+            revs = rev_parse.stdout.split()
+            if len(revs) < 2 or not GIT_HASH_PATTERN.match(revs[1]):
+                # No commits or git history, force full rebuild
+                self.progress.info("🔄 No git history found, forcing full rebuild")
                 return ChangeInfo(
                     changed_files=[],
                     changed_projects=set(),
                     build_system_changed=True,
                     docs_changed=True,
                     force_rebuild=True,
-                    reason="Git diff failed - assuming all changed"
+                    reason="No git history - first build"
                 )
+            work_tree, head = Path(revs[0]), revs[1]
             
-            changed_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            # Special case: If we're comparing the same commit (shallow clone scenario)
-            # and no changes detected, but we used a fallback strategy, force rebuild
-            # This handles edge cases where CI detection might be missed but we're still
-            # in a shallow clone situation that needs a full build
-            if not changed_files and base_ref != "HEAD~1":
-                # Check if base_ref equals HEAD (indicating shallow clone)
-                head_check = subprocess.run(
-                    ["git", "rev-parse", "HEAD"],
+            if rev_parse.returncode == 0 and len(revs) > 2:
+                base = revs[2]
+            else:
+                self.progress.warning(f"⚠️  Reference '{base_ref}' not found, using fallback strategy")
+                # Try to use the first commit or current state
+                first_commit = subprocess.run(
+                    ["git", "rev-list", "--max-parents=0", "HEAD"],
                     cwd=repo_dir,
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
-                if head_check.returncode == 0 and head_check.stdout.strip() == base_ref:
+                roots = first_commit.stdout.split()
+                if first_commit.returncode != 0 or not roots:
+                    return ChangeInfo(
+                        changed_files=[],
+                        changed_projects=set(),
+                        build_system_changed=True,
+                        docs_changed=True,
+                        force_rebuild=True,
+                        reason="Git operations failed - assuming all changed"
+                    )
+                base = roots[-1]
+                self.progress.info(f"🔄 Using first commit as base: {base[:8]}")
+                
+                # Comparing HEAD with itself means a shallow clone with no history
+                if base == head:
                     self.progress.info("🔄 Shallow clone detected - forcing full rebuild")
                     return ChangeInfo(
                         changed_files=[],
@@ -172,8 +213,31 @@ class ChangeDetector:
                         reason="Shallow clone detected - first build"
                     )
             
-            # Analyze changes
-            return self._analyze_changes(changed_files, repo_dir)
+            # Projects deleted or moved away are resolved before the main stream,
+            # because git lists their files ahead of their project.godot
+            deleted_projects = set()
+            for status, path, old_path in self._stream_git_diff(
+                    repo_dir, base, head, ["--diff-filter=DR", "--", ":(top,glob)**/project.godot"]):
+                gone = old_path if status.startswith("R") else path
+                if status.startswith("D") or os.path.dirname(gone) != os.path.dirname(path):
+                    deleted_projects.add(os.path.dirname(gone))
+            
+            # Stream the full diff straight into the resolver
+            status_counts: Dict[str, int] = {}
+            
+            def changed_paths():
+                for status, path, old_path in self._stream_git_diff(repo_dir, base, head):
+                    status_counts[status[0]] = status_counts.get(status[0], 0) + 1
+                    if old_path:
+                        yield old_path
+                    yield path
+            
+            changes = self._analyze_changes(changed_paths(), work_tree, deleted_projects)
+            if status_counts:
+                self.progress.info("  🔀 " + ", ".join(
+                    f"{GIT_STATUS_NAMES.get(status, status)}: {count}"
+                    for status, count in sorted(status_counts.items())))
+            return changes
             
         except subprocess.TimeoutExpired:
             self.progress.error("❌ Git diff timeout")
@@ -196,19 +260,144 @@ class ChangeDetector:
                 reason=f"Git error: {e}"
             )
     
+    def detect_manifest_changes(self, stored: Optional[dict] = None) -> ChangeInfo:
+        """Detect changes by comparing project content hashes with the last deploy manifest"""
+        
+        if stored is None and self.deploy_manifest is not None:
+            stored = self.deploy_manifest.load()
+        if not stored:
+            self.progress.info("🔄 No deploy manifest found, forcing full rebuild")
+            return ChangeInfo(
+                changed_files=[],
+                changed_projects=set(),
+                build_system_changed=True,
+                docs_changed=True,
+                force_rebuild=True,
+                reason="No deploy manifest - first build"
+            )
+        
+        deployed = (stored.get('commit') or 'unknown')[:8]
+        self.progress.info(f"  📜 Last deploy: {deployed} ({len(stored.get('projects', {}))} projects)")
+        
+        if stored.get('build_system') != self.deploy_manifest.build_system_hash():
+            reason = f"Build system changed since last deploy ({deployed})"
+            self.progress.info(f"  🔧 {reason}")
+            return ChangeInfo(
+                changed_files=[],
+                changed_projects=set(),
+                build_system_changed=True,
+                docs_changed=True,
+                force_rebuild=False,
+                reason=reason
+            )
+        
+        diff = self.deploy_manifest.diff(stored)
+        changed_projects, deleted_projects = diff['changed'], diff['deleted']
+        
+        if changed_projects:
+            reason = f"Project changes since last deploy ({deployed}): {', '.join(sorted(changed_projects)[:3])}"
+            if len(changed_projects) > 3:
+                reason += f" and {len(changed_projects) - 3} more"
+        elif deleted_projects:
+            reason = f"Projects removed since last deploy ({deployed})"
+        else:
+            reason = f"No project changes since last deploy ({deployed})"
+        
+        self.progress.info(f"📊 Change analysis:")
+        self.progress.info(f"  🎮 Affected projects: {len(changed_projects)}")
+        if deleted_projects:
+            self.progress.info(f"  🗑️  Removed projects: {len(deleted_projects)}")
+        self.progress.info(f"  🎯 Reason: {reason}")
+        
+        # Documentation is cheap to regenerate and not tracked by the manifest
+        return ChangeInfo(
+            changed_files=[],
+            changed_projects=changed_projects,
+            build_system_changed=False,
+            docs_changed=True,
+            force_rebuild=False,
+            reason=reason,
+            deleted_projects=deleted_projects
+        )
+    
+    def _stream_git_diff(self, repo_dir: Path, base: str, head: str,
+                         extra_args: Optional[List[str]] = None) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """
+        Yield (status, path, old_path) from `git diff -z --name-status -M`
+        
+        Output is read through a pipe in fixed-size chunks, so memory use does
+        not grow with the number of changed files. old_path is only set for
+        renames and copies.
+        """
+        
+        cmd = ["git", "diff", "-z", "--name-status", "-M", base, head] + (extra_args or [])
+        process = subprocess.Popen(cmd, cwd=repo_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        
+        # stderr is only read at exit; keep it from filling its pipe meanwhile
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+        stderr_reader.start()
+        
+        try:
+            fields = self._iter_nul_fields(process.stdout)
+            for status in fields:
+                status = status.decode('ascii', errors='replace')
+                if status[:1] in ("R", "C"):
+                    old_path = next(fields).decode('utf-8', errors='surrogateescape')
+                    path = next(fields).decode('utf-8', errors='surrogateescape')
+                    yield status, path, old_path
+                else:
+                    yield status, next(fields).decode('utf-8', errors='surrogateescape'), None
+        finally:
+            if process.poll() is None:
+                # Stopped early by the consumer
+                process.kill()
+            process.stdout.close()
+            returncode = process.wait(timeout=30)
+            stderr_reader.join(timeout=5)
+        
+        if returncode != 0:
+            stderr = b"".join(chunk for chunk in stderr_chunks if chunk).decode('utf-8', errors='replace')
+            raise RuntimeError(f"Git diff failed: {stderr.strip()}")
+    
+    @staticmethod
+    def _iter_nul_fields(stream, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Split a byte stream on NUL without reading it all into memory"""
+        
+        pending = b""
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            pending += chunk
+            *fields, pending = pending.split(b"\0")
+            yield from fields
+        if pending:
+            yield pending
+    
     def detect_filesystem_changes(self, 
                                  repo_dir: Path,
-                                 cache_file: Optional[Path] = None) -> ChangeInfo:
-        """Detect changes using filesystem timestamps and hashes"""
+                                 cache_file: Optional[Path] = None,
+                                 incremental: bool = True) -> ChangeInfo:
+        """
+        Detect changes using filesystem timestamps and hashes
+        
+        In incremental mode a binary stat index is kept and only files whose
+        (inode, mtime, size) changed are re-hashed, so an unchanged tree costs
+        one directory walk and no file reads.
+        """
         
         self.progress.info("🔍 Detecting changes using filesystem...")
         
+        if incremental:
+            if cache_file is None:
+                cache_file = repo_dir / "build_system" / "cache" / "change_index.bin"
+            changed_files = self._scan_incremental(repo_dir, cache_file)
+            return self._analyze_changes(changed_files, repo_dir)
+        
         if cache_file is None:
             cache_file = repo_dir / "build_system" / "cache" / "change_cache.json"
         
         # Load previous state
         previous_state = self._load_cache(cache_file)
-        current_state = self._scan_filesystem(repo_dir)
+        current_state = self._scan_filesystem(repo_dir, cache_file)
         
         # Compare states
         changed_files = []
@@ -229,23 +418,27 @@ class ChangeDetector:
         # Analyze changes
         return self._analyze_changes(changed_files, repo_dir)
     
-    def _analyze_changes(self, changed_files: List[str], repo_dir: Path) -> ChangeInfo:
-        """Analyze which changes require rebuilding"""
+    def _analyze_changes(self, changed_files: Iterable[str], repo_dir: Path,
+                         deleted_projects: Optional[Set[str]] = None) -> ChangeInfo:
+        """
+        Analyze which changes require rebuilding
         
-        if not changed_files:
-            self.progress.info("✅ No changes detected")
-            return ChangeInfo(
-                changed_files=[],
-                changed_projects=set(),
-                build_system_changed=False,
-                docs_changed=False,
-                force_rebuild=False,
-                reason="No changes detected"
-            )
+        changed_files may be a stream; only a bounded sample of it is kept
+        and logged, so very large diffs do not flood memory or the log.
+        
+        Args:
+            changed_files: Changed paths relative to repo_dir
+            repo_dir: Directory the paths are relative to
+            deleted_projects: Project dirs (relative to repo_dir) that were
+                removed, so their files are not attributed to a parent project
+        """
         
         changed_projects = set()
+        removed_projects = set()
         build_system_changed = False
         docs_changed = False
+        recorded_files = []
+        total_files = 0
         
         # Patterns that indicate build system changes
         build_system_patterns = [
@@ -268,34 +461,61 @@ class ChangeDetector:
             ".md$"
         ]
         
-        # Analyze each changed file
+        def matches(file_path, patterns):
+            return any(pattern.replace("$", "") in file_path or 
+                       (pattern.endswith("$") and file_path.endswith(pattern[:-1]))
+                       for pattern in patterns)
+        
+        deleted_dirs = sorted(deleted_projects or (), key=len, reverse=True)
+        graph = None
+        
         for file_path in changed_files:
-            self.progress.info(f"  📝 Changed: {file_path}")
+            # Resolve each changed file through the project dependency graph,
+            # built only once there is something to resolve
+            if graph is None:
+                graph = self.project_graph(repo_dir)
             
-            # Check if it's a build system change
-            if any(pattern.replace("$", "") in file_path or 
-                   (pattern.endswith("$") and file_path.endswith(pattern[:-1]))
-                   for pattern in build_system_patterns):
-                build_system_changed = True
+            total_files += 1
+            if len(recorded_files) < MAX_RECORDED_FILES:
+                recorded_files.append(file_path)
+            if total_files <= MAX_LOGGED_FILES:
+                self.progress.info(f"  📝 Changed: {file_path}")
             
-            # Check if it's a documentation change
-            if any(pattern.replace("$", "") in file_path or 
-                   (pattern.endswith("$") and file_path.endswith(pattern[:-1]))
-                   for pattern in docs_patterns):
+            is_docs = matches(file_path, docs_patterns)
+            if is_docs:
                 docs_changed = True
             
-            # Check if it affects specific projects
-            if "godot-demo-projects/" in file_path or "-projects/" in file_path:
-                # Extract project name from path
-                path_parts = file_path.split("/")
-                for i, part in enumerate(path_parts):
-                    if "projects" in part and i + 1 < len(path_parts):
-                        # Next part should be category (2d, 3d, etc.)
-                        if i + 2 < len(path_parts):
-                            category = path_parts[i + 1]
-                            project = path_parts[i + 2]
-                            changed_projects.add(f"{category}/{project}")
-                        break
+            absolute_path = repo_dir / file_path
+            deleted_dir = next((d for d in deleted_dirs if file_path.startswith(d + "/")), None)
+            if deleted_dir is not None or (os.path.basename(file_path) == "project.godot"
+                                           and not absolute_path.exists()):
+                project_rel = graph.relative(repo_dir / (deleted_dir or os.path.dirname(file_path)))
+                if project_rel is not None:
+                    removed_projects.add(project_rel or ".")
+                continue
+            
+            affected = graph.affected_projects(absolute_path)
+            if affected:
+                # Documentation inside a project is not an export input
+                if not is_docs or os.path.realpath(absolute_path) in graph.shared:
+                    changed_projects.update(project or "." for project in affected)
+            elif not is_docs and matches(file_path, build_system_patterns):
+                # Only code and config outside every project can change the build system
+                build_system_changed = True
+        
+        if not total_files:
+            self.progress.info("✅ No changes detected")
+            return ChangeInfo(
+                changed_files=[],
+                changed_projects=set(),
+                build_system_changed=False,
+                docs_changed=False,
+                force_rebuild=False,
+                reason="No changes detected"
+            )
+        
+        if total_files > MAX_LOGGED_FILES:
+            self.progress.info(f"  📝 ... and {total_files - MAX_LOGGED_FILES} more changed files")
         
         # Determine rebuild scope
         if build_system_changed:
@@ -306,79 +526,185 @@ class ChangeDetector:
             reason = f"Project changes detected: {', '.join(list(changed_projects)[:3])}"
             if len(changed_projects) > 3:
                 reason += f" and {len(changed_projects) - 3} more"
+        elif removed_projects:
+            reason = f"Projects removed: {', '.join(sorted(removed_projects)[:3])}"
         elif docs_changed:
             reason = "Documentation changes detected"
         else:
             reason = "Other changes detected"
         
         self.progress.info(f"📊 Change analysis:")
-        self.progress.info(f"  📝 Changed files: {len(changed_files)}")
+        self.progress.info(f"  📝 Changed files: {total_files}")
         self.progress.info(f"  🎮 Affected projects: {len(changed_projects) if changed_projects else 'all' if build_system_changed else 'none'}")
+        if removed_projects:
+            self.progress.info(f"  🗑️  Removed projects: {len(removed_projects)}")
         self.progress.info(f"  🔧 Build system changed: {build_system_changed}")
         self.progress.info(f"  📚 Documentation changed: {docs_changed}")
         self.progress.info(f"  🎯 Reason: {reason}")
         
         return ChangeInfo(
-            changed_files=changed_files,
+            changed_files=recorded_files,
             changed_projects=changed_projects,
             build_system_changed=build_system_changed,
             docs_changed=docs_changed,
             force_rebuild=False,
-            reason=reason
+            reason=reason,
+            deleted_projects=removed_projects,
+            total_changed_files=total_files
         )
     
-    def _scan_filesystem(self, repo_dir: Path) -> Dict[str, str]:
+    def _walk_tracked(self, repo_dir: Path, skip_dir: Optional[Path] = None):
+        """
+        Yield (relative_path, path, stat) for tracked files in one pruned walk
+        
+        Every file below the projects dir is tracked (the project graph decides
+        which project a change affects); elsewhere only build-system and docs
+        files are. skip_dir (the directory holding the index) is never walked.
+        """
+        
+        projects_rel = ""
+        if self.projects_dir is not None:
+            try:
+                projects_rel = Path(os.path.abspath(self.projects_dir)).relative_to(
+                    os.path.abspath(repo_dir)).as_posix()
+            except ValueError:
+                projects_rel = None  # projects live outside repo_dir: filter everything
+            if projects_rel == ".":
+                projects_rel = ""
+        skip = os.path.abspath(skip_dir) if skip_dir is not None else None
+        
+        def in_projects(rel_path: str) -> bool:
+            return projects_rel is not None and (
+                not projects_rel or rel_path == projects_rel or rel_path.startswith(projects_rel + "/"))
+        
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            inside = in_projects(rel_dir) if rel_dir else projects_rel == ""
+            try:
+                with os.scandir(repo_dir / rel_dir if rel_dir else repo_dir) as entries:
+                    for entry in entries:
+                        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                child_inside = inside or in_projects(rel_path)
+                                if entry.name in PRUNED_DIRS or os.path.abspath(entry.path) == skip:
+                                    continue
+                                if entry.name.endswith("cache") and (entry.name.startswith(".") or not child_inside):
+                                    continue
+                                stack.append(rel_path)
+                            elif (inside or entry.name in TRACKED_NAMES or
+                                  os.path.splitext(entry.name)[1] in TRACKED_SUFFIXES):
+                                if entry.is_file():
+                                    yield rel_path, entry.path, entry.stat()
+                        except OSError as e:
+                            self.progress.warning(f"⚠️  Could not scan {entry.path}: {e}")
+            except OSError as e:
+                self.progress.warning(f"⚠️  Could not scan {rel_dir or repo_dir}: {e}")
+    
+    def _scan_incremental(self, repo_dir: Path, index_file: Path) -> List[str]:
+        """Update the stat index and return files whose content changed"""
+        
+        previous = self._load_index(index_file)
+        current = {}
+        changed_files = []
+        stale = {}
+        
+        for rel_path, file_path, stat in self._walk_tracked(repo_dir, index_file.parent):
+            key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            known = previous.get(rel_path)
+            
+            if known and known[:3] == key:
+                current[rel_path] = known
+            else:
+                stale[file_path] = (rel_path, key)
+        
+        # Re-hash only files whose stat tuple changed, in parallel
+        hashes = file_hasher.hash_files(stale)
+        rehashed = 0
+        for file_path, (rel_path, key) in stale.items():
+            content_hash = hashes[file_path]
+            if content_hash is None:
+                self.progress.warning(f"⚠️  Could not scan {file_path}")
+                continue
+            rehashed += 1
+            
+            known = previous.get(rel_path)
+            current[rel_path] = key + (content_hash,)
+            # A touched file with identical content is not a change
+            if not known or known[3] != content_hash:
+                changed_files.append(rel_path)
+        
+        # Check for deleted files
+        changed_files.extend(path for path in previous if path not in current)
+        
+        self.progress.info(f"  📇 Indexed {len(current)} files, re-hashed {rehashed}")
+        self._save_index(index_file, current)
+        return changed_files
+    
+    def _load_index(self, index_file: Path) -> Dict[str, Tuple[int, int, int, bytes]]:
+        """Load the binary stat index"""
+        
+        if not index_file.exists():
+            return {}
+        
+        try:
+            data = index_file.read_bytes()
+            magic, version, algorithm, count = INDEX_HEADER.unpack_from(data, 0)
+            if (magic != INDEX_MAGIC or version != INDEX_VERSION or
+                    algorithm.rstrip(b"\0").decode() != file_hasher.ALGORITHM):
+                return {}
+            
+            index = {}
+            offset = INDEX_HEADER.size
+            for _ in range(count):
+                (path_len,) = INDEX_PATH_LEN.unpack_from(data, offset)
+                offset += INDEX_PATH_LEN.size
+                rel_path = data[offset:offset + path_len].decode('utf-8')
+                offset += path_len
+                index[rel_path] = INDEX_RECORD.unpack_from(data, offset)
+                offset += INDEX_RECORD.size
+            return index
+        except (OSError, struct.error, UnicodeDecodeError) as e:
+            self.progress.warning(f"⚠️  Could not load change index: {e}")
+            return {}
+    
+    def _save_index(self, index_file: Path, index: Dict[str, Tuple[int, int, int, bytes]]):
+        """Save the binary stat index atomically"""
+        
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            chunks = [INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION,
+                                        file_hasher.ALGORITHM.encode(), len(index))]
+            for rel_path, record in index.items():
+                encoded = rel_path.encode('utf-8')
+                chunks.append(INDEX_PATH_LEN.pack(len(encoded)))
+                chunks.append(encoded)
+                chunks.append(INDEX_RECORD.pack(*record))
+            
+            temp_file = index_file.with_name(index_file.name + ".tmp")
+            temp_file.write_bytes(b"".join(chunks))
+            os.replace(temp_file, index_file)
+            
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not save change index: {e}")
+    
+    def _scan_filesystem(self, repo_dir: Path, cache_file: Optional[Path] = None) -> Dict[str, str]:
         """Scan filesystem and create state snapshot"""
         
         state = {}
+        skip_dir = cache_file.parent if cache_file is not None else None
+        tracked = {file_path: (rel_path, stat)
+                   for rel_path, file_path, stat in self._walk_tracked(repo_dir, skip_dir)}
         
-        # Patterns of files to track
-        track_patterns = [
-            "**/*.py",
-            "**/*.sh", 
-            "**/*.json",
-            "**/*.yml",
-            "**/*.yaml",
-            "**/*.md",
-            "**/*.html",
-            "**/*.js",
-            "**/project.godot",
-            "**/export_presets.cfg",
-            "**/SConstruct"
-        ]
-        
-        for pattern in track_patterns:
-            for file_path in repo_dir.glob(pattern):
-                if file_path.is_file():
-                    try:
-                        # Use relative path as key
-                        rel_path = str(file_path.relative_to(repo_dir))
-                        
-                        # Skip certain directories
-                        if any(skip in rel_path for skip in ['.git/', '__pycache__/', '.godot/', 'cache/']):
-                            continue
-                        
-                        # Create file signature (mtime + size + hash of first/last 1KB)
-                        stat = file_path.stat()
-                        signature = f"{stat.st_mtime}:{stat.st_size}"
-                        
-                        # For small files, hash the whole thing
-                        # For large files, hash first and last 1KB
-                        if stat.st_size < 2048:
-                            with open(file_path, 'rb') as f:
-                                signature += ":" + hashlib.md5(f.read()).hexdigest()[:8]
-                        else:
-                            with open(file_path, 'rb') as f:
-                                first_chunk = f.read(1024)
-                                f.seek(-1024, 2)  # Seek to 1KB from end
-                                last_chunk = f.read(1024)
-                                combined = first_chunk + last_chunk
-                                signature += ":" + hashlib.md5(combined).hexdigest()[:8]
-                        
-                        state[rel_path] = signature
-                        
-                    except Exception as e:
-                        self.progress.warning(f"⚠️  Could not scan {file_path}: {e}")
+        # File signature: mtime + size + full content hash
+        hashes = file_hasher.hash_files(tracked, hexdigest=True)
+        for file_path, (rel_path, stat) in tracked.items():
+            if hashes[file_path] is None:
+                self.progress.warning(f"⚠️  Could not scan {file_path}")
+                continue
+            state[rel_path] = f"{stat.st_mtime}:{stat.st_size}:{file_hasher.ALGORITHM}:{hashes[file_path]}"
         
         return state
     
@@ -418,15 +744,20 @@ def detect_changes(repo_dir: Path,
                   base_ref: str = "HEAD~1",
                   force_rebuild: bool = False,
                   use_git: bool = True,
-                  progress_reporter: Optional[ProgressReporter] = None) -> ChangeInfo:
+                  progress_reporter: Optional[ProgressReporter] = None,
+                  cache_file: Optional[Path] = None,
+                  projects_dir: Optional[Path] = None,
+                  project_index=None,
+                  graph_cache: Optional[Path] = None,
+                  deploy_manifest=None) -> ChangeInfo:
     """Convenience function to detect changes"""
     
-    detector = ChangeDetector(progress_reporter)
+    detector = ChangeDetector(progress_reporter, projects_dir, project_index, graph_cache, deploy_manifest)
     
     if use_git:
         return detector.detect_git_changes(repo_dir, base_ref, force_rebuild)
     else:
-        return detector.detect_filesystem_changes(repo_dir)
+        return detector.detect_filesystem_changes(repo_dir, cache_file)
 
 
 if __name__ == "__main__":
@@ -449,7 +780,7 @@ if __name__ == "__main__":
     )
     
     print(f"Change detection results:")
-    print(f"  Changed files: {len(changes.changed_files)}")
+    print(f"  Changed files: {changes.total_changed_files or len(changes.changed_files)}")
     print(f"  Changed projects: {len(changes.changed_projects) if changes.changed_projects else 'all' if changes.build_system_changed else 'none'}")
     print(f"  Build system changed: {changes.build_system_changed}")
     print(f"  Documentation changed: {changes.docs_changed}")
@@ -460,5 +791,6 @@ if __name__ == "__main__":
         print(f"  Files:")
         for file_path in changes.changed_files[:10]:
             print(f"    - {file_path}")
-        if len(changes.changed_files) > 10:
-            print(f"    ... and {len(changes.changed_files) - 10} more")
+        total_files = changes.total_changed_files or len(changes.changed_files)
+        if total_files > 10:
+            print(f"    ... and {total_files - 10} more")
@@ -3,9 +3,21 @@ Dependency Scanner for Smart Build Management
 """
 
 import os
-import hashlib
 from pathlib import Path
 
+try:
+    from . import file_hasher
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    sys.path.append(os.path.dirname(__file__))
+    import file_hasher
+
+
+# Scanned file types, critical ones (scripts and scenes) first
+CRITICAL_PATTERNS = ['*.gd', '*.tscn', '*.tres']
+ASSET_PATTERNS = ['*.cs', '*.png', '*.jpg', '*.ogg', '*.wav', '*.mp3']
+
 
 class DependencyScanner:
     """Smart dependency tracking for incremental builds"""
@@ -38,49 +50,61 @@ class DependencyScanner:
         except Exception as e:
             print(f"⚠️  Could not save dependency cache: {e}")
     
+    @staticmethod
+    def _stat_key(stat):
+        return f"{stat.st_size}_{stat.st_mtime_ns}"
+    
+    @staticmethod
+    def _split_entry(entry):
+        """Split a cache entry into (stat key, content hash)"""
+        stat_key, _, content_hash = entry.rpartition(':')
+        return stat_key, content_hash
+    
     def get_file_hash(self, file_path):
-        """Get hash of file contents with size optimization"""
+        """Get full-content hash of a file, streamed so large files are covered too"""
         try:
-            # Use file stat for quick size check first
-            stat = os.stat(file_path)
-            
-            # For large files (>10MB), use modification time as approximation
-            if stat.st_size > 10 * 1024 * 1024:
-                return f"large_{stat.st_mtime}_{stat.st_size}"
-            
-            # For normal files, use content hash
-            with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
-        except:
+            return f"{file_hasher.ALGORITHM}-{file_hasher.file_hexdigest(file_path)}"
+        except OSError:
             return None
     
     def has_changed(self, file_path):
         """Check if file has changed since last build with fast path"""
-        # Quick stat check first
-        try:
-            current_stat = os.stat(file_path)
-        except:
-            return True
-        
-        cached_hash = self.dependencies.get(file_path)
-        if cached_hash is None:
-            # First time seeing this file
-            current_hash = self.get_file_hash(file_path)
-            self.dependencies[file_path] = current_hash
-            return True
+        return bool(self.changed_files([file_path]))
+    
+    def changed_files(self, file_paths):
+        """
+        Return the files whose content changed since the last build
         
-        # For large files, quick mtime check
-        if cached_hash.startswith("large_"):
-            expected_mtime = float(cached_hash.split('_')[1])
-            if abs(current_stat.st_mtime - expected_mtime) < 1.0:  # 1 second tolerance
-                return False
+        Files with an unchanged (size, mtime) are skipped without being read;
+        the rest are hashed in parallel.
+        """
+        changed = []
+        stale = {}
         
-        # Full hash check for smaller files
-        current_hash = self.get_file_hash(file_path)
-        changed = cached_hash != current_hash
+        for file_path in file_paths:
+            try:
+                stat_key = self._stat_key(os.stat(file_path))
+            except OSError:
+                changed.append(file_path)
+                continue
+            
+            cached = self.dependencies.get(file_path)
+            if cached is not None and self._split_entry(cached)[0] == stat_key:
+                continue
+            stale[file_path] = stat_key
         
-        if changed:
-            self.dependencies[file_path] = current_hash
+        hashes = file_hasher.hash_files(stale, hexdigest=True)
+        for file_path, stat_key in stale.items():
+            if hashes[file_path] is None:
+                changed.append(file_path)
+                continue
+            
+            current_hash = f"{file_hasher.ALGORITHM}-{hashes[file_path]}"
+            cached = self.dependencies.get(file_path)
+            self.dependencies[file_path] = f"{stat_key}:{current_hash}"
+            # A touched file with identical content is not a change
+            if cached is None or self._split_entry(cached)[1] != current_hash:
+                changed.append(file_path)
         
         return changed
     
@@ -119,21 +143,15 @@ class DependencyScanner:
             return True, project_file
         
         # Check critical files first (scripts and scenes)
-        critical_patterns = ['*.gd', '*.tscn', '*.tres']
         project_path = Path(project_dir)
         
-        for pattern in critical_patterns:
-            for file_path in project_path.rglob(pattern):
-                if 'exports' not in file_path.parts:
-                    if self.has_changed(str(file_path)):
-                        return True, str(file_path)
-        
-        # Check assets if no critical changes found
-        asset_patterns = ['*.cs', '*.png', '*.jpg', '*.ogg', '*.wav', '*.mp3']
-        for pattern in asset_patterns:
-            for file_path in project_path.rglob(pattern):
-                if 'exports' not in file_path.parts:
-                    if self.has_changed(str(file_path)):
-                        return True, str(file_path)
+        for patterns in (CRITICAL_PATTERNS, ASSET_PATTERNS):
+            file_paths = [str(file_path)
+                          for pattern in patterns
+                          for file_path in project_path.rglob(pattern)
+                          if 'exports' not in file_path.parts]
+            changed = self.changed_files(file_paths)
+            if changed:
+                return True, changed[0]
         
         return False, None
@@ -0,0 +1,269 @@
+"""
+Deploy Manifest
+===============
+
+Record of what the last successful build deployed: the commit, a hash of
+the build system inputs, a content hash per project and the export cache
+entry each project's export came from.
+CI runs from shallow clones have no git history to diff against, so change
+detection compares the current project hashes with the manifest instead,
+and unchanged projects are restored from the export cache entries it lists.
+
+A build writes a pending manifest; the artifact target publishes it once
+the artifact passed validation.
+"""
+
+import os
+import json
+import time
+import hashlib
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+try:
+    from .progress_reporter import ProgressReporter
+    from .project_index import ProjectIndex
+    from .export_cache import DOC_SUFFIXES
+    from . import file_hasher
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    from project_index import ProjectIndex
+    from export_cache import DOC_SUFFIXES
+    import file_hasher
+
+
+MANIFEST_FORMAT_VERSION = 2
+
+# File name used when the manifest is shipped inside the deployment artifact
+ARTIFACT_MANIFEST_NAME = "deploy-manifest.json"
+
+
+class DeployManifest:
+    """Loads, computes and saves the last-deploy manifest"""
+
+    def __init__(self, manifest_file: Path, project_index: ProjectIndex,
+                 build_inputs: Optional[Dict[str, str]] = None,
+                 progress_reporter: Optional[ProgressReporter] = None):
+        """
+        Create a manifest handle
+
+        Args:
+            manifest_file: Where the manifest is read from and saved to
+            project_index: Index of the projects directory
+            build_inputs: Extra values that invalidate every project when they
+                change (e.g. Godot version, build config)
+            progress_reporter: Progress reporter
+        """
+        self.manifest_file = Path(manifest_file)
+        self.index = project_index
+        self.build_inputs = build_inputs or {}
+        self.progress = progress_reporter or ProgressReporter()
+        self.stored: Optional[dict] = None
+        self._project_hashes: Optional[Dict[str, str]] = None
+        self._exports: Dict[str, str] = {}
+        self._invalidated: Set[str] = set()
+
+    def load(self) -> Optional[dict]:
+        """Return the stored manifest, or None if there is no usable one"""
+        self.stored = _read_manifest(self.manifest_file, self.progress)
+        return self.stored
+
+    def build_system_hash(self) -> str:
+        """Hash of the build system sources and the declared build inputs"""
+        digest = hashlib.sha256()
+        for key in sorted(self.build_inputs):
+            digest.update(f"{key}={self.build_inputs[key]}\0".encode())
+
+        build_system_dir = Path(__file__).resolve().parent.parent
+        sources = sorted(build_system_dir.glob("*.py")) + sorted((build_system_dir / "tools").glob("*.py"))
+        hashes = file_hasher.hash_files(sources)
+        for source in sources:
+            digest.update(source.name.encode() + b"\0")
+            digest.update(hashes[source] or b"")
+        return digest.hexdigest()
+
+    def project_hashes(self) -> Dict[str, str]:
+        """
+        Content hash of every project's export inputs, keyed by project dir
+        relative to the projects directory
+
+        Computed once per instance, so take it before exports add files to
+        the projects. This hashes every project file; only runs that diff
+        against or publish a manifest call it.
+        """
+        if self._project_hashes is None:
+            files_by_project = {}
+            for project_dir in self.index.project_dirs():
+                # Docs are regenerated every build (embeds), so they are not export inputs
+                files_by_project[project_dir] = sorted(
+                    path for path, _, _ in self.index.iter_project_files(project_dir)
+                    if not path.name.lower().endswith(DOC_SUFFIXES)
+                )
+            file_hashes = file_hasher.hash_files(
+                path for paths in files_by_project.values() for path in paths
+            )
+
+            self._project_hashes = {}
+            for project_dir, paths in files_by_project.items():
+                digest = hashlib.sha256()
+                for path in paths:
+                    digest.update(path.relative_to(project_dir).as_posix().encode("utf-8") + b"\0")
+                    digest.update(file_hashes[path] or b"")
+                project_rel = project_dir.relative_to(self.index.root).as_posix()
+                self._project_hashes[project_rel] = digest.hexdigest()
+        return self._project_hashes
+
+    def invalidate(self, project_rel: str):
+        """Leave a project out of the saved manifest so the next run rebuilds it"""
+        self._invalidated.add(project_rel)
+
+    def record_export(self, project_rel: str, cache_key: str):
+        """Remember the export cache entry a project's export came from"""
+        self._exports[project_rel] = cache_key
+
+    def restore_exports(self, export_cache, project_rels: Iterable[str]) -> Set[str]:
+        """
+        Restore unchanged projects from the export cache entries the stored
+        manifest lists, without hashing their inputs or running Godot
+
+        Only projects whose content hash matches the stored manifest are
+        restored; the rest are left for a regular export.
+
+        Returns:
+            The projects that were restored
+        """
+        if not self.stored:
+            return set()
+        current = self.project_hashes()
+        previous = self.stored.get('projects', {})
+        exports = self.stored.get('exports', {})
+        restored = set()
+        for project_rel in project_rels:
+            cache_key = exports.get(project_rel)
+            if not cache_key or current.get(project_rel) != previous.get(project_rel):
+                continue
+            project_dir = self.index.root / project_rel
+            if export_cache.restore(cache_key, project_dir / "exports" / "web"):
+                self.index.refresh(project_dir)
+                self._exports[project_rel] = cache_key
+                restored.add(project_rel)
+        return restored
+
+    def diff(self, stored: dict) -> Dict[str, Set[str]]:
+        """Compare current project hashes with a stored manifest"""
+        current = self.project_hashes()
+        previous = stored.get('projects', {})
+        return {
+            'changed': {p for p, h in current.items() if previous.get(p) != h},
+            'deleted': {p for p in previous if p not in current},
+        }
+
+    def save_pending(self, pending_file: Path, commit: Optional[str] = None):
+        """
+        Record what this build produced, to be published once it is deployed
+
+        Project hashes are included only if this run already computed them
+        (CI runs do, for the diff); otherwise publish() takes them.
+        """
+        if commit is None:
+            commit = current_commit(self.index.root)
+        exports = {}
+        if self.stored and self._project_hashes is not None:
+            # Unchanged projects that were neither exported nor restored keep their entry
+            previous = self.stored.get('projects', {})
+            exports = {p: key for p, key in self.stored.get('exports', {}).items()
+                       if p in self._project_hashes and previous.get(p) == self._project_hashes[p]}
+        exports.update(self._exports)
+        data = {
+            'version': MANIFEST_FORMAT_VERSION,
+            'commit': commit,
+            'hash_algorithm': file_hasher.ALGORITHM,
+            'build_system': self.build_system_hash(),
+            'exports': exports,
+            'invalidated': sorted(self._invalidated),
+        }
+        if self._project_hashes is not None:
+            data['projects'] = self._project_hashes
+        _write_manifest(pending_file, data, self.progress)
+
+    def publish(self, pending_file: Path, manifest_file: Optional[Path] = None) -> Optional[Path]:
+        """
+        Turn the pending manifest of the last build into the deploy manifest
+
+        Returns:
+            The written manifest file, or None if it could not be written
+        """
+        manifest_file = Path(manifest_file or self.manifest_file)
+        pending = _read_manifest(pending_file, self.progress) or {}
+        projects = pending.get('projects')
+        if projects is None:
+            projects = self.project_hashes()
+        invalidated = set(pending.get('invalidated', [])) | self._invalidated
+        commit = pending.get('commit') or current_commit(self.index.root)
+        data = {
+            'version': MANIFEST_FORMAT_VERSION,
+            'commit': commit,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'hash_algorithm': file_hasher.ALGORITHM,
+            'build_system': pending.get('build_system') or self.build_system_hash(),
+            'projects': {p: h for p, h in projects.items() if p not in invalidated},
+            'exports': {p: key for p, key in pending.get('exports', {}).items()
+                        if p in projects and p not in invalidated},
+        }
+        if not _write_manifest(manifest_file, data, self.progress):
+            return None
+        try:
+            Path(pending_file).unlink()
+        except OSError:
+            pass
+        self.progress.info(f"📝 Deploy manifest saved: {len(data['projects'])} projects at {(commit or 'unknown')[:8]}")
+        return manifest_file
+
+
+def _read_manifest(manifest_file: Path, progress: ProgressReporter) -> Optional[dict]:
+    """Manifest data from manifest_file, or None if it is missing or unusable"""
+    if not Path(manifest_file).exists():
+        return None
+    try:
+        with open(manifest_file, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != MANIFEST_FORMAT_VERSION or data.get('hash_algorithm') != file_hasher.ALGORITHM:
+            return None
+        return data
+    except (OSError, ValueError) as e:
+        progress.warning(f"⚠️  Could not load deploy manifest: {e}")
+        return None
+
+
+def _write_manifest(manifest_file: Path, data: dict, progress: ProgressReporter) -> bool:
+    manifest_file = Path(manifest_file)
+    try:
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+        with open(temp_file, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(temp_file, manifest_file)
+        return True
+    except OSError as e:
+        progress.warning(f"⚠️  Could not save deploy manifest: {e}")
+        return False
+
+
+def current_commit(repo_dir: Path) -> Optional[str]:
+    """HEAD commit of the repository containing repo_dir"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return result.stdout.strip() or None if result.returncode == 0 else None
+    except (OSError, subprocess.SubprocessError):
+        return None
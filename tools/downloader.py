@@ -0,0 +1,501 @@
+"""
+Downloader
+==========
+
+Resumable HTTP downloads for the Godot toolchain.
+Files are fetched in parallel HTTP Range segments into a `.part` file whose
+segment progress is recorded next to it, so a failed segment is retried
+from where it stopped and an interrupted download resumes instead of
+starting over. Servers without Range support get a single stream. Every
+request has its own timeout (a read that stalls longer fails the request),
+and finished files are verified against published SHA-512 sums.
+"""
+
+import os
+import json
+import time
+import socket
+import hashlib
+import threading
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from .progress_reporter import ProgressReporter
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+
+
+CHUNK_SIZE = 256 * 1024
+
+# Files smaller than two segments of this size are downloaded as one stream
+MIN_SEGMENT_SIZE = 16 * 1024 * 1024
+
+DEFAULT_SEGMENTS = 4
+
+# Seconds a single request may wait for a response or between two reads
+DEFAULT_TIMEOUT = 60
+
+# Segment progress is persisted at most this often
+STATE_SAVE_INTERVAL = 2.0
+
+STATE_FORMAT_VERSION = 1
+
+SHA512_SUMS_NAME = "SHA512-SUMS.txt"
+
+USER_AGENT = "godot-ci-build-system"
+
+
+class DownloadError(Exception):
+    """A download failed for good (retries exhausted or checksum mismatch)"""
+
+
+@dataclass
+class Segment:
+    """Byte range [start, end] of a download and how much of it is done"""
+    start: int
+    end: int
+    done: int = 0
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def complete(self) -> bool:
+        return self.done >= self.size
+
+
+@dataclass
+class RemoteFile:
+    """What a probe request learned about a URL"""
+    size: Optional[int]
+    accepts_ranges: bool
+    validator: str  # ETag or Last-Modified; a change invalidates partial data
+
+
+def parse_checksums(text: str) -> Dict[str, str]:
+    """Parse a `<hex digest>  <file name>` sums file"""
+    sums = {}
+    for line in text.splitlines():
+        parts = line.strip().split()
+        if len(parts) >= 2:
+            sums[parts[-1].lstrip('*')] = parts[0].lower()
+    return sums
+
+
+def file_sha512(path: Path) -> str:
+    """SHA-512 hex digest of a file"""
+    digest = hashlib.sha512()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Downloader:
+    """Segmented, resumable downloads with checksum verification"""
+
+    def __init__(self, progress_reporter: Optional[ProgressReporter] = None,
+                 segments: int = DEFAULT_SEGMENTS, timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = 3, show_progress: bool = True, ci_mode: bool = False):
+        """
+        Create a downloader
+
+        Args:
+            progress_reporter: Progress reporter
+            segments: Parallel Range requests per file
+            timeout: Seconds each request may wait for a connection or a read
+            retries: Attempts per segment (and for the probe request)
+            show_progress: Report download progress
+            ci_mode: Update progress less often to keep CI logs short
+        """
+        self.progress = progress_reporter or ProgressReporter()
+        self.segments = max(1, segments)
+        self.timeout = timeout
+        self.retries = max(1, retries)
+        self.show_progress = show_progress
+        self.ci_mode = ci_mode
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def _open(self, url: str, byte_range: Optional[str] = None):
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        if byte_range:
+            request.add_header("Range", f"bytes={byte_range}")
+        # The timeout applies to this request's connect and every read, not globally
+        return urllib.request.urlopen(request, timeout=self.timeout)
+
+    def _backoff(self, attempt: int):
+        time.sleep(min(30, (2 if self.ci_mode else 5) * (attempt + 1)))
+
+    def probe(self, url: str) -> RemoteFile:
+        """Learn size, Range support and validator of url with a one-byte Range request"""
+        for attempt in range(self.retries):
+            try:
+                with self._open(url, "0-0") as response:
+                    headers = response.headers
+                    validator = headers.get("ETag") or headers.get("Last-Modified") or ""
+                    content_range = headers.get("Content-Range", "")
+                    if response.status == 206 and "/" in content_range:
+                        total = content_range.rsplit("/", 1)[1]
+                        return RemoteFile(int(total) if total.isdigit() else None, True, validator)
+                    length = headers.get("Content-Length")
+                    return RemoteFile(int(length) if length and length.isdigit() else None, False, validator)
+            except urllib.error.HTTPError as e:
+                if e.code == 416:
+                    # Empty file: no byte 0 to return
+                    return RemoteFile(0, False, "")
+                if e.code < 500 or attempt == self.retries - 1:
+                    raise DownloadError(f"HTTP {e.code} for {url}") from e
+            except (urllib.error.URLError, socket.timeout, TimeoutError, ConnectionError) as e:
+                if attempt == self.retries - 1:
+                    raise DownloadError(f"Could not reach {url}: {e}") from e
+            self._backoff(attempt)
+        raise DownloadError(f"Could not reach {url}")
+
+    def fetch_checksums(self, url: str) -> Dict[str, str]:
+        """Download and parse a published sums file (empty if unavailable)"""
+        try:
+            with self._open(url) as response:
+                return parse_checksums(response.read().decode("utf-8", errors="replace"))
+        except (urllib.error.URLError, socket.timeout, TimeoutError, ConnectionError, ValueError):
+            return {}
+
+    # ------------------------------------------------------------------
+    # Partial download state
+    # ------------------------------------------------------------------
+
+    def _plan(self, size: int) -> List[Segment]:
+        if size < 2 * MIN_SEGMENT_SIZE:
+            return [Segment(0, size - 1)] if size else []
+        count = min(self.segments, size // MIN_SEGMENT_SIZE)
+        step = size // count
+        bounds = [i * step for i in range(count)] + [size]
+        return [Segment(bounds[i], bounds[i + 1] - 1) for i in range(count)]
+
+    def _load_state(self, state_path: Path, part_path: Path, url: str,
+                    remote: RemoteFile) -> Optional[List[Segment]]:
+        try:
+            with open(state_path, 'r') as f:
+                data = json.load(f)
+            if (data.get("version") != STATE_FORMAT_VERSION or data.get("url") != url
+                    or data.get("size") != remote.size or data.get("validator") != remote.validator
+                    or not part_path.exists() or part_path.stat().st_size != remote.size):
+                return None
+            return [Segment(**segment) for segment in data["segments"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_state(self, state_path: Path, url: str, remote: RemoteFile, segments: List[Segment]):
+        temp_path = state_path.with_name(state_path.name + ".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump({"version": STATE_FORMAT_VERSION, "url": url, "size": remote.size,
+                       "validator": remote.validator,
+                       "segments": [asdict(segment) for segment in segments]}, f)
+        os.replace(temp_path, state_path)
+
+    def _sync_part(self, part_path: Path):
+        """fsync the .part file so saved segment progress never runs ahead of the data"""
+        try:
+            fd = os.open(part_path, os.O_RDWR)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # ------------------------------------------------------------------
+    # Downloading
+    # ------------------------------------------------------------------
+
+    def download(self, url: str, destination: Path, description: str = "file",
+                 sha512: Optional[str] = None):
+        """
+        Download url to destination, resuming a previous partial download
+
+        Args:
+            url: File URL
+            destination: Target path, only created once complete and verified
+            description: Name used in progress messages
+            sha512: Expected SHA-512 hex digest, verified before destination is written
+
+        Raises:
+            DownloadError: The download failed or the checksum did not match
+        """
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        part_path = destination.with_name(destination.name + ".part")
+        state_path = destination.with_name(destination.name + ".part.json")
+
+        remote = self.probe(url)
+        if remote.size is None or not remote.accepts_ranges:
+            # Nothing to split or resume: one stream, restarted on failure
+            self._download_stream(url, part_path, description, remote.size)
+        else:
+            segments = self._load_state(state_path, part_path, url, remote)
+            if segments is not None:
+                done = sum(segment.done for segment in segments)
+                self.progress.info(f"⏯️  Resuming {description} at {done * 100 // max(1, remote.size)}%")
+            else:
+                segments = self._plan(remote.size)
+                with open(part_path, 'wb') as f:
+                    f.truncate(remote.size)
+                self._save_state(state_path, url, remote, segments)
+            self._download_segments(url, part_path, state_path, remote, segments, description)
+
+        if sha512:
+            actual = file_sha512(part_path)
+            if actual != sha512.lower():
+                part_path.unlink()
+                if state_path.exists():
+                    state_path.unlink()
+                raise DownloadError(f"SHA-512 mismatch for {description}: expected {sha512[:16]}…, got {actual[:16]}…")
+            self.progress.info(f"🔒 SHA-512 verified for {description}")
+
+        os.replace(part_path, destination)
+        if state_path.exists():
+            state_path.unlink()
+
+    def _download_stream(self, url: str, part_path: Path, description: str, size: Optional[int]):
+        for attempt in range(self.retries):
+            try:
+                with self._open(url) as response, open(part_path, 'wb') as f:
+                    downloaded = 0
+                    last_report = 0.0
+                    for chunk in iter(lambda: response.read(CHUNK_SIZE), b''):
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        now = time.monotonic()
+                        if self.show_progress and size and now - last_report >= self._report_interval():
+                            self.progress.update_progress(f"Downloading {description}", downloaded * 100 / size)
+                            last_report = now
+                if size is not None and downloaded != size:
+                    raise ConnectionError(f"connection closed after {downloaded} of {size} bytes")
+                return
+            except (urllib.error.URLError, socket.timeout, TimeoutError, ConnectionError) as e:
+                if attempt == self.retries - 1:
+                    raise DownloadError(f"Failed to download {description} after {self.retries} attempts: {e}") from e
+                self.progress.warning(f"⚠️  Download attempt {attempt + 1} of {description} failed: {e}")
+                self._backoff(attempt)
+
+    def _report_interval(self) -> float:
+        return 10.0 if self.ci_mode else 1.0
+
+    def _download_segments(self, url: str, part_path: Path, state_path: Path, remote: RemoteFile,
+                           segments: List[Segment], description: str):
+        lock = threading.Lock()
+        last_save = [time.monotonic()]
+        last_report = [0.0]
+
+        def report(force: bool = False):
+            now = time.monotonic()
+            if now - last_save[0] >= STATE_SAVE_INTERVAL or force:
+                # Counted bytes are flushed; make them durable before the state claims them
+                self._sync_part(part_path)
+                self._save_state(state_path, url, remote, segments)
+                last_save[0] = now
+            if self.show_progress and (force or now - last_report[0] >= self._report_interval()):
+                done = sum(segment.done for segment in segments)
+                per_segment = " ".join(f"{segment.done * 100 // segment.size:>3}%" for segment in segments)
+                self.progress.update_progress(f"Downloading {description} [{per_segment}]",
+                                              done * 100 / max(1, remote.size))
+                last_report[0] = now
+
+        def fetch(index: int):
+            segment = segments[index]
+            for attempt in range(self.retries):
+                if segment.complete:
+                    return
+                try:
+                    with self._open(url, f"{segment.start + segment.done}-{segment.end}") as response:
+                        if response.status != 206:
+                            raise ConnectionError(f"server ignored the Range request (HTTP {response.status})")
+                        with open(part_path, 'r+b') as f:
+                            f.seek(segment.start + segment.done)
+                            while not segment.complete:
+                                chunk = response.read(min(CHUNK_SIZE, segment.size - segment.done))
+                                if not chunk:
+                                    raise ConnectionError("connection closed before the segment was complete")
+                                f.write(chunk)
+                                # Only bytes handed to the OS count as done
+                                f.flush()
+                                with lock:
+                                    segment.done += len(chunk)
+                                    report()
+                    return
+                except (urllib.error.URLError, socket.timeout, TimeoutError, ConnectionError) as e:
+                    if attempt == self.retries - 1:
+                        raise DownloadError(f"Segment {index + 1}/{len(segments)} of {description} failed "
+                                            f"after {self.retries} attempts: {e}") from e
+                    self.progress.warning(f"⚠️  Segment {index + 1} of {description} failed ({e}), resuming")
+                    self._backoff(attempt)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(segments) or 1) as executor:
+                for future in [executor.submit(fetch, i) for i in range(len(segments))]:
+                    future.result()
+        finally:
+            # Keep the progress made so far for the next attempt
+            with lock:
+                report(force=True)
+
+
+def run_self_test(work_dir: Path) -> bool:
+    """
+    Exercise the downloader against a local Range-capable stand-in server
+
+    Covers segmented downloads, a segment whose connection drops mid-way,
+    resuming an interrupted download from its saved state (whose progress
+    must never claim bytes that are not in the .part file), the single
+    stream fallback for servers without Range support and SHA-512
+    verification.
+
+    Returns:
+        True if every check passed
+    """
+    import http.server
+    global MIN_SEGMENT_SIZE
+
+    data = hashlib.sha512(b"seed").digest() * (3 * 1024 * 1024 // 64)  # 3 MB
+    digest = hashlib.sha512(data).hexdigest()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        ranges = True
+        drops_left = 0  # requests that are cut off half way
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            start, end = 0, len(data) - 1
+            byte_range = self.headers.get("Range", "")
+            partial = self.ranges and byte_range.startswith("bytes=")
+            if partial:
+                first, last = byte_range[len("bytes="):].split("-")
+                start, end = int(first), min(int(last or end), end)
+            body = data[start:end + 1]
+            self.send_response(206 if partial else 200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", '"self-test"')
+            if partial:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            self.end_headers()
+            if len(body) > 1 and Handler.drops_left > 0:
+                Handler.drops_left -= 1
+                body = body[:len(body) // 2]
+                self.close_connection = True
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # The probe request stops reading after the headers
+                self.close_connection = True
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/godot.zip"
+    saved_segment_size = MIN_SEGMENT_SIZE
+    MIN_SEGMENT_SIZE = 256 * 1024
+    results = []
+
+    def check(name: str, passed: bool):
+        results.append(passed)
+        print(f"  {'✅' if passed else '❌'} {name}")
+
+    def downloader(retries: int = 3) -> Downloader:
+        instance = Downloader(segments=4, timeout=10, retries=retries, show_progress=False)
+        instance._backoff = lambda attempt: None
+        return instance
+
+    try:
+        work_dir.mkdir(parents=True, exist_ok=True)
+        target = work_dir / "godot.zip"
+
+        Handler.ranges, Handler.drops_left = True, 0
+        downloader().download(url, target, "segmented", sha512=digest)
+        check("segmented download", target.read_bytes() == data)
+        target.unlink()
+
+        Handler.drops_left = 2
+        downloader().download(url, target, "dropped segments", sha512=digest)
+        check("segments resume after a dropped connection", target.read_bytes() == data)
+        target.unlink()
+
+        # Every request is cut off and not retried: the download fails with
+        # partial progress saved, which a second run resumes from
+        Handler.drops_left = 100
+        try:
+            downloader(retries=1).download(url, target, "interrupted")
+            check("interrupted download fails", False)
+        except DownloadError:
+            check("interrupted download fails", True)
+        state = json.loads(target.with_name(target.name + ".part.json").read_text())
+        part = target.with_name(target.name + ".part").read_bytes()
+        claimed = [(segment["start"], segment["start"] + segment["done"]) for segment in state["segments"]]
+        check("saved progress only claims bytes on disk",
+              any(end > start for start, end in claimed)
+              and all(part[start:end] == data[start:end] for start, end in claimed))
+        Handler.drops_left = 0
+        downloader().download(url, target, "resumed", sha512=digest)
+        check("interrupted download resumes", target.read_bytes() == data)
+        target.unlink()
+
+        Handler.ranges = False
+        downloader().download(url, target, "single stream", sha512=digest)
+        check("single stream without Range support", target.read_bytes() == data)
+        target.unlink()
+
+        Handler.ranges = True
+        try:
+            downloader().download(url, target, "wrong checksum", sha512="0" * 128)
+            check("SHA-512 mismatch is rejected", False)
+        except DownloadError:
+            check("SHA-512 mismatch is rejected", not target.exists())
+    finally:
+        MIN_SEGMENT_SIZE = saved_segment_size
+        server.shutdown()
+        server.server_close()
+    return all(results)
+
+
+if __name__ == "__main__":
+    # CLI for testing, e.g. against a local Range-capable HTTP server
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Resumable segmented downloader")
+    parser.add_argument("url", nargs="?", help="URL to download")
+    parser.add_argument("destination", type=Path, nargs="?", help="Where to save the file")
+    parser.add_argument("--sha512", help="Expected SHA-512 hex digest")
+    parser.add_argument("--segments", type=int, default=DEFAULT_SEGMENTS, help="Parallel Range requests")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-request timeout in seconds")
+
+    parser.add_argument("--self-test", type=Path, metavar="DIR",
+                        help="Check the downloader against a local Range-capable server, working in DIR")
+
+    args = parser.parse_args()
+
+    if args.self_test:
+        print("🧪 Downloader self-test")
+        sys.exit(0 if run_self_test(args.self_test) else 1)
+    if not args.url or not args.destination:
+        parser.error("url and destination are required")
+
+    try:
+        Downloader(segments=args.segments, timeout=args.timeout).download(
+            args.url, args.destination, args.destination.name, sha512=args.sha512)
+    except DownloadError as e:
+        print(f"\n❌ {e}")
+        sys.exit(1)
+    print(f"\n✅ Downloaded {args.destination}")
@@ -2,23 +2,73 @@
 """
 Embed Injector for Godot Examples Documentation
 Injects embed markers into README files for Docsify integration
+
+READMEs are processed on a thread pool and rewritten atomically. A state
+file records each processed README's stat data and content hash, so READMEs
+already carrying their marker are skipped without being read.
 """
 
+import os
 import sys
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from project_config import BuildSystemConfig
 from tools.progress_reporter import ProgressReporter
+from tools.project_index import ProjectIndex
+from tools import file_hasher
+
+
+STATE_FORMAT_VERSION = 1
+
+
+@dataclass
+class EmbedResult:
+    """Outcome of processing one README"""
+    path: Path
+    status: str  # "modified", "unchanged", "cached" (skipped via the state file) or "failed"
+    embed_added: bool = False
+    old_embed_removed: bool = False
+    error: Optional[str] = None
+    # (size, mtime_ns, content hash) after processing, for the state file
+    state: Optional[Tuple[int, int, str]] = None
+
+
+def _content_hash(data: bytes) -> str:
+    hasher = file_hasher.new_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def write_atomic(path: Path, content: str):
+    """Replace path's content via a temp file and rename, keeping its permissions"""
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(temp_path, path.stat().st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
 
 
 class EmbedInjector:
     """Handles injection of embed markers into documentation files"""
     
-    def __init__(self, progress_reporter: Optional[ProgressReporter] = None):
+    def __init__(self, progress_reporter: Optional[ProgressReporter] = None,
+                 state_file: Optional[Path] = None, max_workers: Optional[int] = None):
         self.progress = progress_reporter or ProgressReporter()
+        self.state_file = Path(state_file) if state_file else None
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 4) * 2)
+        self.results: List[EmbedResult] = []
         self.embed_marker = "<!-- embed-{$PATH} -->"
         self.old_embed_start = "<!-- GAME_EMBED -->"
         self.old_embed_end = "<!-- /GAME_EMBED -->"
@@ -27,7 +77,8 @@ class EmbedInjector:
             'files_processed': 0,
             'embeds_added': 0,
             'old_embeds_removed': 0,
-            'files_skipped': 0
+            'files_skipped': 0,
+            'files_failed': 0
         }
     
     def clean_old_embed_blocks(self, content: str) -> tuple[str, bool]:
@@ -51,7 +102,6 @@ class EmbedInjector:
                     content = content[:start_pos] + content[end_pos + len(self.old_embed_end):]
                     content = content.strip() + "\n"
                     was_cleaned = True
-                    self.stats['old_embeds_removed'] += 1
         
         return content, was_cleaned
     
@@ -88,52 +138,114 @@ class EmbedInjector:
             lines.insert(0, self.embed_marker)
             lines.insert(1, "")
         
-        self.stats['embeds_added'] += 1
         return '\n'.join(lines), True
     
-    def process_readme_file(self, readme_file: Path) -> bool:
+    def process_readme(self, readme_file: Path, stat: Optional[Tuple[int, int]] = None,
+                       recorded: Optional[Tuple[int, int, str]] = None) -> EmbedResult:
         """
-        Process a single README file to inject embed markers
+        Inject the embed marker into one README (thread-safe)
         
         Args:
             readme_file: Path to README.md file
+            stat: (size, mtime_ns) if known, e.g. from the project index
+            recorded: State recorded when this README was last processed
             
         Returns:
-            True if file was modified, False otherwise
+            EmbedResult
         """
-        if not readme_file.exists():
-            return False
-        
         try:
-            content = readme_file.read_text(encoding='utf-8')
-            original_content = content
+            if stat is None:
+                st = readme_file.stat()
+                stat = (st.st_size, st.st_mtime_ns)
+            if recorded is not None and tuple(recorded[:2]) == tuple(stat):
+                return EmbedResult(readme_file, "cached", state=tuple(recorded))
             
-            # Clean old embed blocks
-            content, was_cleaned = self.clean_old_embed_blocks(content)
+            data = readme_file.read_bytes()
+            digest = _content_hash(data)
+            if recorded is not None and recorded[2] == digest:
+                return EmbedResult(readme_file, "cached", state=(stat[0], stat[1], digest))
             
-            # Inject new embed marker
+            # Same newline handling as read_text, so rewritten files keep their previous form
+            original_content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            content, was_cleaned = self.clean_old_embed_blocks(original_content)
             content, was_injected = self.inject_embed_marker(content)
             
-            # Write back if content changed
-            if content != original_content:
-                readme_file.write_text(content, encoding='utf-8')
-                self.stats['files_processed'] += 1
-                return True
-            else:
-                self.stats['files_skipped'] += 1
-                return False
-                
+            if content == original_content:
+                return EmbedResult(readme_file, "unchanged", state=(stat[0], stat[1], digest))
+            
+            write_atomic(readme_file, content)
+            st = readme_file.stat()
+            return EmbedResult(readme_file, "modified", embed_added=was_injected, old_embed_removed=was_cleaned,
+                               state=(st.st_size, st.st_mtime_ns, _content_hash(readme_file.read_bytes())))
         except Exception as e:
-            self.progress.warning(f"Failed to process {readme_file}: {e}")
+            return EmbedResult(readme_file, "failed", error=str(e))
+    
+    def _record(self, result: EmbedResult):
+        """Fold a per-file result into the stats"""
+        self.results.append(result)
+        if result.status == "modified":
+            self.stats['files_processed'] += 1
+        elif result.status == "failed":
+            self.stats['files_failed'] += 1
+        else:
+            self.stats['files_skipped'] += 1
+        self.stats['embeds_added'] += result.embed_added
+        self.stats['old_embeds_removed'] += result.old_embed_removed
+    
+    def process_readme_file(self, readme_file: Path) -> bool:
+        """
+        Process a single README file to inject embed markers
+        
+        Args:
+            readme_file: Path to README.md file
+            
+        Returns:
+            True if file was modified, False otherwise
+        """
+        if not readme_file.exists():
             return False
+        
+        result = self.process_readme(readme_file)
+        self._record(result)
+        if result.error:
+            self.progress.warning(f"Failed to process {readme_file}: {result.error}")
+        return result.status == "modified"
     
-    def inject_embeds_into_projects(self, projects_dir: Path, dry_run: bool = False) -> dict:
+    def _load_state(self) -> Dict[str, Tuple[int, int, str]]:
+        if self.state_file is None:
+            return {}
+        try:
+            with open(self.state_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != STATE_FORMAT_VERSION or data.get('hash_algorithm') != file_hasher.ALGORITHM \
+                or data.get('marker') != self.embed_marker:
+            return {}
+        return {path: tuple(entry) for path, entry in data.get('files', {}).items()}
+    
+    def _save_state(self, state: Dict[str, Tuple[int, int, str]]):
+        if self.state_file is None:
+            return
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.state_file.with_name(f".{self.state_file.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w') as f:
+                json.dump({'version': STATE_FORMAT_VERSION, 'hash_algorithm': file_hasher.ALGORITHM,
+                           'marker': self.embed_marker, 'files': state}, f)
+            os.replace(temp_path, self.state_file)
+        except OSError as e:
+            self.progress.warning(f"⚠️  Could not save embed state: {e}")
+    
+    def inject_embeds_into_projects(self, projects_dir: Path, dry_run: bool = False,
+                                    project_index: Optional[ProjectIndex] = None) -> dict:
         """
         Inject embed markers into all Godot project README files
         
         Args:
             projects_dir: Directory containing Godot projects
             dry_run: If True, don't actually modify files
+            project_index: Shared index of projects_dir, avoids walking the tree again
             
         Returns:
             Dictionary with injection statistics
@@ -143,11 +255,19 @@ class EmbedInjector:
             'files_processed': 0,
             'embeds_added': 0,
             'old_embeds_removed': 0,
-            'files_skipped': 0
+            'files_skipped': 0,
+            'files_failed': 0
         }
+        self.results = []
         
         # Find all Godot projects
-        project_files = list(projects_dir.rglob("project.godot"))
+        index = project_index if project_index is not None and project_index.root == projects_dir else None
+        if index is not None:
+            project_files = index.project_files()
+            readme_exists = index.has_file
+        else:
+            project_files = list(projects_dir.rglob("project.godot"))
+            readme_exists = Path.exists
         
         if not project_files:
             self.progress.warning(f"No Godot projects found in {projects_dir}")
@@ -155,18 +275,45 @@ class EmbedInjector:
         
         self.progress.info(f"🔍 Found {len(project_files)} projects to process")
         
+        readmes = []
         for project_file in project_files:
             project_dir = project_file.parent
             readme_file = project_dir / "README.md"
             
-            if readme_file.exists():
+            if readme_exists(readme_file):
                 if dry_run:
                     self.progress.info(f"Would process: {readme_file.relative_to(projects_dir)}")
                 else:
-                    self.process_readme_file(readme_file)
+                    readmes.append(readme_file)
             else:
                 self.progress.warning(f"No README.md found: {project_dir.relative_to(projects_dir)}")
         
+        if not readmes:
+            return self.stats
+        
+        state = self._load_state()
+        
+        def process(readme_file: Path) -> EmbedResult:
+            key = readme_file.relative_to(projects_dir).as_posix()
+            stat = index.stat(readme_file) if index is not None else None
+            return self.process_readme(readme_file, stat, state.get(key))
+        
+        new_state = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(readmes))) as executor:
+            for done, result in enumerate(executor.map(process, readmes), 1):
+                self._record(result)
+                rel_path = result.path.relative_to(projects_dir).as_posix()
+                if result.state is not None:
+                    new_state[rel_path] = result.state
+                if result.status == "failed":
+                    self.progress.warning(f"⚠️  Failed to process {rel_path}: {result.error}")
+                elif result.status == "modified" and self.progress.verbose:
+                    self.progress.info(f"✏️  {rel_path}: "
+                                       f"{'embed added' if result.embed_added else 'old embed removed'}")
+                if self.progress.verbose:
+                    self.progress.update_progress("Injecting embeds", done / len(readmes) * 100)
+        
+        self._save_state(new_state)
         return self.stats
     
     def generate_report(self) -> str:
@@ -177,11 +324,14 @@ class EmbedInjector:
         report.append(f"Embeds added: {self.stats['embeds_added']}")
         report.append(f"Old embeds removed: {self.stats['old_embeds_removed']}")
         report.append(f"Files skipped: {self.stats['files_skipped']}")
+        report.append(f"Files failed: {self.stats['files_failed']}")
         
         return "\n".join(report)
 
 
-def inject_embeds(projects_dir: Path, dry_run: bool = False, verbose: bool = False) -> tuple[dict, List[str]]:
+def inject_embeds(projects_dir: Path, dry_run: bool = False, verbose: bool = False,
+                  project_index: Optional[ProjectIndex] = None,
+                  state_file: Optional[Path] = None) -> tuple[dict, List[str]]:
     """
     Main function to inject embeds into documentation
     
@@ -189,24 +339,27 @@ def inject_embeds(projects_dir: Path, dry_run: bool = False, verbose: bool = Fal
         projects_dir: Directory containing Godot projects
         dry_run: If True, don't actually modify files
         verbose: Whether to show detailed progress
+        project_index: Shared index of projects_dir
+        state_file: Records processed READMEs so unchanged ones are skipped unread
         
     Returns:
         Tuple of (stats_dict, errors_list)
     """
     progress = ProgressReporter(verbose=verbose)
-    injector = EmbedInjector(progress)
+    injector = EmbedInjector(progress, state_file=state_file)
     
     if verbose:
         progress.info(f"🔍 Processing embeds in: {projects_dir}")
     
     # Inject embeds
-    stats = injector.inject_embeds_into_projects(projects_dir, dry_run=dry_run)
+    stats = injector.inject_embeds_into_projects(projects_dir, dry_run=dry_run, project_index=project_index)
     
     # Show report if verbose
     if verbose:
         progress.info(injector.generate_report())
     
-    return stats, []
+    errors = [f"Failed to process {result.path}: {result.error}" for result in injector.results if result.error]
+    return stats, errors
 
 
 if __name__ == "__main__":
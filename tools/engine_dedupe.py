@@ -0,0 +1,263 @@
+"""
+Web Engine Deduplication
+========================
+
+Every Godot web export carries its own copy of the engine (index.wasm,
+index.js and the worker/worklet scripts), identical for a given Godot
+version. This stage content-hashes the engine files of each export in the
+artifact, moves engines shared by several exports into engine/<hash>/ and
+points each export's index.html at the shared copy, so the artifact ships
+and browsers cache the engine once.
+"""
+
+import os
+import re
+import json
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .tree_stats import TreeStats
+    from . import file_hasher
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from tree_stats import TreeStats
+    import file_hasher
+
+
+ENGINE_DIR = "engine"
+
+# Engine files next to index.html, named after the config's "executable".
+# The engine loads all but <executable>.js relative to the executable path.
+ENGINE_SUFFIXES = (".wasm", ".js", ".worker.js", ".audio.worklet.js",
+                   ".audio.position.worklet.js", ".side.wasm")
+
+# fileSizes entries keyed by the executable path
+SIZED_SUFFIXES = (".wasm", ".side.wasm")
+
+CONFIG_PATTERN = re.compile(r'\bGODOT_CONFIG\s*=\s*')
+
+# Length of the engine hash used as directory name
+ENGINE_HASH_LENGTH = 16
+
+
+@dataclass
+class WebExport:
+    """A Godot web export's loader page and engine files"""
+    html: Path
+    text: str
+    config: Dict[str, Any]
+    config_span: Tuple[int, int]  # GODOT_CONFIG object within text
+    executable: str
+    files: Dict[str, Path]  # engine suffix -> file
+    sizes: Dict[str, int]
+
+    def identity(self) -> Tuple:
+        """Exports can only share an engine if this matches"""
+        return (self.executable, tuple(sorted(self.sizes.items())))
+
+
+@dataclass
+class EngineDedupeResult:
+    """What engine deduplication did"""
+    exports: int = 0  # exports now loading a shared engine
+    engines: int = 0  # shared engine directories
+    bytes_saved: int = 0
+    removed_engines: int = 0  # stale engine directories pruned
+    shared: Dict[Path, Path] = field(default_factory=dict)  # index.html -> engine dir
+
+
+def read_web_export(html_path: Path) -> Optional[WebExport]:
+    """
+    Parse a Godot web export page
+
+    Returns:
+        WebExport, or None if the page is not a standalone Godot export
+        (no GODOT_CONFIG, engine already shared, or a PWA whose service
+        worker caches the local engine files)
+    """
+    try:
+        text = html_path.read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    match = CONFIG_PATTERN.search(text)
+    if not match:
+        return None
+    try:
+        config, end = json.JSONDecoder().raw_decode(text, match.end())
+    except ValueError:
+        return None
+    if not isinstance(config, dict):
+        return None
+
+    executable = config.get("executable")
+    if not isinstance(executable, str) or not executable or "/" in executable or config.get("serviceWorker"):
+        return None
+
+    files = {}
+    sizes = {}
+    for suffix in ENGINE_SUFFIXES:
+        path = html_path.parent / f"{executable}{suffix}"
+        try:
+            sizes[suffix] = path.stat().st_size
+        except OSError:
+            continue
+        files[suffix] = path
+    if ".wasm" not in files or ".js" not in files:
+        return None
+    return WebExport(html_path, text, config, (match.end(), end), executable, files, sizes)
+
+
+def shared_engine_dir(html_path: Path) -> Optional[Path]:
+    """Engine directory an export page loads from, if it uses a shared engine that exists"""
+    try:
+        text = html_path.read_bytes().decode("utf-8")
+        match = CONFIG_PATTERN.search(text)
+        config, _ = json.JSONDecoder().raw_decode(text, match.end()) if match else (None, 0)
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+    executable = config.get("executable") if isinstance(config, dict) else None
+    if not isinstance(executable, str) or f"{ENGINE_DIR}/" not in executable:
+        return None
+    engine_dir = (html_path.parent / executable).parent
+    return engine_dir if (html_path.parent / f"{executable}.wasm").exists() else None
+
+
+def find_web_exports(roots: Iterable[Path]) -> List[WebExport]:
+    """Godot web exports below roots: .html pages next to a .wasm file"""
+    exports = []
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            if not any(name.endswith(".wasm") for name in filenames):
+                continue
+            for name in filenames:
+                if name.endswith(".html"):
+                    export = read_web_export(Path(dirpath) / name)
+                    if export is not None:
+                        exports.append(export)
+    return exports
+
+
+def _write_atomic(path: Path, content: bytes):
+    # Staged files may be hardlinks into the source tree: replace, never edit in place
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def _point_to_engine(export: WebExport, engine_dir: Path) -> str:
+    """index.html text loading the engine from engine_dir"""
+    rel = Path(os.path.relpath(engine_dir, export.html.parent)).as_posix()
+    exe = export.executable
+    config = dict(export.config)
+    config["executable"] = f"{rel}/{exe}"
+    # The main pack stays next to the page; Godot derives it from the executable otherwise
+    if not config.get("mainPack"):
+        config["mainPack"] = f"{exe}.pck"
+    if isinstance(config.get("fileSizes"), dict):
+        file_sizes = dict(config["fileSizes"])
+        for suffix in SIZED_SUFFIXES:
+            if f"{exe}{suffix}" in file_sizes:
+                file_sizes[f"{rel}/{exe}{suffix}"] = file_sizes.pop(f"{exe}{suffix}")
+        config["fileSizes"] = file_sizes
+
+    start, end = export.config_span
+    text = export.text[:start] + json.dumps(config, separators=(",", ":")) + export.text[end:]
+    script_pattern = re.compile(r'(<script\b[^>]*\bsrc=)(["\'])' + re.escape(f"{exe}.js") + r'\2')
+    return script_pattern.sub(lambda m: f"{m.group(1)}{m.group(2)}{rel}/{exe}.js{m.group(2)}", text)
+
+
+def dedupe_engines(artifact_dir: Path, roots: Iterable[Path],
+                   stats: Optional[TreeStats] = None,
+                   max_workers: Optional[int] = None) -> EngineDedupeResult:
+    """
+    Share engine files between the web exports below roots
+
+    Args:
+        artifact_dir: Artifact root; shared engines go to artifact_dir/engine/<hash>/
+        roots: Directories searched for web exports
+        stats: Artifact statistics to update for moved and rewritten files
+        max_workers: Threads hashing engine files (default: see file_hasher.hash_files)
+
+    Returns:
+        EngineDedupeResult
+    """
+    result = EngineDedupeResult()
+    engines_root = artifact_dir / ENGINE_DIR
+
+    # Only exports whose engine file names and sizes collide can share an engine,
+    # so everything else is never hashed
+    candidates: Dict[Tuple, List[WebExport]] = {}
+    for export in find_web_exports(roots):
+        candidates.setdefault(export.identity(), []).append(export)
+    to_hash = [export for group in candidates.values() if len(group) > 1 for export in group]
+
+    groups: Dict[str, List[WebExport]] = {}
+    if to_hash:
+        digests = file_hasher.hash_files({path for export in to_hash for path in export.files.values()},
+                                         max_workers=max_workers, hexdigest=True)
+        for export in to_hash:
+            if any(digests[path] is None for path in export.files.values()):
+                continue
+            digest = file_hasher.new_hasher()
+            digest.update(export.executable.encode("utf-8"))
+            for suffix in sorted(export.files):
+                digest.update(f"{suffix}:{digests[export.files[suffix]]}".encode("utf-8"))
+            groups.setdefault(digest.hexdigest()[:ENGINE_HASH_LENGTH], []).append(export)
+
+    used = set()
+    for engine_hash, exports in sorted(groups.items()):
+        if len(exports) < 2:
+            continue
+        used.add(engine_hash)
+        engine_dir = engines_root / engine_hash
+        first = exports[0]
+        engine_dir.mkdir(parents=True, exist_ok=True)
+        for suffix, path in first.files.items():
+            target = engine_dir / path.name
+            # Kept from a previous run when still the same engine
+            if not (target.exists() and target.stat().st_size == first.sizes[suffix]):
+                if target.exists():
+                    target.unlink()
+                try:
+                    os.link(path, target)
+                except OSError:
+                    shutil.copy2(path, target)
+            if stats is not None:
+                stats.add(target.name, first.sizes[suffix])
+
+        for export in exports:
+            content = _point_to_engine(export, engine_dir).encode("utf-8")
+            _write_atomic(export.html, content)
+            for suffix, path in export.files.items():
+                path.unlink()
+                if stats is not None:
+                    stats.remove(path.name, export.sizes[suffix])
+            if stats is not None:
+                stats.remove(export.html.name, len(export.text.encode("utf-8")))
+                stats.add(export.html.name, len(content))
+            result.shared[export.html] = engine_dir
+
+        result.engines += 1
+        result.exports += len(exports)
+        result.bytes_saved += (len(exports) - 1) * sum(first.sizes.values())
+
+    # Engines no export loads any more
+    if engines_root.is_dir():
+        for engine_dir in engines_root.iterdir():
+            if engine_dir.is_dir() and engine_dir.name not in used:
+                shutil.rmtree(engine_dir)
+                result.removed_engines += 1
+        if not any(engines_root.iterdir()):
+            engines_root.rmdir()
+
+    return result
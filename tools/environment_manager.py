@@ -8,36 +8,230 @@ This module encapsulates all the logic for setting up a complete Godot build env
 
 import os
 import sys
+import json
 import platform
-import tempfile
+import tarfile
 import zipfile
-import urllib.request
-import urllib.error
-import time
-import socket
 from pathlib import Path
-from typing import Optional, Tuple, Dict, List
+from typing import Any, Callable, Optional, Tuple, Dict, List
 import subprocess
 import shutil
 
 try:
     from .progress_reporter import ProgressReporter
+    from .downloader import Downloader, DownloadError, SHA512_SUMS_NAME, file_sha512
 except ImportError:
     # Fallback for CLI execution
     import sys
     import os
     sys.path.append(os.path.dirname(__file__))
     from progress_reporter import ProgressReporter
+    from downloader import Downloader, DownloadError, SHA512_SUMS_NAME, file_sha512
+
+
+# Toolchain store location (override with this environment variable)
+TOOLCHAIN_STORE_ENV = "GODOT_TOOLCHAIN_STORE"
+DEFAULT_TOOLCHAIN_STORE = Path.home() / ".cache" / "godot-ci" / "toolchains"
+
+# Written last into a store entry; entries without it are incomplete
+ENTRY_MARKER = "toolchain.json"
+
+STORE_KINDS = ("godot", "templates")
+
+# Export template file name prefixes per platform; "all" installs the whole archive
+TEMPLATE_PLATFORMS = {
+    "web": ("web_",),
+    "linux": ("linux_",),
+    "windows": ("windows_",),
+    "macos": ("macos",),
+    "android": ("android_",),
+    "ios": ("ios",),
+}
+DEFAULT_TEMPLATE_PLATFORMS = ("web",)
+TEMPLATE_VERSION_FILE = "version.txt"
+
+
+def normalize_template_platforms(platforms) -> Tuple[str, ...]:
+    """Sorted, validated platform names; ("all",) when every template is wanted"""
+    names = {name.strip().lower() for name in (platforms or DEFAULT_TEMPLATE_PLATFORMS) if name.strip()}
+    if "all" in names:
+        return ("all",)
+    unknown = names - set(TEMPLATE_PLATFORMS)
+    if unknown:
+        raise ValueError(f"Unknown export template platforms: {', '.join(sorted(unknown))}. "
+                         f"Supported: {', '.join(TEMPLATE_PLATFORMS)}, all")
+    return tuple(sorted(names))
+
+
+def select_template_members(zip_file: zipfile.ZipFile, platforms: Tuple[str, ...]) -> List[zipfile.ZipInfo]:
+    """Members of an export templates archive needed for platforms (plus version.txt)"""
+    prefixes = tuple(prefix for name in platforms for prefix in TEMPLATE_PLATFORMS.get(name, ()))
+    members = []
+    for info in zip_file.infolist():
+        if info.is_dir():
+            continue
+        file_name = info.filename.rsplit("/", 1)[-1]
+        if platforms == ("all",) or file_name == TEMPLATE_VERSION_FILE or file_name.startswith(prefixes):
+            members.append(info)
+    return members
+
+
+def atomic_symlink(target, link: Path):
+    """Point link at target with a single rename, whatever link was before"""
+    link.parent.mkdir(parents=True, exist_ok=True)
+    temp_link = link.with_name(f".{link.name}.{os.getpid()}.link")
+    if os.path.lexists(temp_link):
+        os.unlink(temp_link)
+    os.symlink(target, temp_link, target_is_directory=Path(link.parent, target).is_dir())
+    if link.is_dir() and not link.is_symlink():
+        # A directory copied by an older install cannot be renamed over
+        shutil.rmtree(link)
+    os.replace(temp_link, link)
+
+
+class ToolchainStore:
+    """Side-by-side, content-addressed store of Godot binaries and export templates
+    
+    Each install is kept in <kind>/<name>@<archive hash>/ and never changes once
+    complete; <kind>/<name> is a relative symlink to the entry in use. The
+    system locations (the godot binary, the export templates directory) are
+    symlinks into the store swapped with an atomic rename, so several
+    versions stay installed and switching is constant time. The whole store
+    packs into one tarball for CI caches.
+    """
+    
+    def __init__(self, root: Optional[Path] = None, progress_reporter: Optional[ProgressReporter] = None):
+        self.root = Path(root or os.environ.get(TOOLCHAIN_STORE_ENV) or DEFAULT_TOOLCHAIN_STORE)
+        self.progress = progress_reporter or ProgressReporter()
+        self.downloads_dir = self.root / "downloads"
+        self.added = 0
+    
+    def lookup(self, kind: str, name: str) -> Optional[Path]:
+        """Complete entry currently selected for name, without touching the network"""
+        pointer = self.root / kind / name
+        if not pointer.is_symlink():
+            return None
+        entry = pointer.resolve()
+        return entry if (entry / ENTRY_MARKER).is_file() else None
+    
+    def metadata(self, entry: Path) -> Dict[str, Any]:
+        with open(entry / ENTRY_MARKER, 'r') as f:
+            return json.load(f)
+    
+    def add(self, kind: str, name: str, archive_hash: str,
+            populate: Callable[[Path], Optional[Dict[str, Any]]], replace: bool = False,
+            variant: Optional[str] = None) -> Path:
+        """
+        Create (or reuse) the entry for an archive and select it for name
+        
+        Args:
+            kind: "godot" or "templates"
+            name: Version (binaries) or template version (templates)
+            archive_hash: SHA-512 of the archive the entry is built from
+            populate: Fills the entry directory it is given; returns extra metadata
+            replace: Rebuild the entry even if it is already complete
+            variant: Distinguishes entries built from the same archive with
+                different contents (e.g. a subset of template platforms)
+        
+        Returns:
+            Entry directory
+        """
+        kind_dir = self.root / kind
+        kind_dir.mkdir(parents=True, exist_ok=True)
+        entry = kind_dir / f"{name}@{archive_hash[:16]}{'+' + variant if variant else ''}"
+        
+        if replace or not (entry / ENTRY_MARKER).is_file():
+            temp_dir = kind_dir / f".{entry.name}.{os.getpid()}.tmp"
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+            temp_dir.mkdir()
+            try:
+                info = populate(temp_dir) or {}
+                with open(temp_dir / ENTRY_MARKER, 'w') as f:
+                    json.dump({"kind": kind, "name": name, "archive_sha512": archive_hash, **info}, f, indent=2)
+                if entry.exists():
+                    shutil.rmtree(entry)
+                os.rename(temp_dir, entry)
+            except BaseException:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                raise
+            self.added += 1
+        
+        atomic_symlink(entry.name, kind_dir / name)
+        return entry
+    
+    def activate(self, target: Path, link: Path):
+        """Make link (a system location) point at target inside the store"""
+        try:
+            atomic_symlink(target, link)
+        except OSError:
+            # No symlink support (e.g. Windows without developer mode): copy instead
+            if target.is_dir():
+                if link.exists():
+                    shutil.rmtree(link)
+                shutil.copytree(target, link)
+            else:
+                shutil.copy2(target, link)
+    
+    def pack(self, tar_path: Path) -> int:
+        """Write every complete entry and selection to a tarball, returning the entry count"""
+        tar_path = Path(tar_path)
+        tar_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = tar_path.with_name(f".{tar_path.name}.{os.getpid()}.tmp")
+        entries = 0
+        with tarfile.open(temp_path, "w") as tar:
+            for kind in STORE_KINDS:
+                kind_dir = self.root / kind
+                if not kind_dir.is_dir():
+                    continue
+                for item in sorted(kind_dir.iterdir()):
+                    if item.name.startswith("."):
+                        continue
+                    if item.is_symlink():
+                        tar.add(item, arcname=f"{kind}/{item.name}")
+                    elif (item / ENTRY_MARKER).is_file():
+                        tar.add(item, arcname=f"{kind}/{item.name}")
+                        entries += 1
+        os.replace(temp_path, tar_path)
+        self.progress.info(f"📦 Packed {entries} toolchain entries into {tar_path}")
+        return entries
+    
+    def restore(self, tar_path: Path) -> bool:
+        """Unpack a tarball written by pack() into the store"""
+        try:
+            with tarfile.open(tar_path, "r") as tar:
+                members = [member for member in tar.getmembers()
+                           if member.name.split("/", 1)[0] in STORE_KINDS]
+                self.root.mkdir(parents=True, exist_ok=True)
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(self.root, members=members, filter="data")
+                else:
+                    for member in members:
+                        if member.name.startswith("/") or ".." in member.name.split("/"):
+                            raise tarfile.TarError(f"unsafe path in toolchain tarball: {member.name}")
+                    tar.extractall(self.root, members=members)
+        except (OSError, tarfile.TarError) as e:
+            self.progress.warning(f"⚠️  Could not restore toolchain store from {tar_path}: {e}")
+            return False
+        self.progress.info(f"📦 Restored toolchain store from {tar_path}")
+        return True
 
 
 class GodotEnvironmentManager:
     """Manages Godot engine installation and export templates"""
     
-    def __init__(self, progress_reporter: Optional[ProgressReporter] = None, config=None):
+    def __init__(self, progress_reporter: Optional[ProgressReporter] = None, config=None,
+                 store: Optional[ToolchainStore] = None, template_platforms: Optional[List[str]] = None):
         self.progress = progress_reporter or ProgressReporter()
+        self.store = store or ToolchainStore(progress_reporter=self.progress)
+        # Only these platforms' export templates are extracted from the archive
+        self.template_platforms = normalize_template_platforms(
+            template_platforms or getattr(config, 'export_platforms', None))
         self.system = platform.system().lower()
         self.arch = platform.machine().lower()
         self.config = config
+        # Release base URL -> published SHA-512 sums
+        self._checksums: Dict[str, Dict[str, str]] = {}
         
         # Set logging preferences first (before platform info logging)
         self.verbose_downloads = (config and 
@@ -177,185 +371,166 @@ class GodotEnvironmentManager:
                 return version
             return f"{version}.stable"
     
-    def download_file(self, url: str, destination: Path, description: str = "file", retries: int = 3) -> bool:
-        """Download a file with progress reporting and retry logic"""
-        for attempt in range(retries):
-            try:
-                if attempt > 0:
-                    self.progress.info(f"📥 Retrying download {description} (attempt {attempt + 1}/{retries})...")
-                else:
-                    self.progress.info(f"📥 Downloading {description}...")
-                
-                if attempt == 0 and self.verbose_downloads:  # Only show URL on first attempt and if verbose
-                    self.progress.info(f"🔗 URL: {url}")
-                
-                # Set timeout for the request
-                request = urllib.request.Request(url)
-                # Set socket timeout to prevent hanging
-                socket.setdefaulttimeout(60)
-                
-                with urllib.request.urlopen(request, timeout=60) as response:
-                    total_size = int(response.headers.get('content-length', 0))
-                    
-                    with open(destination, 'wb') as f:
-                        downloaded = 0
-                        last_progress = -1
-                        last_update_time = time.time()
-                        
-                        while True:
-                            start_time = time.time()
-                            chunk = response.read(8192)
-                            if not chunk:
-                                break
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            current_time = time.time()
-                            
-                            if total_size > 0 and self.show_progress:
-                                progress = (downloaded / total_size) * 100
-                                # In CI mode, update less frequently to reduce log spam
-                                update_threshold = 5.0 if self.ci_mode else 1.0
-                                update_interval = 10.0 if self.ci_mode else 2.0
-                                
-                                if (abs(progress - last_progress) >= update_threshold or 
-                                    current_time - last_update_time >= update_interval):
-                                    self.progress.update_progress(f"Downloading {description}", progress)
-                                    last_progress = progress
-                                    last_update_time = current_time
-                            
-                            # Detect if download is stalled (no data for 30 seconds)
-                            if current_time - start_time > 30:
-                                raise TimeoutError("Download stalled - no data received for 30 seconds")
-                
-                # Clear the progress line and show completion
-                if self.show_progress:
-                    print()  # New line to clear progress bar
-                self.progress.success(f"✅ Downloaded {description}")
-                return True
-                
-            except (urllib.error.URLError, socket.timeout, TimeoutError) as e:
-                if self.show_progress:
-                    print()  # New line to clear progress bar
-                if attempt < retries - 1:
-                    self.progress.warning(f"⚠️  Download attempt {attempt + 1} failed: {e}")
-                    if not self.ci_mode:
-                        self.progress.info("🔄 Waiting 5 seconds before retry...")
-                        time.sleep(5)
-                    else:
-                        time.sleep(2)  # Shorter wait in CI
-                else:
-                    self.progress.error(f"❌ Failed to download {description} after {retries} attempts: {e}")
-                    return False
-            except Exception as e:
-                if self.show_progress:
-                    print()  # New line to clear progress bar
-                self.progress.error(f"❌ Unexpected error downloading {description}: {e}")
-                return False
+    def download_file(self, url: str, destination: Path, description: str = "file", retries: int = 3,
+                      sha512: Optional[str] = None) -> bool:
+        """Download a file in resumable parallel segments, verifying sha512 when given"""
+        self.progress.info(f"📥 Downloading {description}...")
+        if self.verbose_downloads:
+            self.progress.info(f"🔗 URL: {url}")
         
-        return False
-    
-    def install_godot_binary(self, version: str, install_path: Optional[Path] = None) -> Optional[Path]:
-        """Download and install Godot binary"""
+        downloader = Downloader(self.progress, retries=retries,
+                                show_progress=self.show_progress, ci_mode=self.ci_mode)
+        try:
+            downloader.download(url, destination, description, sha512=sha512)
+        except DownloadError as e:
+            self.progress.error(f"❌ {e}")
+            return False
+        except Exception as e:
+            self.progress.error(f"❌ Unexpected error downloading {description}: {e}")
+            return False
         
-        binary_url, _ = self.get_godot_urls(version)
+        self.progress.success(f"✅ Downloaded {description}")
+        return True
+    
+    def published_sha512(self, url: str) -> Optional[str]:
+        """SHA-512 of a release file from the release's published sums, if available"""
+        base_url, file_name = url.rsplit("/", 1)
+        if base_url not in self._checksums:
+            self._checksums[base_url] = Downloader(self.progress).fetch_checksums(f"{base_url}/{SHA512_SUMS_NAME}")
+            if not self._checksums[base_url]:
+                self.progress.warning(f"⚠️  No {SHA512_SUMS_NAME} published for this release, skipping checksum verification")
+        return self._checksums[base_url].get(file_name)
+    
+    def _templates_base(self) -> Path:
+        """Directory Godot looks for export templates in"""
+        if self.system == "windows":
+            return Path(os.environ.get("APPDATA", "")) / "Godot" / "export_templates"
+        return Path.home() / ".local" / "share" / "godot" / "export_templates"
+    
+    def _default_binary_path(self) -> Path:
+        if self.system == "windows":
+            return Path("C:/Program Files/Godot/godot.exe")
+        return Path("/usr/local/bin/godot")
+    
+    def _download_archive(self, url: str, description: str) -> Optional[Tuple[Path, str]]:
+        """Download a release archive into the store, returning it with its SHA-512"""
+        archive = self.store.downloads_dir / url.rsplit("/", 1)[1]
+        published = self.published_sha512(url)
+        if not self.download_file(url, archive, description, sha512=published):
+            return None
+        return archive, published or file_sha512(archive)
+    
+    def install_godot_binary(self, version: str, install_path: Optional[Path] = None,
+                             force: bool = False) -> Optional[Path]:
+        """Install Godot into the toolchain store (unless present) and make it the system godot"""
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            zip_path = temp_path / "godot.zip"
-            
-            # Download binary
-            if not self.download_file(binary_url, zip_path, f"Godot {version}"):
+        entry = None if force else self.store.lookup("godot", version)
+        if entry is None:
+            binary_url, _ = self.get_godot_urls(version)
+            downloaded = self._download_archive(binary_url, f"Godot {version}")
+            if downloaded is None:
                 return None
+            archive, archive_hash = downloaded
             
-            # Extract binary
-            try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_file:
-                    zip_file.extractall(temp_path)
-                
+            def populate(entry_dir: Path) -> Dict[str, Any]:
+                with zipfile.ZipFile(archive, 'r') as zip_file:
+                    zip_file.extractall(entry_dir)
                 # Find the extracted binary
-                extracted_files = list(temp_path.glob("Godot_v*"))
+                extracted_files = sorted(entry_dir.glob("Godot_v*"))
                 if not extracted_files:
-                    self.progress.error("❌ No Godot binary found in archive")
-                    return None
-                
-                binary_file = extracted_files[0]
-                
-                # Determine install location
-                if install_path is None:
-                    if self.system == "windows":
-                        install_path = Path("C:/Program Files/Godot/godot.exe")
-                    else:
-                        install_path = Path("/usr/local/bin/godot")
-                
-                # Create install directory if needed
-                install_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Copy binary to install location
-                shutil.copy2(binary_file, install_path)
-                
-                # Make executable on Unix systems
-                if self.system != "windows":
-                    os.chmod(install_path, 0o755)
-                
-                self.progress.success(f"✅ Godot {version} installed to {install_path}")
-                return install_path
-                
+                    raise FileNotFoundError("No Godot binary found in archive")
+                if self.system != "windows" and extracted_files[0].is_file():
+                    os.chmod(extracted_files[0], 0o755)
+                return {"executable": extracted_files[0].name}
+            
+            try:
+                entry = self.store.add("godot", version, archive_hash, populate, replace=force)
             except Exception as e:
                 self.progress.error(f"❌ Failed to extract Godot binary: {e}")
                 return None
-    
-    def install_export_templates(self, version: str) -> bool:
-        """Download and install export templates"""
+            archive.unlink()
         
-        _, templates_url = self.get_godot_urls(version)
-        template_version = self._get_template_version_format(version)
+        binary = entry / self.store.metadata(entry)["executable"]
+        install_path = install_path or self._default_binary_path()
+        try:
+            self.store.activate(binary, install_path)
+        except OSError as e:
+            self.progress.error(f"❌ Failed to install Godot binary to {install_path}: {e}")
+            return None
         
-        # Get templates directory
-        if self.system == "windows":
-            templates_base = Path(os.environ.get("APPDATA", "")) / "Godot" / "export_templates"
-        else:
-            templates_base = Path.home() / ".local" / "share" / "godot" / "export_templates"
+        self.progress.success(f"✅ Godot {version} installed to {install_path} (from {entry.name})")
+        return install_path
+    
+    def _templates_entry(self, template_version: str) -> Optional[Path]:
+        """Selected templates entry, if it holds every platform this manager needs"""
+        entry = self.store.lookup("templates", template_version)
+        if entry is None:
+            return None
+        platforms = self.store.metadata(entry).get("platforms", ["all"])
+        if "all" in platforms or set(self.template_platforms) <= set(platforms):
+            return entry
+        return None
+    
+    def _extract_templates(self, archive: Path, entry_dir: Path, template_version: str) -> Dict[str, Any]:
+        """Stream the members for the enabled platforms straight into entry_dir"""
+        with zipfile.ZipFile(archive, 'r') as zip_file:
+            members = select_template_members(zip_file, self.template_platforms)
+            total = sum(info.file_size for info in members)
+            self.progress.info(f"📦 Extracting {len(members)} export templates for "
+                               f"{', '.join(self.template_platforms)} ({total / (1024 * 1024):.1f} MB)...")
+            for info in members:
+                target = entry_dir / info.filename.rsplit("/", 1)[-1]
+                with zip_file.open(info) as source, open(target, 'wb') as dest:
+                    shutil.copyfileobj(source, dest, 1024 * 1024)
+                mode = (info.external_attr >> 16) & 0o777
+                if mode & 0o111:
+                    target.chmod(mode)
         
-        templates_dir = templates_base / template_version
-        templates_dir.mkdir(parents=True, exist_ok=True)
+        # Create version.txt
+        (entry_dir / TEMPLATE_VERSION_FILE).write_text(template_version)
+        return {"platforms": list(self.template_platforms), "files": sorted(info.filename.rsplit("/", 1)[-1]
+                                                                            for info in members)}
+    
+    def install_export_templates(self, version: str, force: bool = False) -> bool:
+        """Install export templates into the toolchain store (unless present) and activate them"""
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            tpz_path = temp_path / "export_templates.tpz"
-            
-            # Download templates
-            if not self.download_file(templates_url, tpz_path, f"export templates {version}"):
+        template_version = self._get_template_version_format(version)
+        
+        entry = None if force else self._templates_entry(template_version)
+        if entry is None:
+            _, templates_url = self.get_godot_urls(version)
+            downloaded = self._download_archive(templates_url, f"export templates {version}")
+            if downloaded is None:
                 return False
+            archive, archive_hash = downloaded
+            variant = None if self.template_platforms == ("all",) else "-".join(self.template_platforms)
             
-            # Extract templates
             try:
-                self.progress.info("📦 Extracting export templates...")
-                
-                with zipfile.ZipFile(tpz_path, 'r') as zip_file:
-                    extract_path = temp_path / "templates"
-                    zip_file.extractall(extract_path)
-                
-                # Find templates source directory
-                templates_source = extract_path / "templates" if (extract_path / "templates").exists() else extract_path
-                
-                # Copy templates to install directory
-                for item in templates_source.iterdir():
-                    if item.is_file():
-                        dest = templates_dir / item.name
-                        shutil.copy2(item, dest)
-                        self.progress.info(f"📦 Copied {item.name}")
-                
-                # Create version.txt
-                version_file = templates_dir / "version.txt"
-                version_file.write_text(template_version)
-                
-                self.progress.success(f"✅ Export templates installed to {templates_dir}")
-                return True
-                
+                entry = self.store.add("templates", template_version, archive_hash,
+                                       lambda entry_dir: self._extract_templates(archive, entry_dir, template_version),
+                                       replace=force, variant=variant)
             except Exception as e:
                 self.progress.error(f"❌ Failed to extract export templates: {e}")
                 return False
+            archive.unlink()
+        
+        templates_dir = self._templates_base() / template_version
+        try:
+            self.store.activate(entry, templates_dir)
+        except OSError as e:
+            self.progress.error(f"❌ Failed to install export templates to {templates_dir}: {e}")
+            return False
+        
+        self.progress.success(f"✅ Export templates installed to {templates_dir} (from {entry.name})")
+        return True
+    
+    def activate_installed(self, version: str, install_path: Optional[Path] = None) -> bool:
+        """Activate version straight from the toolchain store if it holds both components"""
+        binary_entry = self.store.lookup("godot", version)
+        templates_entry = self._templates_entry(self._get_template_version_format(version))
+        if binary_entry is None or templates_entry is None:
+            return False
+        return bool(self.install_godot_binary(version, install_path) and self.install_export_templates(version))
     
     def verify_installation(self, version: str, godot_path: Optional[Path] = None) -> Dict[str, bool]:
         """Verify Godot installation and export templates"""
@@ -392,15 +567,21 @@ class GodotEnvironmentManager:
         
         # Check export templates
         template_version = self._get_template_version_format(version)
-        if self.system == "windows":
-            templates_dir = Path(os.environ.get("APPDATA", "")) / "Godot" / "export_templates" / template_version
-        else:
-            templates_dir = Path.home() / ".local" / "share" / "godot" / "export_templates" / template_version
+        templates_dir = self._templates_base() / template_version
         
         if templates_dir.exists():
             results["export_templates"] = True
             self.progress.success(f"✅ Export templates directory found: {templates_dir}")
             
+            # Every enabled platform needs at least one of its templates
+            if self.template_platforms != ("all",):
+                names = [f.name for f in templates_dir.iterdir()]
+                missing = [name for name in self.template_platforms
+                           if not any(file_name.startswith(TEMPLATE_PLATFORMS[name]) for file_name in names)]
+                if missing:
+                    results["export_templates"] = False
+                    self.progress.warning(f"⚠️  No export templates for: {', '.join(missing)}")
+            
             # Check for web templates specifically
             web_templates = [
                 "web_debug.zip",
@@ -435,6 +616,10 @@ class GodotEnvironmentManager:
         
         # Check if already installed and working
         if not force_reinstall:
+            # Warm runner: both components are in the toolchain store, only links change
+            if self.activate_installed(version):
+                self.progress.success(f"✅ Godot {version} activated from toolchain store {self.store.root}")
+                return True
             verification = self.verify_installation(version)
             if all(verification.values()):
                 self.progress.success("✅ Godot environment already set up and verified")
@@ -442,13 +627,13 @@ class GodotEnvironmentManager:
         
         # Install Godot binary
         self.progress.info("📥 Installing Godot binary...")
-        godot_path = self.install_godot_binary(version)
+        godot_path = self.install_godot_binary(version, force=force_reinstall)
         if not godot_path:
             return False
         
         # Install export templates
         self.progress.info("📥 Installing export templates...")
-        if not self.install_export_templates(version):
+        if not self.install_export_templates(version, force=force_reinstall):
             return False
         
         # Verify installation
@@ -467,11 +652,23 @@ class GodotEnvironmentManager:
 
 
 def setup_godot_environment(version: str, force_reinstall: bool = False, 
-                           progress_reporter: Optional[ProgressReporter] = None) -> bool:
-    """Convenience function to set up Godot environment"""
+                           progress_reporter: Optional[ProgressReporter] = None,
+                           toolchain_cache: Optional[Path] = None,
+                           template_platforms: Optional[List[str]] = None) -> bool:
+    """Convenience function to set up Godot environment
+    
+    With toolchain_cache, the toolchain store is restored from that tarball
+    first and packed back into it when setup added to the store.
+    template_platforms selects the export templates to install (default: web).
+    """
     
-    manager = GodotEnvironmentManager(progress_reporter)
-    return manager.setup_environment(version, force_reinstall)
+    manager = GodotEnvironmentManager(progress_reporter, template_platforms=template_platforms)
+    if toolchain_cache and Path(toolchain_cache).exists() and not force_reinstall:
+        manager.store.restore(toolchain_cache)
+    success = manager.setup_environment(version, force_reinstall)
+    if success and toolchain_cache and (manager.store.added or not Path(toolchain_cache).exists()):
+        manager.store.pack(toolchain_cache)
+    return success
 
 
 if __name__ == "__main__":
@@ -482,15 +679,19 @@ if __name__ == "__main__":
     parser.add_argument("version", help="Godot version to install")
     parser.add_argument("--force", action="store_true", help="Force reinstall")
     parser.add_argument("--verify-only", action="store_true", help="Only verify existing installation")
+    parser.add_argument("--toolchain-cache", type=Path, help="Restore the toolchain store from / pack it into this tarball")
+    parser.add_argument("--template-platforms", nargs="+", metavar="PLATFORM",
+                        help=f"Export templates to install: {', '.join(TEMPLATE_PLATFORMS)} or all (default: web)")
     
     args = parser.parse_args()
     
-    manager = GodotEnvironmentManager()
+    manager = GodotEnvironmentManager(template_platforms=args.template_platforms)
     
     if args.verify_only:
         verification = manager.verify_installation(args.version)
         print(f"Verification results: {verification}")
         sys.exit(0 if all(verification.values()) else 1)
     else:
-        success = manager.setup_environment(args.version, args.force)
+        success = setup_godot_environment(args.version, args.force, toolchain_cache=args.toolchain_cache,
+                                          template_platforms=args.template_platforms)
         sys.exit(0 if success else 1)
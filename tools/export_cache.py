@@ -0,0 +1,206 @@
+"""
+Export Cache
+============
+
+Content-addressed cache for Godot web exports.
+Completed export trees are stored under a key derived from every input the
+export depends on, so an unchanged project can be restored without launching Godot.
+Least recently used entries are evicted once the cache exceeds its size budget.
+"""
+
+import os
+import shutil
+import hashlib
+import json
+import tempfile
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import List, Optional, Iterable, Tuple
+
+try:
+    from .progress_reporter import ProgressReporter
+    from . import file_hasher
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    import file_hasher
+
+
+# Directories inside a project that are outputs or editor state, never export inputs
+EXCLUDED_INPUT_DIRS = {".git", ".godot", ".import", "exports", "__pycache__"}
+
+# Documentation Godot does not export unless the preset's include_filter asks for it
+DOC_SUFFIXES = (".md",)
+
+# Bump when the key layout changes so stale entries are never restored
+CACHE_FORMAT_VERSION = "4"
+
+
+def parse_filter(value: str) -> List[str]:
+    """Globs of a preset include_filter/exclude_filter value"""
+    return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+
+
+def matches_filter(rel_path: str, patterns: List[str]) -> bool:
+    """Godot's filter matching: the glob matches the res:// path or its tail"""
+    return any(fnmatch(rel_path, pattern) or fnmatch(rel_path, f"*/{pattern}") for pattern in patterns)
+
+
+class ExportCache:
+    """Stores and restores exports/web trees keyed on project input hashes"""
+
+    def __init__(self, cache_dir: Path, progress_reporter: Optional[ProgressReporter] = None,
+                 budget_mb: int = 4096):
+        self.cache_dir = Path(cache_dir) / "exports"
+        self.progress = progress_reporter or ProgressReporter()
+        self.budget = budget_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+
+    def iter_input_files(self, project_path: Path, include_filter: str = "",
+                         exclude_filter: str = "") -> Iterable[Tuple[str, Path]]:
+        """
+        Yield (relative_path, path) for every export input in sorted order
+
+        Files matching the preset's exclude_filter are not inputs, and neither
+        are docs (README.md, ...) unless include_filter pulls them in.
+        """
+        includes = parse_filter(include_filter)
+        excludes = parse_filter(exclude_filter)
+        for root, dirs, files in os.walk(project_path):
+            dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_INPUT_DIRS)
+            for name in sorted(files):
+                file_path = Path(root) / name
+                rel_path = file_path.relative_to(project_path).as_posix()
+                if excludes and matches_filter(rel_path, excludes):
+                    continue
+                if name.lower().endswith(DOC_SUFFIXES) and not matches_filter(rel_path, includes):
+                    continue
+                yield rel_path, file_path
+
+    def compute_key(self, project_path: Path, godot_version: str = "", template_version: str = "",
+                    preset_hash: str = "", include_filter: str = "", exclude_filter: str = "") -> str:
+        """
+        Compute the cache key for a project export
+
+        Args:
+            project_path: Godot project directory
+            godot_version: Output of `godot --version` for the engine doing the export
+            template_version: Export template version the export is built against
+            preset_hash: Hash of the effective Web export preset (see PresetManager)
+            include_filter: The preset's include_filter (extra non-resource files exported)
+            exclude_filter: The preset's exclude_filter (files left out of the export)
+
+        Returns:
+            Hex digest identifying the export inputs
+        """
+        digest = hashlib.sha256()
+        digest.update(f"format:{CACHE_FORMAT_VERSION}\0".encode())
+        digest.update(f"hash:{file_hasher.ALGORITHM}\0".encode())
+        digest.update(f"godot:{godot_version}\0".encode())
+        digest.update(f"templates:{template_version}\0".encode())
+        digest.update(f"preset:{preset_hash}\0".encode())
+
+        # Hash file contents in parallel, then combine them in sorted path order
+        input_files = list(self.iter_input_files(project_path, include_filter, exclude_filter))
+        file_hashes = file_hasher.hash_files(file_path for _, file_path in input_files)
+
+        for rel_path, file_path in input_files:
+            content_hash = file_hashes[file_path]
+            if content_hash is None:
+                raise OSError(f"Could not read export input {rel_path}")
+            digest.update(rel_path.encode("utf-8") + b"\0")
+            digest.update(content_hash)
+
+        return digest.hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def restore(self, key: str, export_dir: Path) -> bool:
+        """Restore a cached export tree into export_dir, returning True on a hit"""
+        entry_dir = self._entry_dir(key)
+        tree_dir = entry_dir / "web"
+
+        if not (tree_dir / "index.html").exists():
+            self.misses += 1
+            return False
+
+        try:
+            if export_dir.exists():
+                shutil.rmtree(export_dir)
+            shutil.copytree(tree_dir, export_dir)
+            # Touch the entry so eviction can tell which entries are in use
+            os.utime(entry_dir)
+            self.hits += 1
+            return True
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not restore cached export {key[:12]}: {e}")
+            self.misses += 1
+            return False
+
+    def store(self, key: str, export_dir: Path, metadata: Optional[dict] = None) -> bool:
+        """Store a completed export tree under key"""
+        entry_dir = self._entry_dir(key)
+        if (entry_dir / "web" / "index.html").exists():
+            return True
+
+        try:
+            entry_dir.parent.mkdir(parents=True, exist_ok=True)
+
+            # Build the entry next to its final location, then rename it into place
+            # so concurrent exports never observe a half-written tree
+            staging_dir = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=entry_dir.parent))
+            shutil.copytree(export_dir, staging_dir / "web")
+            size = sum(f.stat().st_size for f in (staging_dir / "web").rglob("*") if f.is_file())
+            metadata = dict(metadata or {}, hash_algorithm=file_hasher.ALGORITHM, size=size)
+            (staging_dir / "metadata.json").write_text(json.dumps(metadata, indent=2))
+
+            try:
+                os.rename(staging_dir, entry_dir)
+            except OSError:
+                # Another worker stored the same key first
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            return True
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not store export in cache: {e}")
+            return False
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """(last used, size, entry dir) of every complete entry"""
+        entries = []
+        if not self.cache_dir.is_dir():
+            return entries
+        for shard in self.cache_dir.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry_dir in shard.iterdir():
+                if entry_dir.name.startswith("."):
+                    continue
+                try:
+                    size = json.loads((entry_dir / "metadata.json").read_text()).get("size")
+                    if size is None:
+                        size = sum(f.stat().st_size for f in entry_dir.rglob("*") if f.is_file())
+                    entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+                except (OSError, ValueError):
+                    continue
+        return entries
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits its budget"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry_dir in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.budget:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            evicted += 1
+        if evicted:
+            self.progress.info(f"🧹 Evicted {evicted} export cache entries to stay under "
+                               f"{self.budget // (1024 * 1024)} MB")
+        return evicted
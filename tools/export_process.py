@@ -0,0 +1,262 @@
+"""
+Export Process Runner
+=====================
+
+asyncio runner for Godot export processes.
+stdout and stderr are read line by line as the export runs: lines are
+streamed to the progress reporter, only a bounded tail is kept for error
+analysis, and known fatal output (missing export templates, std::system_error,
+...) kills the process at once instead of leaving it to the export timeout.
+Matched output also classifies a failed export as deterministic (never
+retried) or resource-bound (retried once resources free up).
+"""
+
+import os
+import re
+import signal
+import asyncio
+import subprocess
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple
+
+try:
+    from .progress_reporter import ProgressReporter
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+
+
+# Failure kinds: deterministic failures repeat with the same inputs and are never
+# retried; resource failures are retried once memory or descriptors free up
+FAILURE_DETERMINISTIC = "deterministic"
+FAILURE_RESOURCE = "resource"
+FAILURE_UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True)
+class FailurePattern:
+    """Known Godot export failure output"""
+    pattern: Pattern
+    kind: str
+    reason: str
+    hint: str
+    fatal: bool = False  # the export cannot succeed once this is printed: kill it at once
+
+
+# In order of precedence when several patterns match
+FAILURE_PATTERNS = [
+    FailurePattern(re.compile(r"std::system_error", re.IGNORECASE), FAILURE_RESOURCE,
+                   "std::system_error", "Likely file descriptor/resource limit reached. Try: ulimit -n 4096", True),
+    FailurePattern(re.compile(r"cannot allocate memory|out of memory", re.IGNORECASE), FAILURE_RESOURCE,
+                   "out of memory", "Insufficient memory, reduce parallel jobs with --jobs N", True),
+    FailurePattern(re.compile(r"too many open files", re.IGNORECASE), FAILURE_RESOURCE,
+                   "too many open files", "File descriptor limit exceeded, try: ulimit -n 4096", True),
+    FailurePattern(re.compile(r"resource temporarily unavailable", re.IGNORECASE), FAILURE_RESOURCE,
+                   "resource temporarily unavailable", "Process or thread limit reached, reduce concurrent exports"),
+    FailurePattern(re.compile(r"invalid argument", re.IGNORECASE), FAILURE_RESOURCE,
+                   "invalid argument", "Check file paths, permissions, or reduce concurrent exports"),
+    FailurePattern(re.compile(r"no export template found|export templates? (?:not found|missing)|template .*not found", re.IGNORECASE),
+                   FAILURE_DETERMINISTIC, "export templates missing",
+                   "Export templates missing, run: godot --export-debug Web", True),
+    FailurePattern(re.compile(r"invalid export preset name|export preset .*not found", re.IGNORECASE),
+                   FAILURE_DETERMINISTIC, "export preset missing",
+                   "No usable \"Web\" preset in export_presets.cfg", True),
+    FailurePattern(re.compile(r"parse error", re.IGNORECASE), FAILURE_DETERMINISTIC,
+                   "script parse error", "Fix the script parse errors reported by Godot"),
+    FailurePattern(re.compile(r"permission denied", re.IGNORECASE), FAILURE_DETERMINISTIC,
+                   "permission denied", "Permission error, check file/directory permissions"),
+    FailurePattern(re.compile(r"\bx11\b|cannot open display", re.IGNORECASE), FAILURE_UNKNOWN,
+                   "display error", "Display/X11 issue in headless environment, set DISPLAY=:0"),
+]
+
+# Signals that mean the OS ran out of something: SIGABRT from a failed
+# allocation or thread spawn, SIGKILL from the OOM killer
+RESOURCE_SIGNAL_CODES = {-6, -9}
+
+# Lines of each stream kept for error analysis
+OUTPUT_TAIL_LINES = 200
+
+# Longest line read as one line; longer ones are dropped from the tail
+STREAM_LIMIT = 1024 * 1024
+
+MEMORY_SAMPLE_INTERVAL = 0.5
+
+# Output still buffered after exit is read for at most this long
+READER_DRAIN_TIMEOUT = 5.0
+
+
+@dataclass
+class ExportProcessResult:
+    """Outcome of one Godot export process"""
+    cmd: List[str]
+    returncode: Optional[int] = None
+    stdout: str = ""
+    stderr: str = ""
+    peak_memory: int = 0
+    ceiling_hit: bool = False
+    failures: List[FailurePattern] = field(default_factory=list)  # matched while streaming
+    aborted: Optional[FailurePattern] = None  # fatal match the process was killed for
+    fatal_line: Optional[str] = None
+
+
+def match_failure(text: str) -> Optional[FailurePattern]:
+    """First known failure, in precedence order, found in text"""
+    for failure in FAILURE_PATTERNS:
+        if failure.pattern.search(text):
+            return failure
+    return None
+
+
+def classify_failure(result: ExportProcessResult) -> Tuple[str, Optional[FailurePattern]]:
+    """
+    Classify a failed export process
+
+    Returns:
+        Tuple of (failure kind, matched pattern or None)
+    """
+    if result.aborted is not None:
+        return result.aborted.kind, result.aborted
+    if result.ceiling_hit:
+        return FAILURE_RESOURCE, None
+    for kind in (FAILURE_DETERMINISTIC, FAILURE_RESOURCE):
+        for failure in result.failures:
+            if failure.kind == kind:
+                return kind, failure
+    if result.returncode in RESOURCE_SIGNAL_CODES:
+        return FAILURE_RESOURCE, None
+    return FAILURE_UNKNOWN, None
+
+
+def _kill(process):
+    """Kill the export and anything it spawned, which would otherwise hold its pipes open"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def run_export_process(cmd: List[str], cwd: Path, env: Dict[str, str], timeout: float,
+                             memory_ceiling: Optional[int] = None,
+                             progress_reporter: Optional[ProgressReporter] = None,
+                             label: Optional[str] = None) -> ExportProcessResult:
+    """
+    Run a Godot export process, streaming its output and sampling its memory use
+
+    Args:
+        cmd: Godot command line
+        cwd: Working directory for the process
+        env: Process environment
+        timeout: Seconds before the process is killed
+        memory_ceiling: Kill the process if its RSS exceeds this many bytes
+        progress_reporter: Receives output lines in verbose mode and early aborts
+        label: Prefix for streamed lines (default: name of cwd)
+
+    Returns:
+        ExportProcessResult with the tail of each stream
+
+    Raises:
+        subprocess.TimeoutExpired: The process ran longer than timeout
+    """
+    progress = progress_reporter or ProgressReporter()
+    label = label or Path(cwd).name
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd),
+        env=env,
+        limit=STREAM_LIMIT,
+        # Own process group so a kill also reaches Godot's child processes
+        start_new_session=hasattr(os, "killpg")
+    )
+
+    result = ExportProcessResult(cmd=list(cmd))
+    tails = {'stdout': deque(maxlen=OUTPUT_TAIL_LINES), 'stderr': deque(maxlen=OUTPUT_TAIL_LINES)}
+
+    async def pump(stream, name):
+        tail = tails[name]
+        while True:
+            try:
+                raw = await stream.readline()
+            except ValueError:
+                # Line longer than STREAM_LIMIT; the reader discarded it
+                continue
+            if not raw:
+                return
+            line = raw.decode('utf-8', errors='replace').rstrip()
+            tail.append(line)
+            if progress.verbose and line:
+                progress.info(f"   [{label}] {line}")
+
+            failure = match_failure(line)
+            if failure is None:
+                continue
+            if failure not in result.failures:
+                result.failures.append(failure)
+            if failure.fatal and result.aborted is None:
+                result.aborted = failure
+                result.fatal_line = line
+                progress.warning(f"⚠️ {label}: {failure.reason}, stopping export early")
+                _kill(process)
+
+    async def sample_memory():
+        try:
+            proc = psutil.Process(process.pid)
+            while True:
+                await asyncio.sleep(MEMORY_SAMPLE_INTERVAL)
+                rss = proc.memory_info().rss
+                for child in proc.children(recursive=True):
+                    try:
+                        rss += child.memory_info().rss
+                    except psutil.Error:
+                        pass
+                result.peak_memory = max(result.peak_memory, rss)
+                if memory_ceiling and rss > memory_ceiling:
+                    result.ceiling_hit = True
+                    _kill(process)
+                    return
+        except Exception:
+            # The process exited between samples
+            pass
+
+    readers = [
+        asyncio.create_task(pump(process.stdout, 'stdout')),
+        asyncio.create_task(pump(process.stderr, 'stderr')),
+    ]
+    sampler = asyncio.create_task(sample_memory()) if psutil is not None else None
+
+    try:
+        await asyncio.wait_for(process.wait(), timeout)
+    except asyncio.TimeoutError:
+        _kill(process)
+        await process.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    except asyncio.CancelledError:
+        _kill(process)
+        raise
+    finally:
+        if sampler:
+            sampler.cancel()
+        _, pending = await asyncio.wait(readers, timeout=READER_DRAIN_TIMEOUT)
+        for task in pending:
+            task.cancel()
+
+    result.returncode = process.returncode
+    result.stdout = "\n".join(tails['stdout'])
+    result.stderr = "\n".join(tails['stderr'])
+    if result.ceiling_hit:
+        result.stderr = f"Export killed: exceeded worker memory ceiling of {memory_ceiling // (1024 * 1024)} MB\n" + result.stderr
+    return result
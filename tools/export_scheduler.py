@@ -0,0 +1,155 @@
+"""
+Export Scheduler
+================
+
+Cost-aware ordering of Godot exports.
+Per-project export durations are persisted between runs so the slowest
+projects are dispatched first (longest-processing-time-first), which keeps
+one late heavy export from stretching the whole build.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+try:
+    from .progress_reporter import ProgressReporter
+    from .project_index import ProjectIndex
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    from project_index import ProjectIndex
+
+
+# Fallback cost model for projects without history: fixed engine startup
+# plus time proportional to the size of the project inputs
+DEFAULT_BASE_SECONDS = 5.0
+DEFAULT_SECONDS_PER_MB = 0.5
+
+
+class ExportHistory:
+    """Persistent per-project export statistics"""
+
+    def __init__(self, history_file: Path, progress_reporter: Optional[ProgressReporter] = None):
+        self.history_file = Path(history_file)
+        self.progress = progress_reporter or ProgressReporter()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        """Load history from disk"""
+        if not self.history_file.exists():
+            return
+        try:
+            with open(self.history_file, 'r') as f:
+                self.entries = json.load(f).get('projects', {})
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not load export history: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Save history to disk"""
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, 'w') as f:
+                json.dump({'projects': self.entries}, f, indent=2, sort_keys=True)
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not save export history: {e}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(key)
+
+    def record(self, key: str, **stats):
+        entry = self.entries.setdefault(key, {})
+        entry.update({k: v for k, v in stats.items() if v is not None})
+        entry['updated'] = time.time()
+
+
+class ExportScheduler:
+    """Orders exports longest-first using recorded history"""
+
+    def __init__(self, history: ExportHistory, base_dir: Path,
+                 progress_reporter: Optional[ProgressReporter] = None,
+                 project_index: Optional[ProjectIndex] = None):
+        self.history = history
+        self.base_dir = Path(base_dir)
+        self.progress = progress_reporter or ProgressReporter()
+        self.project_index = project_index
+        self.estimates: Dict[Path, float] = {}
+        self._input_sizes: Dict[Path, int] = {}
+
+    def project_key(self, project_path: Path) -> str:
+        try:
+            return project_path.resolve().relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return str(project_path.resolve())
+
+    def _input_size(self, project_path: Path) -> int:
+        """Total size of a project's files (without exports), from the project index"""
+        if project_path not in self._input_sizes:
+            if self.project_index is None:
+                self.project_index = ProjectIndex.build(self.base_dir, self.progress)
+            self._input_sizes[project_path] = sum(
+                size for _, size, _ in self.project_index.iter_project_files(project_path)
+            )
+        return self._input_sizes[project_path]
+
+    def _seconds_per_mb(self) -> float:
+        """Fit the size-based fallback rate to projects that do have history"""
+        rates = sorted(
+            (entry['export_time'] - DEFAULT_BASE_SECONDS) / (entry['input_size'] / (1024 * 1024))
+            for entry in self.history.entries.values()
+            if entry.get('export_time') and entry.get('input_size', 0) > 1024 * 1024
+        )
+        if not rates:
+            return DEFAULT_SECONDS_PER_MB
+        return max(0.0, rates[len(rates) // 2])
+
+    def estimate(self, project_path: Path) -> float:
+        """Estimate export duration in seconds for a project"""
+        entry = self.history.get(self.project_key(project_path))
+        if entry and entry.get('export_time'):
+            return float(entry['export_time'])
+        size_mb = self._input_size(project_path) / (1024 * 1024)
+        return DEFAULT_BASE_SECONDS + size_mb * self._seconds_per_mb()
+
+    def memory_estimate(self, project_path: Path) -> Optional[int]:
+        """Projected peak memory in bytes from history, with a safety margin"""
+        entry = self.history.get(self.project_key(project_path))
+        if entry and entry.get('peak_memory'):
+            return int(entry['peak_memory'] * 1.2)
+        return None
+
+    def order(self, project_files: List[Path]) -> List[Path]:
+        """Return project.godot paths sorted longest-processing-time-first"""
+        self.estimates = {pf: self.estimate(pf.parent) for pf in project_files}
+        return sorted(project_files, key=lambda pf: self.estimates[pf], reverse=True)
+
+    def predict_makespan(self, jobs: int) -> Dict[str, Any]:
+        """Predict build time for the last ordered project set"""
+        try:
+            from .parallel_manager import ParallelManager
+        except ImportError:
+            from parallel_manager import ParallelManager
+        return ParallelManager().estimate_build_time(
+            len(self.estimates), jobs=jobs, durations=list(self.estimates.values())
+        )
+
+    def record_results(self, results: List[Any]):
+        """Persist export_time/export_size from ExportResult objects"""
+        for result in results:
+            # Cache restores say nothing about how long a real export takes
+            if not result.success or result.cached or not result.export_time:
+                continue
+            self.history.record(
+                self.project_key(result.project_path),
+                export_time=round(result.export_time, 2),
+                export_size=result.export_size,
+                peak_memory=getattr(result, 'peak_memory', None),
+                input_size=self._input_size(result.project_path)
+            )
+        self.history.save()
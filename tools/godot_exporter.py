@@ -8,22 +8,51 @@ Replaces placeholder HTML exports with actual compiled Godot games.
 """
 
 import os
+import sys
 import subprocess
 import tempfile
 import shutil
+import errno
+import signal
+import asyncio
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union
 from dataclasses import dataclass
 import json
 
 try:
     from .progress_reporter import ProgressReporter
+    from .export_cache import ExportCache
+    from .export_scheduler import ExportScheduler
+    from .import_cache import ImportCache
+    from .project_index import ProjectIndex
+    from .preset_manager import PresetManager, PresetInfo
+    from .tree_stats import scan_tree
+    from .export_process import (run_export_process, classify_failure, match_failure,
+                                 FAILURE_DETERMINISTIC, FAILURE_RESOURCE, FAILURE_UNKNOWN)
 except ImportError:
     # Fallback for CLI execution
     import sys
     import os
     sys.path.append(os.path.dirname(__file__))
     from progress_reporter import ProgressReporter
+    from export_cache import ExportCache
+    from export_scheduler import ExportScheduler
+    from import_cache import ImportCache
+    from project_index import ProjectIndex
+    from preset_manager import PresetManager, PresetInfo
+    from tree_stats import scan_tree
+    from export_process import (run_export_process, classify_failure, match_failure,
+                                FAILURE_DETERMINISTIC, FAILURE_RESOURCE, FAILURE_UNKNOWN)
+
+
+# What a new pool worker copies from the shared Godot user dirs: the editor
+# settings and the shader cache, not everything else Godot keeps there
+WORKER_SEED_PATTERNS = {
+    "config": ("editor_settings-*.tres",),
+    "cache": ("shader_cache",),
+}
 
 
 @dataclass
@@ -35,15 +64,47 @@ class ExportResult:
     error_message: Optional[str] = None
     export_size: Optional[int] = None
     export_time: Optional[float] = None
+    cached: bool = False
+    peak_memory: Optional[int] = None
+    failure_kind: Optional[str] = None  # FAILURE_* from export_process
+    cache_key: Optional[str] = None  # export cache entry holding this export
+
+
+@dataclass
+class GodotWorker:
+    """An export slot owning private XDG config and cache dirs for the exports it runs"""
+    worker_id: int
+    home_dir: Path
+    memory_ceiling: Optional[int] = None  # bytes
+    
+    def environment(self) -> Dict[str, str]:
+        """Environment overrides giving this worker private editor settings and caches"""
+        if not sys.platform.startswith("linux"):
+            # Godot only honours the XDG split on Linux; elsewhere share the user dirs
+            return {}
+        # XDG_DATA_HOME is left alone so the installed export templates stay visible
+        return {
+            'XDG_CONFIG_HOME': str(self.home_dir / "config"),
+            'XDG_CACHE_HOME': str(self.home_dir / "cache"),
+        }
 
 
 class GodotExporter:
     """Handles Godot project exports to web format"""
     
-    def __init__(self, godot_binary: str = "godot", progress_reporter: Optional[ProgressReporter] = None):
+    def __init__(self, godot_binary: str = "godot", progress_reporter: Optional[ProgressReporter] = None,
+                 export_cache: Optional[ExportCache] = None, template_version: str = "",
+                 import_cache: Optional[ImportCache] = None, project_index: Optional[ProjectIndex] = None,
+                 preset_manager: Optional[PresetManager] = None):
         self.godot_binary = godot_binary
         self.progress = progress_reporter or ProgressReporter()
         self.web_export_preset = "Web"
+        self.export_cache = export_cache
+        self.import_cache = import_cache
+        self.project_index = project_index
+        self.preset_manager = preset_manager or PresetManager(progress_reporter=self.progress)
+        self.template_version = template_version
+        self._godot_version: Optional[str] = None
         
     def verify_godot_binary(self) -> bool:
         """Verify that Godot binary is available and working"""
@@ -58,97 +119,46 @@ class GodotExporter:
         except Exception:
             return False
     
+    def get_godot_version(self) -> str:
+        """Get the engine version string, queried once per exporter"""
+        if self._godot_version is None:
+            try:
+                result = subprocess.run(
+                    [self.godot_binary, "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                self._godot_version = result.stdout.strip() if result.returncode == 0 else ""
+            except Exception:
+                self._godot_version = ""
+        return self._godot_version
+    
     def create_web_export_preset(self, project_path: Path) -> bool:
         """Create or update web export preset for a project"""
-        export_presets_path = project_path / "export_presets.cfg"
-        
-        # Basic web export preset configuration
-        web_preset_config = """[preset.0]
-
-name="Web"
-platform="Web"
-runnable=true
-advanced_options=false
-dedicated_server=false
-custom_features=""
-export_filter="all_resources"
-include_filter=""
-exclude_filter=""
-export_path="exports/web/index.html"
-encryption_include_filters=""
-encryption_exclude_filters=""
-encrypt_pck=false
-encrypt_directory=false
-
-[preset.0.options]
-
-custom_template/debug=""
-custom_template/release=""
-variant/extensions_support=false
-vram_texture_compression/for_desktop=true
-vram_texture_compression/for_mobile=false
-html/export_icon=true
-html/custom_html_shell=""
-html/head_include=""
-html/canvas_resize_policy=2
-html/focus_canvas_on_start=true
-html/experimental_virtual_keyboard=false
-progressive_web_app/enabled=false
-progressive_web_app/offline_page=""
-progressive_web_app/display=1
-progressive_web_app/orientation=0
-progressive_web_app/icon_144x144=""
-progressive_web_app/icon_180x180=""
-progressive_web_app/icon_512x512=""
-progressive_web_app/background_color=Color(0, 0, 0, 1)
-"""
-        
+        return self._ensure_preset(project_path) is not None
+    
+    def _ensure_preset(self, project_path: Path) -> Optional[PresetInfo]:
         try:
-            # Write export presets
-            export_presets_path.write_text(web_preset_config)
-            return True
+            return self.preset_manager.ensure(project_path)
         except Exception as e:
             self.progress.error(f"Failed to create export preset: {e}")
-            return False
+            return None
     
-    def export_project_to_web(self, project_path: Path, force_rebuild: bool = False) -> ExportResult:
+    def export_project_to_web(self, project_path: Path, force_rebuild: bool = False,
+                              worker: Optional[GodotWorker] = None) -> ExportResult:
         """Export a single Godot project to web format"""
-        project_file = project_path / "project.godot"
-        if not project_file.exists():
-            return ExportResult(
-                success=False,
-                project_path=project_path,
-                export_path=Path(),
-                error_message="No project.godot file found"
-            )
-        
-        # Setup export directory
-        export_dir = project_path / "exports" / "web"
-        export_dir.mkdir(parents=True, exist_ok=True)
-        
-        export_file = export_dir / "index.html"
-        
-        # Check if export already exists and is newer than project files
-        if export_file.exists() and not force_rebuild:
-            if self._is_export_up_to_date(project_path, export_file):
-                return ExportResult(
-                    success=True,
-                    project_path=project_path,
-                    export_path=export_file,
-                    export_size=self._get_export_size(export_dir)
-                )
-        
-        # Create export preset if needed
-        if not self.create_web_export_preset(project_path):
-            return ExportResult(
-                success=False,
-                project_path=project_path,
-                export_path=export_file,
-                error_message="Failed to create export preset"
-            )
+        return asyncio.run(self.export_project_to_web_async(project_path, force_rebuild, worker))
+    
+    async def export_project_to_web_async(self, project_path: Path, force_rebuild: bool = False,
+                                          worker: Optional[GodotWorker] = None) -> ExportResult:
+        """Export a single Godot project to web format without blocking the event loop"""
+        prepared = await asyncio.to_thread(self._prepare_export, project_path, force_rebuild)
+        if isinstance(prepared, ExportResult):
+            return prepared
+        export_file, cache_key, start_time = prepared
         
         # Run Godot export
-        start_time = time.time()
         export_cmd = [
             self.godot_binary,
             "--headless",
@@ -165,41 +175,46 @@ progressive_web_app/background_color=Color(0, 0, 0, 1)
                 'GODOT_DISABLE_CRASH_HANDLER': '1',  # Disable crash handler for better error reporting
                 'DISPLAY': ':0' if 'DISPLAY' not in env else env['DISPLAY'],  # Ensure display is set
             })
+            if worker:
+                env.update(worker.environment())
             
-            result = subprocess.run(
+            result = await run_export_process(
                 export_cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
                 cwd=project_path,
-                env=env
+                env=env,
+                timeout=300,  # 5 minute timeout
+                memory_ceiling=worker.memory_ceiling if worker else None,
+                progress_reporter=self.progress,
+                label=project_path.name
             )
+            peak_memory = result.peak_memory
             
             export_time = time.time() - start_time
             
-            if result.returncode == 0 and export_file.exists():
-                export_size = self._get_export_size(export_dir)
-                self.progress.success(f"✅ Exported {project_path.name} ({export_size} bytes, {export_time:.1f}s)")
-                
-                return ExportResult(
-                    success=True,
-                    project_path=project_path,
-                    export_path=export_file,
-                    export_size=export_size,
-                    export_time=export_time
+            if result.returncode == 0 and result.aborted is None and export_file.exists():
+                return await asyncio.to_thread(
+                    self._finish_export, project_path, export_file, cache_key, export_time, peak_memory
                 )
+            
+            failure_kind, _ = classify_failure(result)
+            if result.aborted:
+                # Killed on fatal output: the return code only reflects the kill
+                error_msg = f"Export aborted early ({result.aborted.reason}): {result.fatal_line}"
             else:
                 # Enhanced error analysis
                 error_details = self._analyze_export_error(result.returncode, result.stderr, result.stdout)
                 error_msg = f"Export failed (code {result.returncode}): {error_details}"
-                self.progress.error(f"❌ Failed to export {project_path.name}: {error_msg}")
-                
-                return ExportResult(
-                    success=False,
-                    project_path=project_path,
-                    export_path=export_file,
-                    error_message=error_msg
-                )
+            self.progress.error(f"❌ Failed to export {project_path.name}: {error_msg}")
+            
+            return ExportResult(
+                success=False,
+                project_path=project_path,
+                export_path=export_file,
+                error_message=error_msg,
+                export_time=export_time,
+                peak_memory=peak_memory or None,
+                failure_kind=failure_kind
+            )
                 
         except subprocess.TimeoutExpired:
             error_msg = "Export timed out after 5 minutes"
@@ -209,112 +224,212 @@ progressive_web_app/background_color=Color(0, 0, 0, 1)
                 success=False,
                 project_path=project_path,
                 export_path=export_file,
-                error_message=error_msg
+                error_message=error_msg,
+                export_time=time.time() - start_time,
+                failure_kind=FAILURE_UNKNOWN
             )
         except Exception as e:
             error_msg = f"Export error: {e}"
             self.progress.error(f"❌ {project_path.name}: {error_msg}")
             
+            # Failing to spawn Godot at all can also be a resource shortage
+            resource_errors = (errno.EAGAIN, errno.ENOMEM, errno.EMFILE, errno.ENFILE)
             return ExportResult(
                 success=False,
                 project_path=project_path,
                 export_path=export_file,
-                error_message=error_msg
+                error_message=error_msg,
+                failure_kind=FAILURE_RESOURCE if getattr(e, 'errno', None) in resource_errors else FAILURE_UNKNOWN
             )
     
-    def export_project_with_retry(self, project_path: Path, max_retries: int = 3, force_rebuild: bool = False) -> ExportResult:
-        """Export a project with retry logic for handling system errors"""
-        last_error = None
-        
-        for attempt in range(max_retries + 1):
-            if attempt > 0:
-                self.progress.info(f"🔄 Retry {attempt}/{max_retries} for {project_path.name}")
-                # Wait progressively longer before retry to let system recover
-                import time
-                wait_time = min(2 ** attempt, 10)  # Exponential backoff, max 10s
-                time.sleep(wait_time)
-                
-                # Try to free up some resources
-                try:
-                    import gc
-                    gc.collect()
-                except:
-                    pass
-            
-            result = self.export_project_to_web(project_path, force_rebuild)
-            
-            if result.success:
-                return result
-            
-            last_error = result.error_message
+    def _prepare_export(self, project_path: Path,
+                        force_rebuild: bool) -> Union[ExportResult, Tuple[Path, Optional[str], float]]:
+        """
+        Everything before launching Godot: up-to-date check, preset, cache restore, import seeding
+        
+        Returns:
+            An ExportResult when no export is needed, else (export_file, cache_key, start_time)
+        """
+        project_file = project_path / "project.godot"
+        if not project_file.exists():
+            return ExportResult(
+                success=False,
+                project_path=project_path,
+                export_path=Path(),
+                error_message="No project.godot file found"
+            )
+        
+        # Setup export directory
+        export_dir = project_path / "exports" / "web"
+        export_dir.mkdir(parents=True, exist_ok=True)
+        
+        export_file = export_dir / "index.html"
+        
+        # Check if export already exists and is newer than project files
+        if export_file.exists() and not force_rebuild:
+            if self._is_export_up_to_date(project_path, export_file):
+                return ExportResult(
+                    success=True,
+                    project_path=project_path,
+                    export_path=export_file,
+                    export_size=self._get_export_size(export_dir)
+                )
+        
+        # Merge the Web preset into the project's presets (written only if it changed)
+        preset = self._ensure_preset(project_path)
+        if preset is None:
+            return ExportResult(
+                success=False,
+                project_path=project_path,
+                export_path=export_file,
+                error_message="Failed to create export preset"
+            )
+        
+        # Restore from the content-addressed cache when the inputs are unchanged
+        start_time = time.time()
+        cache_key = None
+        if self.export_cache:
+            # Hash before exporting: Godot may add .import/.uid files to the project
+            try:
+                cache_key = self.export_cache.compute_key(
+                    project_path, self.get_godot_version(), self.template_version, preset.preset_hash,
+                    preset.include_filter, preset.exclude_filter
+                )
+            except Exception as e:
+                self.progress.warning(f"⚠️  Could not hash inputs for {project_path.name}: {e}")
             
-            # Check if this is a retryable error
-            if result.error_message and any(err in result.error_message.lower() for err in [
-                'invalid argument', 'system_error', 'std::system_error', 
-                'resource temporarily unavailable', 'cannot allocate memory',
-                'too many open files', 'out of memory'
-            ]):
-                if attempt < max_retries:
-                    self.progress.warning(f"⚠️ Retryable system error for {project_path.name} (attempt {attempt + 1}), retrying...")
-                    continue
-            else:
-                # Non-retryable error, fail immediately
-                break
+            if cache_key and not force_rebuild and self.export_cache.restore(cache_key, export_dir):
+                self._refresh_index(project_path)
+                export_size = self._get_export_size(export_dir)
+                self.progress.success(f"♻️  Restored {project_path.name} from export cache ({export_size} bytes)")
+                return ExportResult(
+                    success=True,
+                    project_path=project_path,
+                    export_path=export_file,
+                    export_size=export_size,
+                    export_time=time.time() - start_time,
+                    cached=True,
+                    cache_key=cache_key
+                )
+        
+        # Seed .godot/imported so assets imported before are not imported again
+        if self.import_cache:
+            self.import_cache.seed(project_path)
+        
+        return export_file, cache_key, start_time
+    
+    def _finish_export(self, project_path: Path, export_file: Path, cache_key: Optional[str],
+                       export_time: float, peak_memory: int) -> ExportResult:
+        """Record a successful export in the index and caches"""
+        export_dir = export_file.parent
+        self._refresh_index(project_path)
+        export_size = self._get_export_size(export_dir)
+        self.progress.success(f"✅ Exported {project_path.name} ({export_size} bytes, {export_time:.1f}s)")
+        
+        if self.import_cache:
+            self.import_cache.harvest(project_path)
+        
+        if self.export_cache and cache_key:
+            if not self.export_cache.store(cache_key, export_dir, {
+                "project": project_path.name,
+                "godot_version": self.get_godot_version(),
+                "template_version": self.template_version,
+                "export_time": export_time
+            }):
+                cache_key = None
         
-        # All retries failed, return the last error
-        self.progress.error(f"❌ All retry attempts failed for {project_path.name}")
         return ExportResult(
-            success=False,
+            success=True,
             project_path=project_path,
-            export_path=Path(),
-            error_message=f"Failed after {max_retries + 1} attempts: {last_error}"
+            export_path=export_file,
+            export_size=export_size,
+            export_time=export_time,
+            peak_memory=peak_memory or None,
+            cache_key=cache_key
         )
     
-    def export_projects_parallel(self, project_files: List[Path], max_workers: int = 4, force_rebuild: bool = False) -> List[ExportResult]:
-        """Export multiple projects in parallel"""
-        import time
-        import concurrent.futures
+    def is_memory_failure(self, result: ExportResult) -> bool:
+        """Check whether a failed export ran out of memory"""
+        if result.success or not result.error_message:
+            return False
+        message = result.error_message.lower()
+        return any(marker in message for marker in [
+            'out of memory', 'cannot allocate memory', 'memory ceiling', '(code -9)'
+        ])
+    
+    def export_project_with_retry(self, project_path: Path, max_retries: int = 3,
+                                  force_rebuild: bool = False) -> ExportResult:
+        """Export a project, retrying resource failures once resources free up"""
+        engine = AsyncExportEngine(self, 1, max_retries=max_retries)
+        return engine.run([project_path / "project.godot"], force_rebuild)[0]
+    
+    def export_projects_parallel(self, project_files: List[Path], max_workers: int = 4, force_rebuild: bool = False,
+                                 worker_pool: Optional['GodotWorkerPool'] = None,
+                                 scheduler: Optional[ExportScheduler] = None,
+                                 admission: Optional['AdmissionController'] = None) -> List[ExportResult]:
+        """
+        Export multiple projects in parallel
         
-        results = []
+        With an admission controller, concurrency follows live memory use up to
+        admission.max_jobs instead of the static max_workers.
+        """
+        if admission is not None:
+            max_workers = admission.max_jobs
         
-        # Group projects to avoid overwhelming the system
-        batch_size = min(max_workers, len(project_files))
+        if scheduler is None:
+            return self._export_projects(project_files, max_workers, force_rebuild, worker_pool, admission)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
-            # Submit all export tasks with retry capability
-            future_to_project = {
-                executor.submit(self.export_project_with_retry, project_file.parent, 3, force_rebuild): project_file
-                for project_file in project_files
-            }
-            
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_project):
-                project_file = future_to_project[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    # Update progress
-                    completed = len(results)
-                    total = len(project_files)
-                    self.progress.update_progress(
-                        f"Exported {completed}/{total} projects",
-                        (completed / total) * 100
-                    )
-                    
-                except Exception as e:
-                    self.progress.error(f"❌ Exception exporting {project_file.parent.name}: {e}")
-                    results.append(ExportResult(
-                        success=False,
-                        project_path=project_file.parent,
-                        export_path=Path(),
-                        error_message=f"Exception: {e}"
-                    ))
+        # Dispatch the slowest projects first so none of them starts last
+        ordered_files = scheduler.order(project_files)
+        workers = worker_pool.worker_count if worker_pool else max_workers
+        prediction = scheduler.predict_makespan(min(workers, len(ordered_files)) or 1)
+        
+        start_time = time.time()
+        results = self._export_projects(ordered_files, max_workers, force_rebuild, worker_pool, admission,
+                                        memory_estimate=scheduler.memory_estimate)
+        actual_seconds = time.time() - start_time
         
+        scheduler.record_results(results)
+        self.progress.info(
+            f"📈 Makespan: predicted {prediction['parallel_minutes'] * 60:.1f}s, "
+            f"actual {actual_seconds:.1f}s ({len(ordered_files)} projects, {prediction['jobs']} jobs)"
+        )
         return results
     
+    def _export_projects(self, project_files: List[Path], max_workers: int, force_rebuild: bool,
+                         worker_pool: Optional['GodotWorkerPool'],
+                         admission: Optional['AdmissionController'] = None,
+                         memory_estimate=None) -> List[ExportResult]:
+        """Export projects in the given order"""
+        if worker_pool is not None:
+            return worker_pool.run(project_files, force_rebuild, admission, memory_estimate)
+        
+        engine = AsyncExportEngine(self, max_workers, admission=admission)
+        return engine.run(project_files, force_rebuild, memory_estimate)
+    
+    def _indexed(self, path: Path) -> bool:
+        return self.project_index is not None and self.project_index.contains(path)
+    
+    def _refresh_index(self, project_path: Path):
+        """Pick up files an export or cache restore wrote into the project"""
+        if self._indexed(project_path):
+            self.project_index.refresh(project_path)
+    
     def _is_export_up_to_date(self, project_path: Path, export_file: Path) -> bool:
         """Check if export is newer than project source files"""
+        if self._indexed(project_path):
+            export_stat = self.project_index.stat(export_file)
+            if export_stat is None:
+                return False
+            export_mtime_ns = export_stat[1]
+            
+            # Check common project files using the shared index instead of rglob
+            for file_path, _, mtime_ns in self.project_index.iter_project_files(project_path):
+                if file_path.suffix in (".gd", ".cs", ".tscn", ".tres") or file_path.name == "project.godot":
+                    if mtime_ns > export_mtime_ns:
+                        return False
+            return True
+        
         if not export_file.exists():
             return False
         
@@ -330,16 +445,16 @@ progressive_web_app/background_color=Color(0, 0, 0, 1)
     
     def _get_export_size(self, export_dir: Path) -> int:
         """Get total size of exported files"""
-        total_size = 0
-        for file_path in export_dir.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-        return total_size
+        if self._indexed(export_dir):
+            return self.project_index.tree_size(export_dir)
+        
+        return scan_tree(export_dir).total_size
     
     def get_export_summary(self, results: List[ExportResult]) -> Dict[str, Any]:
         """Generate summary statistics for export results"""
         successful = [r for r in results if r.success]
         failed = [r for r in results if not r.success]
+        cached = [r for r in successful if r.cached]
         
         total_size = sum(r.export_size or 0 for r in successful)
         total_time = sum(r.export_time or 0 for r in successful)
@@ -349,6 +464,7 @@ progressive_web_app/background_color=Color(0, 0, 0, 1)
             "total_projects": len(results),
             "successful": len(successful),
             "failed": len(failed),
+            "cached": len(cached),
             "success_rate": len(successful) / len(results) if results else 0,
             "total_export_size": total_size,
             "total_export_time": total_time,
@@ -371,23 +487,10 @@ progressive_web_app/background_color=Color(0, 0, 0, 1)
         # Get base error description
         base_error = error_patterns.get(returncode, f"Unknown error code {returncode}")
         
-        # Analyze stderr for specific issues
-        if stderr:
-            stderr_lower = stderr.lower()
-            if "invalid argument" in stderr_lower and "std::system_error" in stderr_lower:
-                base_error += " - Likely file descriptor/resource limit reached. Try: ulimit -n 4096"
-            elif "invalid argument" in stderr_lower:
-                base_error += " - Check file paths, permissions, or reduce concurrent exports"
-            elif "cannot allocate memory" in stderr_lower or "out of memory" in stderr_lower:
-                base_error += " - Insufficient memory, reduce parallel jobs with --jobs N"
-            elif "too many open files" in stderr_lower:
-                base_error += " - File descriptor limit exceeded, try: ulimit -n 4096"
-            elif "template" in stderr_lower and "not found" in stderr_lower:
-                base_error += " - Export templates missing, run: godot --export-debug Web"
-            elif "permission denied" in stderr_lower:
-                base_error += " - Permission error, check file/directory permissions"
-            elif "display" in stderr_lower or "x11" in stderr_lower:
-                base_error += " - Display/X11 issue in headless environment, set DISPLAY=:0"
+        # Analyze stderr for specific issues, using the patterns that classify failures
+        failure = match_failure(stderr) if stderr else None
+        if failure is not None:
+            base_error += f" - {failure.hint}"
         
         # Include relevant stderr excerpt
         if stderr and len(stderr.strip()) > 0:
@@ -397,6 +500,257 @@ progressive_web_app/background_color=Color(0, 0, 0, 1)
         return base_error
 
 
+class GodotWorkerPool:
+    """
+    Pool of long-lived export workers checked out by the async export engine
+    
+    A Godot editor process is bound to one project for its whole lifetime, so
+    workers cannot keep a single engine process alive across projects. Each
+    worker instead owns private Godot config and cache directories (editor
+    settings, shader cache) under work_dir that are never contended by
+    concurrent exports. Rooted in the build cache dir, they persist between
+    builds (and CI can cache them); a new worker starts from a copy of the
+    shared editor settings and shader cache, so it is never colder than an
+    export without the pool. Exports exceeding the memory ceiling are killed.
+    """
+    
+    def __init__(self, exporter: GodotExporter, workers: int = 4,
+                 memory_ceiling_mb: Optional[int] = None, work_dir: Optional[Path] = None):
+        self.exporter = exporter
+        self.progress = exporter.progress
+        self.worker_count = max(1, workers)
+        self.memory_ceiling = memory_ceiling_mb * 1024 * 1024 if memory_ceiling_mb else None
+        # Without a work dir the warm state only lasts for this build
+        self._temporary = work_dir is None
+        self.work_dir = Path(work_dir) if work_dir else Path(tempfile.mkdtemp(prefix="godot-workers-"))
+        self.workers: List[GodotWorker] = []
+        self._idle: List[GodotWorker] = []
+    
+    def _create_worker(self, worker_id: int) -> GodotWorker:
+        home_dir = self.work_dir / f"worker-{worker_id}"
+        if not home_dir.exists():
+            self._seed(home_dir)
+        home_dir.mkdir(parents=True, exist_ok=True)
+        return GodotWorker(worker_id=worker_id, home_dir=home_dir, memory_ceiling=self.memory_ceiling)
+    
+    def _seed(self, home_dir: Path):
+        """Start a new worker from the shared editor settings and shader cache"""
+        if not sys.platform.startswith("linux"):
+            return
+        for name, variable, default in (("config", "XDG_CONFIG_HOME", "~/.config"),
+                                        ("cache", "XDG_CACHE_HOME", "~/.cache")):
+            shared = Path(os.environ.get(variable) or os.path.expanduser(default)) / "godot"
+            for pattern in WORKER_SEED_PATTERNS[name]:
+                for source in shared.glob(pattern):
+                    target = home_dir / name / "godot" / source.name
+                    try:
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        if source.is_dir():
+                            shutil.copytree(source, target, dirs_exist_ok=True)
+                        else:
+                            shutil.copy2(source, target)
+                    except (OSError, shutil.Error) as e:
+                        self.progress.warning(f"⚠️  Could not seed worker {home_dir.name} from {source}: {e}")
+    
+    def checkout(self) -> GodotWorker:
+        """Take an idle worker, creating one when every worker is busy"""
+        if self._idle:
+            return self._idle.pop()
+        worker = self._create_worker(len(self.workers))
+        self.workers.append(worker)
+        return worker
+    
+    def checkin(self, worker: GodotWorker, result: ExportResult):
+        """Return a worker after a job"""
+        self._idle.append(worker)
+    
+    def run(self, project_files: List[Path], force_rebuild: bool = False,
+            admission: Optional['AdmissionController'] = None, memory_estimate=None) -> List[ExportResult]:
+        """Export all projects through the worker pool"""
+        engine = AsyncExportEngine(self.exporter, self.worker_count, admission=admission, worker_pool=self)
+        return engine.run(project_files, force_rebuild, memory_estimate)
+    
+    def close(self):
+        """Release the workers, keeping their directories unless they were temporary"""
+        if self._temporary:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        self.workers = []
+        self._idle = []
+
+
+class AsyncExportEngine:
+    """
+    Runs exports as asyncio subprocesses under a concurrency limit that can change mid-build
+    
+    Projects are dispatched in the given order whenever fewer than
+    `concurrency` exports are running and the admission controller (if any)
+    admits the next one. Failed exports are classified from their output:
+    deterministic failures (parse errors, missing preset or templates) are
+    final at once, while resource failures go to a retry queue that is served
+    first, but only after another export has finished and released its memory
+    (or immediately when nothing else is running). The limit can be changed
+    from any thread with set_concurrency(), or on POSIX by sending the build
+    SIGUSR1 (+1) or SIGUSR2 (-1).
+    """
+    
+    # Seconds between dispatch attempts while waiting for memory or a free slot
+    DISPATCH_INTERVAL = 0.5
+    
+    def __init__(self, exporter: GodotExporter, concurrency: int,
+                 admission: Optional['AdmissionController'] = None,
+                 worker_pool: Optional[GodotWorkerPool] = None,
+                 max_retries: int = 3):
+        self.exporter = exporter
+        self.progress = exporter.progress
+        self.concurrency = max(1, concurrency)
+        self.admission = admission
+        self.worker_pool = worker_pool
+        self.max_retries = max_retries
+        self.retries = 0
+        self.retry_seconds = 0.0
+        self._completions = 0
+        self._signals: List[int] = []
+    
+    def set_concurrency(self, limit: int) -> int:
+        """Change how many exports may run at once; safe to call from any thread"""
+        self.concurrency = max(1, int(limit))
+        if self.admission is not None:
+            self.admission.set_concurrency_limit(self.concurrency)
+        self.progress.info(f"⚙️  Export concurrency set to {self.concurrency}")
+        return self.concurrency
+    
+    def run(self, project_files: List[Path], force_rebuild: bool = False,
+            memory_estimate=None) -> List[ExportResult]:
+        """Export all projects and return their results in completion order"""
+        return asyncio.run(self.run_async(project_files, force_rebuild, memory_estimate))
+    
+    async def run_async(self, project_files: List[Path], force_rebuild: bool = False,
+                        memory_estimate=None) -> List[ExportResult]:
+        """Coroutine form of run()"""
+        # (project_path, projected memory, attempt) in dispatch order
+        pending = deque((project_file.parent, None, 1) for project_file in project_files)
+        # Resource failures: (project_path, projected memory, attempt, completions when queued)
+        retry_queue = deque()
+        jobs: Dict[asyncio.Task, Tuple[Path, Optional[int], int, Optional[GodotWorker]]] = {}
+        results: List[ExportResult] = []
+        total = len(project_files)
+        
+        self._install_signal_handlers()
+        try:
+            while pending or retry_queue or jobs:
+                while len(jobs) < self.concurrency:
+                    if retry_queue and (not jobs or self._completions > retry_queue[0][3]):
+                        queue_used = retry_queue
+                    elif pending:
+                        queue_used = pending
+                    else:
+                        break
+                    project_path, projected, attempt = queue_used[0][:3]
+                    if projected is None and memory_estimate:
+                        projected = memory_estimate(project_path)
+                        queue_used[0] = (project_path, projected, attempt) + queue_used[0][3:]
+                    if self.admission is not None and not self.admission.try_admit(project_path, projected):
+                        break
+                    queue_used.popleft()
+                    if attempt > 1:
+                        self.progress.info(f"🔄 Retry {attempt - 1}/{self.max_retries} for {project_path.name}")
+                    worker = self.worker_pool.checkout() if self.worker_pool else None
+                    task = asyncio.create_task(
+                        self.exporter.export_project_to_web_async(project_path, force_rebuild, worker=worker)
+                    )
+                    jobs[task] = (project_path, projected, attempt, worker)
+                
+                if not jobs:
+                    await asyncio.sleep(self.DISPATCH_INTERVAL)
+                    continue
+                
+                done, _ = await asyncio.wait(jobs, timeout=self.DISPATCH_INTERVAL,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    project_path, projected, attempt, worker = jobs.pop(task)
+                    result = self._task_result(task, project_path)
+                    self._completions += 1
+                    if worker:
+                        self.worker_pool.checkin(worker, result)
+                    
+                    if not result.success and result.failure_kind == FAILURE_RESOURCE and attempt <= self.max_retries:
+                        self.retries += 1
+                        self.retry_seconds += result.export_time or 0
+                        if self.exporter.is_memory_failure(result):
+                            projected = max(projected or self._default_job_memory(),
+                                            int((result.peak_memory or 0) * 1.2))
+                            if self.admission is not None:
+                                # Report before release so the failed export still counts as running
+                                limit = self.admission.report_oom()
+                                self.progress.warning(f"⚠️ {project_path.name} ran out of memory, concurrency lowered to {limit}")
+                        if self.admission is not None:
+                            self.admission.release(project_path)
+                        retry_queue.append((project_path, projected, attempt + 1, self._completions))
+                        self.progress.warning(f"⚠️ Resource failure for {project_path.name}, queued for retry once resources free up")
+                        continue
+                    
+                    if self.admission is not None:
+                        self.admission.release(project_path)
+                    
+                    if not result.success:
+                        if result.failure_kind == FAILURE_DETERMINISTIC:
+                            self.progress.error(f"⛔ {project_path.name} failed deterministically, not retrying")
+                        elif attempt > 1:
+                            result.error_message = f"Failed after {attempt} attempts: {result.error_message}"
+                            self.progress.error(f"❌ All retry attempts failed for {project_path.name}")
+                    
+                    results.append(result)
+                    self.progress.update_progress(
+                        f"Exported {len(results)}/{total} projects",
+                        (len(results) / total) * 100
+                    )
+        finally:
+            self._remove_signal_handlers()
+        
+        if self.retries:
+            self.progress.info(f"🔁 {self.retries} export retries, {self.retry_seconds:.1f}s spent in failed attempts")
+        return results
+    
+    def _default_job_memory(self) -> int:
+        if self.admission is not None:
+            return self.admission.default_job_memory
+        return 0
+    
+    def _task_result(self, task: asyncio.Task, project_path: Path) -> ExportResult:
+        try:
+            return task.result()
+        except Exception as e:
+            self.progress.error(f"❌ Exception exporting {project_path.name}: {e}")
+            return ExportResult(
+                success=False,
+                project_path=project_path,
+                export_path=Path(),
+                error_message=f"Exception: {e}"
+            )
+    
+    def _install_signal_handlers(self):
+        """Let SIGUSR1/SIGUSR2 raise or lower concurrency while the build runs"""
+        loop = asyncio.get_running_loop()
+        for name, step in (("SIGUSR1", 1), ("SIGUSR2", -1)):
+            signum = getattr(signal, name, None)
+            if signum is None:
+                continue
+            try:
+                loop.add_signal_handler(signum, lambda step=step: self.set_concurrency(self.concurrency + step))
+                self._signals.append(signum)
+            except (NotImplementedError, RuntimeError, ValueError):
+                # Not on the main thread, or no signal support on this platform
+                return
+        if self._signals and self.progress.verbose:
+            self.progress.info(f"💡 Adjust export concurrency with: kill -USR1 {os.getpid()} (+1) / kill -USR2 {os.getpid()} (-1)")
+    
+    def _remove_signal_handlers(self):
+        loop = asyncio.get_running_loop()
+        for signum in self._signals:
+            loop.remove_signal_handler(signum)
+        self._signals = []
+
+
 def create_fallback_export(project_path: Path, export_dir: Path) -> bool:
     """Create a fallback HTML export for projects that can't be exported"""
     export_file = export_dir / "index.html"
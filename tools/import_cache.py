@@ -0,0 +1,236 @@
+"""
+Import Cache
+============
+
+Persistent cache of Godot's imported resources (.godot/imported).
+Entries are keyed on the content of each source asset plus its importer
+settings, so assets shared between projects and runs are imported once per
+cache lifetime instead of once per project per run. Imported files are
+stored without their project-specific prefix and renamed to the importing
+project's names when seeded.
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .progress_reporter import ProgressReporter
+    from . import file_hasher
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    import file_hasher
+
+
+# Every file Godot writes for an asset is referenced from its .import file
+IMPORTED_PATH_PATTERN = re.compile(r'"res://\.godot/imported/([^"/]+)"')
+
+# Imported files are named <asset>-<md5 of res:// path>.<ext>; the .md5 file
+# Godot uses to decide whether to reimport lives next to them as <base>.md5
+IMPORT_BASE_PATTERN = re.compile(r'^(.+-[0-9a-f]{32})\.')
+
+SKIP_DIRS = {".git", ".godot", "exports", "__pycache__"}
+
+# .import keys that describe how an asset is imported; uid, path*, dest_files
+# and source_file differ between projects importing the same asset
+REMAP_SETTING_KEYS = ("importer", "type")
+
+
+class ImportCache:
+    """Seeds and harvests .godot/imported with LRU eviction under a size budget"""
+
+    def __init__(self, cache_dir: Path, budget_mb: int = 2048,
+                 progress_reporter: Optional[ProgressReporter] = None):
+        self.cache_dir = Path(cache_dir) / "imports"
+        self.index_file = self.cache_dir / "index.json"
+        self.budget = budget_mb * 1024 * 1024
+        self.progress = progress_reporter or ProgressReporter()
+        self.entries: Dict[str, Dict[str, float]] = {}
+        self.seeded = 0
+        self.harvested = 0
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def _load_index(self):
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, 'r') as f:
+                entries = json.load(f).get('entries', {})
+            self.entries = {key: info for key, info in entries.items() if self._entry_dir(key).is_dir()}
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not load import cache index: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Persist the LRU index"""
+        with self._lock:
+            entries = dict(self.entries)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'w') as f:
+                json.dump({'entries': entries}, f)
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not save import cache index: {e}")
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def _iter_import_files(self, project_path: Path):
+        for root, dirs, files in os.walk(project_path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in files:
+                if name.endswith(".import"):
+                    yield Path(root) / name
+
+    def _import_settings(self, import_text: str) -> bytes:
+        """The importer, resource type and [params] of a .import file"""
+        settings = []
+        section = None
+        for line in import_text.splitlines():
+            line = line.strip()
+            if line.startswith("[") and line.endswith("]"):
+                section = line
+            elif section == "[remap]" and line.split("=", 1)[0] in REMAP_SETTING_KEYS:
+                settings.append(line)
+            elif section == "[params]" and line:
+                settings.append(line)
+        return "\n".join(settings).encode("utf-8")
+
+    def _describe(self, import_file: Path) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Return (cache key, {imported file name: cached file name}) for an asset's .import file
+
+        Cached names replace the <asset>-<md5 of res:// path> prefix with "asset", so the same
+        entry serves every project that imports the asset with the same settings.
+        """
+        source_file = import_file.with_suffix("")
+        try:
+            import_text = import_file.read_text(encoding='utf-8', errors='replace')
+            digest = file_hasher.update_from_file(file_hasher.new_hasher(), source_file)
+        except OSError:
+            return None
+        digest.update(b"\0")
+        digest.update(self._import_settings(import_text))
+
+        names = set(IMPORTED_PATH_PATTERN.findall(import_text))
+        if not names:
+            return None
+        for name in list(names):
+            match = IMPORT_BASE_PATTERN.match(name)
+            if match:
+                names.add(match.group(1) + ".md5")
+        cached_names = {}
+        for name in sorted(names):
+            match = IMPORT_BASE_PATTERN.match(name)
+            cached_names[name] = "asset" + name[len(match.group(1)):] if match else name
+        return digest.hexdigest(), cached_names
+
+    def seed(self, project_path: Path) -> int:
+        """Copy cached imports into the project's .godot/imported before an export"""
+        imported_dir = project_path / ".godot" / "imported"
+        seeded = 0
+
+        for import_file in self._iter_import_files(project_path):
+            described = self._describe(import_file)
+            if not described:
+                continue
+            key, names = described
+            with self._lock:
+                if key not in self.entries:
+                    continue
+                self.entries[key]['last_used'] = time.time()
+
+            entry_dir = self._entry_dir(key)
+            try:
+                imported_dir.mkdir(parents=True, exist_ok=True)
+                for name, cached_name in names.items():
+                    cached_file = entry_dir / cached_name
+                    if cached_file.exists() and not (imported_dir / name).exists():
+                        shutil.copy2(cached_file, imported_dir / name)
+                seeded += 1
+            except OSError as e:
+                self.progress.warning(f"⚠️  Could not seed import {import_file.name}: {e}")
+
+        with self._lock:
+            self.seeded += seeded
+        return seeded
+
+    def harvest(self, project_path: Path) -> int:
+        """Store imports produced by an export that are not cached yet"""
+        imported_dir = project_path / ".godot" / "imported"
+        if not imported_dir.is_dir():
+            return 0
+        harvested = 0
+
+        for import_file in self._iter_import_files(project_path):
+            described = self._describe(import_file)
+            if not described:
+                continue
+            key, names = described
+            with self._lock:
+                if key in self.entries:
+                    continue
+
+            files = [(imported_dir / name, cached_name) for name, cached_name in names.items()
+                     if (imported_dir / name).exists()]
+            if not files:
+                continue
+
+            entry_dir = self._entry_dir(key)
+            try:
+                entry_dir.parent.mkdir(parents=True, exist_ok=True)
+                staging_dir = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=entry_dir.parent))
+                for file_path, cached_name in files:
+                    shutil.copy2(file_path, staging_dir / cached_name)
+                try:
+                    os.rename(staging_dir, entry_dir)
+                except OSError:
+                    # Another export harvested the same asset first
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    continue
+            except OSError as e:
+                self.progress.warning(f"⚠️  Could not cache import {import_file.name}: {e}")
+                continue
+
+            with self._lock:
+                self.entries[key] = {
+                    'size': sum(file_path.stat().st_size for file_path, _ in files),
+                    'last_used': time.time()
+                }
+            harvested += 1
+
+        with self._lock:
+            self.harvested += harvested
+        if harvested:
+            self.evict()
+        return harvested
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits its budget"""
+        with self._lock:
+            total = sum(info.get('size', 0) for info in self.entries.values())
+            if total <= self.budget:
+                return 0
+            victims = []
+            for key, info in sorted(self.entries.items(), key=lambda item: item[1].get('last_used', 0)):
+                if total <= self.budget:
+                    break
+                total -= info.get('size', 0)
+                victims.append(key)
+            for key in victims:
+                del self.entries[key]
+
+        for key in victims:
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+        return len(victims)
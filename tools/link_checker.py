@@ -0,0 +1,208 @@
+"""
+Link Checker
+============
+
+Validates local links against an in-memory set of known paths built from
+the ProjectIndex walk, so checking a link is a set lookup instead of a stat
+call. README links (and images) are extracted in parallel; the extracted
+targets are cached per README content hash, so an unchanged README is not
+parsed again. Only paths outside the indexed tree fall back to the
+filesystem, once per path.
+"""
+
+import os
+import re
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote
+
+try:
+    from .progress_reporter import ProgressReporter
+    from .project_index import ProjectIndex
+    from . import file_hasher
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    from project_index import ProjectIndex
+    import file_hasher
+
+
+CACHE_FORMAT_VERSION = 1
+
+# [text](target "title") and ![alt](target), plus src/href attributes of inline HTML
+MARKDOWN_LINK_PATTERN = re.compile(r'(!?)\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+["\'][^)]*["\'])?\s*\)')
+HTML_LINK_PATTERN = re.compile(r'<(?:img|a|source|video)\b[^>]*?\b(?:src|href)\s*=\s*["\']([^"\']+)["\']',
+                               re.IGNORECASE)
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'data:', 'ftp://', '//', '#', 'javascript:')
+
+
+@dataclass
+class BrokenLink:
+    """A local link whose target does not exist"""
+    source: str  # file containing the link
+    text: str
+    target: str  # link as written
+
+    def __str__(self) -> str:
+        return f"'{self.text}' -> {self.target}"
+
+
+def extract_links(text: str) -> List[Tuple[str, str]]:
+    """(text, target) of every local link and image outside code fences"""
+    links = []
+    in_fence = False
+    for line in text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        for image, label, target in MARKDOWN_LINK_PATTERN.findall(line):
+            links.append((f"{image}{label}" if image else label, target))
+        for target in HTML_LINK_PATTERN.findall(line):
+            links.append((target, target))
+    return [(label, target) for label, target in links if not target.startswith(EXTERNAL_PREFIXES)]
+
+
+def link_path(target: str) -> str:
+    """Filesystem part of a link target (no query, fragment or URL escapes)"""
+    return unquote(target.split('#', 1)[0].split('?', 1)[0])
+
+
+class LinkChecker:
+    """Resolves local links against the paths a ProjectIndex recorded"""
+
+    def __init__(self, indexes: Iterable[ProjectIndex] = (), cache_file: Optional[Path] = None,
+                 max_workers: Optional[int] = None, progress_reporter: Optional[ProgressReporter] = None):
+        self.progress = progress_reporter or ProgressReporter()
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 4) * 2)
+        self.indexes = list(indexes)
+        # Indexed root -> every file and directory below it, relative posix
+        self._known: Dict[str, set] = {}
+        for index in self.indexes:
+            root = os.path.normpath(os.fspath(index.root))
+            self._known[root] = set(index.files) | set(index.dirs)
+        self._outside: Dict[str, bool] = {}
+        # README path -> (size, mtime_ns, content hash, extracted links)
+        self._cache: Dict[str, Tuple[int, int, str, List[Tuple[str, str]]]] = {}
+        self._cache_dirty = False
+        self._seen = set()
+        self._lock = threading.Lock()
+        self.parsed = 0
+        self.cached = 0
+        self._load_cache()
+
+    def _load_cache(self):
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != CACHE_FORMAT_VERSION or data.get('hash_algorithm') != file_hasher.ALGORITHM:
+            return
+        self._cache = {path: (size, mtime_ns, digest, [tuple(link) for link in links])
+                       for path, (size, mtime_ns, digest, links) in data.get('readmes', {}).items()}
+
+    def save(self):
+        """Persist extracted README links if anything changed"""
+        if self.cache_file is None:
+            return
+        stale = set(self._cache) - self._seen
+        if not self._cache_dirty and not stale:
+            return
+        for key in stale:
+            del self._cache[key]
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_file.with_name(f".{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w') as f:
+                json.dump({'version': CACHE_FORMAT_VERSION, 'hash_algorithm': file_hasher.ALGORITHM,
+                           'readmes': self._cache}, f)
+            os.replace(temp_path, self.cache_file)
+            self._cache_dirty = False
+        except OSError as e:
+            self.progress.warning(f"⚠️  Could not save link check cache: {e}")
+
+    def exists(self, path) -> bool:
+        """Whether path exists, answered from the index when it covers path"""
+        path = os.path.normpath(os.fspath(path))
+        for root, known in self._known.items():
+            if path == root:
+                return True
+            if path.startswith(root + os.sep):
+                return Path(os.path.relpath(path, root)).as_posix() in known
+        if path not in self._outside:
+            self._outside[path] = os.path.exists(path)
+        return self._outside[path]
+
+    def _readme_links(self, readme: Path) -> List[Tuple[str, str]]:
+        """Links of one README: stat fast path, then content hash, then parse"""
+        key = os.fspath(readme)
+        stat = next((index.stat(readme) for index in self.indexes if index.contains(readme)), None)
+        if stat is None:
+            st = os.stat(readme)
+            stat = (st.st_size, st.st_mtime_ns)
+        with self._lock:
+            self._seen.add(key)
+            entry = self._cache.get(key)
+            if entry is not None and (entry[0], entry[1]) == stat:
+                self.cached += 1
+                return entry[3]
+        data = readme.read_bytes()
+        hasher = file_hasher.new_hasher()
+        hasher.update(data)
+        digest = hasher.hexdigest()
+        reused = entry is not None and entry[2] == digest
+        links = entry[3] if reused else extract_links(data.decode('utf-8', errors='replace'))
+        with self._lock:
+            if reused:
+                self.cached += 1
+            else:
+                self.parsed += 1
+            self._cache[key] = (stat[0], stat[1], digest, links)
+            self._cache_dirty = True
+        return links
+
+    def check_readmes(self, readmes: Iterable[Path], site_root: Path) -> List[BrokenLink]:
+        """
+        Check every local link and image in readmes
+
+        Args:
+            readmes: README files to check
+            site_root: Directory that absolute (/...) links resolve against
+
+        Returns:
+            Broken links, in README order
+        """
+        readmes = list(readmes)
+
+        def check(readme: Path) -> List[BrokenLink]:
+            try:
+                links = self._readme_links(readme)
+            except OSError as e:
+                return [BrokenLink(os.fspath(readme), "(unreadable)", str(e))]
+            broken = []
+            for text, target in links:
+                path = link_path(target)
+                if not path:
+                    continue
+                resolved = site_root / path.lstrip('/') if path.startswith('/') else readme.parent / path
+                if not self.exists(resolved):
+                    broken.append(BrokenLink(os.fspath(readme), text, target))
+            return broken
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(readmes)))) as executor:
+            results = list(executor.map(check, readmes))
+        return [link for broken in results for link in broken]
@@ -3,6 +3,9 @@ Parallel Processing Manager for Optimal Job Scheduling
 """
 
 import os
+import time
+import heapq
+import threading
 import multiprocessing
 import psutil
 import resource  # For system resource limits
@@ -132,19 +135,31 @@ class ParallelManager:
         # Use the most conservative estimate
         return min(memory_jobs, dynamic_jobs)
     
-    def estimate_build_time(self, num_projects, jobs=None):
-        """Estimate build time based on project count and parallelism"""
+    def estimate_build_time(self, num_projects, jobs=None, durations=None):
+        """Estimate build time based on project count and parallelism
+        
+        When per-project durations are known they are packed onto the
+        workers longest-first, which is how the export scheduler dispatches them.
+        """
         if jobs is None:
             jobs = self.get_optimal_job_count()
         
-        # Rough estimates based on testing
-        avg_project_time = 8  # seconds per project
-        
-        # Sequential time
-        sequential_time = num_projects * avg_project_time
-        
-        # Parallel time (with some overhead)
-        parallel_time = (num_projects / jobs) * avg_project_time * 1.1
+        if durations:
+            # Greedy LPT: each job goes to the worker that frees up first
+            workers = [0.0] * max(1, min(jobs, len(durations)))
+            for duration in sorted(durations, reverse=True):
+                heapq.heapreplace(workers, workers[0] + duration)
+            sequential_time = sum(durations)
+            parallel_time = max(workers)
+        else:
+            # Rough estimates based on testing
+            avg_project_time = 8  # seconds per project
+            
+            # Sequential time
+            sequential_time = num_projects * avg_project_time
+            
+            # Parallel time (with some overhead)
+            parallel_time = (num_projects / jobs) * avg_project_time * 1.1
         
         return {
             'sequential_minutes': sequential_time / 60,
@@ -152,3 +167,83 @@ class ParallelManager:
             'speedup': sequential_time / parallel_time if parallel_time > 0 else 1,
             'jobs': jobs
         }
+
+
+class AdmissionController:
+    """Memory-aware admission control for concurrent Godot exports
+    
+    Instead of fixing the worker count up front, the export engine asks
+    try_admit() for each export with its projected memory. The controller
+    samples available memory and the RSS of running Godot child processes,
+    and only admits the export when the memory still owed to running exports
+    plus the new projection fits. Reported out-of-memory failures lower the concurrency cap.
+    """
+    
+    def __init__(self, max_jobs, default_job_memory_gb=1.5, reserve_gb=1.0):
+        self.max_jobs = max(1, max_jobs)
+        self.concurrency_limit = self.max_jobs
+        self.default_job_memory = int(default_job_memory_gb * 1024**3)
+        self.reserve = int(reserve_gb * 1024**3)
+        self.running = {}  # key -> projected bytes
+        self.oom_events = 0
+        self._lock = threading.Lock()
+    
+    def sample_godot_rss(self):
+        """Total RSS of Godot processes spawned by this build"""
+        total = 0
+        try:
+            for child in psutil.Process().children(recursive=True):
+                try:
+                    if 'godot' in child.name().lower():
+                        total += child.memory_info().rss
+                except psutil.Error:
+                    pass
+        except Exception:
+            pass
+        return total
+    
+    def sample_available_memory(self):
+        """Available system memory in bytes"""
+        try:
+            return psutil.virtual_memory().available
+        except Exception:
+            return 8 * 1024**3  # Fallback assumption, matches get_available_memory
+    
+    def _fits(self, projected):
+        if not self.running:
+            # Always let one export run, however large, so the build progresses
+            return True
+        if len(self.running) >= self.concurrency_limit:
+            return False
+        # Running exports may still grow up to their projection
+        owed = max(0, sum(self.running.values()) - self.sample_godot_rss())
+        return self.sample_available_memory() - self.reserve - owed >= projected
+    
+    def try_admit(self, key, projected_bytes=None):
+        """Admit an export if it fits now, without blocking"""
+        projected = projected_bytes or self.default_job_memory
+        with self._lock:
+            if not self._fits(projected):
+                return False
+            self.running[key] = projected
+            return True
+    
+    def set_concurrency_limit(self, limit):
+        """Change the concurrency cap while exports are running"""
+        with self._lock:
+            self.concurrency_limit = max(1, limit)
+            self.max_jobs = max(self.max_jobs, self.concurrency_limit)
+            return self.concurrency_limit
+    
+    def release(self, key):
+        """Mark an export as finished"""
+        with self._lock:
+            self.running.pop(key, None)
+    
+    def report_oom(self):
+        """Lower concurrency after an export ran out of memory"""
+        # Call before release() so the failed export still counts as running
+        with self._lock:
+            self.oom_events += 1
+            self.concurrency_limit = max(1, min(self.concurrency_limit, len(self.running)) - 1)
+            return self.concurrency_limit
@@ -0,0 +1,300 @@
+"""
+Precompressed Assets
+====================
+
+Writes .gz and .br siblings next to compressible artifact files (.wasm,
+.pck, .js, .html, ...) so static hosting can serve them without compressing
+on the fly. Compression runs on a process pool; a manifest in the artifact
+records each file's content hash, so files whose siblings are already
+current are skipped on later runs. Brotli output needs the optional brotli
+package and is skipped without it.
+"""
+
+import os
+import json
+import gzip
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from .progress_reporter import ProgressReporter
+    from .tree_stats import TreeStats
+    from . import file_hasher
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    from tree_stats import TreeStats
+    import file_hasher
+
+
+MANIFEST_NAME = ".precompressed.json"
+MANIFEST_FORMAT_VERSION = 1
+
+COMPRESSIBLE_EXTENSIONS = {".wasm", ".pck", ".js", ".mjs", ".html", ".css", ".json",
+                           ".svg", ".md", ".txt", ".xml"}
+
+# Sibling suffix per format
+FORMATS = {"gzip": ".gz", "brotli": ".br"}
+
+# Smaller files gain nothing worth an extra request negotiation
+MIN_SIZE = 1024
+
+# A sibling is only kept if it is at most this fraction of the original
+MAX_RATIO = 0.95
+
+GZIP_LEVEL = 9
+# Quality 11 is several times slower than 9 for a few percent smaller output
+BROTLI_QUALITY = 9
+
+
+def available_formats() -> List[str]:
+    """Formats that can be written in this environment"""
+    return [name for name in FORMATS if name != "brotli" or brotli is not None]
+
+
+def is_sibling(name: str) -> bool:
+    """Whether a file name looks like a precompressed sibling"""
+    return any(name.endswith(suffix) for suffix in FORMATS.values())
+
+
+def _compress_file(path: str, formats: Tuple[str, ...], gzip_level: int,
+                   brotli_quality: int) -> Tuple[str, Dict[str, Optional[int]]]:
+    """Write the siblings of one file (process pool worker)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    sizes = {}
+    for name in formats:
+        if name == "gzip":
+            # mtime=0 keeps the output byte-identical for identical input
+            compressed = gzip.compress(data, compresslevel=gzip_level, mtime=0)
+        else:
+            compressed = brotli.compress(data, quality=brotli_quality)
+        sibling = path + FORMATS[name]
+        if len(compressed) > len(data) * MAX_RATIO:
+            if os.path.lexists(sibling):
+                os.unlink(sibling)
+            sizes[name] = None
+            continue
+        temp_path = f"{sibling}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_path, sibling)
+        sizes[name] = len(compressed)
+    return path, sizes
+
+
+@dataclass
+class CompressionResult:
+    """Outcome of a precompression run"""
+    compressed: int = 0  # files (re)compressed this run
+    skipped: int = 0  # files whose siblings were already current
+    removed: int = 0  # stale siblings deleted
+    original_size: int = 0  # total size of the files that have siblings
+    # format -> [original bytes of files with that sibling, sibling bytes]
+    by_format: Dict[str, List[int]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form with ratios"""
+        return {
+            "compressed_files": self.compressed,
+            "skipped_files": self.skipped,
+            "original_size": self.original_size,
+            **{
+                name: {"size": size, "ratio": round(size / original, 4) if original else 1.0}
+                for name, (original, size) in self.by_format.items()
+            },
+        }
+
+
+class Precompressor:
+    """Keeps .gz/.br siblings of compressible artifact files current"""
+
+    def __init__(self, formats: Optional[List[str]] = None, max_workers: Optional[int] = None,
+                 progress_reporter: Optional[ProgressReporter] = None):
+        """
+        Create a precompressor
+
+        Args:
+            formats: Formats to write (default: gzip, plus brotli when installed)
+            max_workers: Compression processes (default: CPU count)
+            progress_reporter: Progress reporter
+        """
+        self.progress = progress_reporter or ProgressReporter()
+        available = available_formats()
+        if formats is None:
+            formats = available
+        elif "brotli" in formats and brotli is None:
+            self.progress.warning("⚠️  brotli package not installed, writing gzip siblings only")
+        self.formats = tuple(name for name in formats if name in available)
+        self.max_workers = max_workers or os.cpu_count() or 4
+
+    def _settings(self) -> Dict[str, Any]:
+        return {"formats": list(self.formats), "gzip_level": GZIP_LEVEL, "brotli_quality": BROTLI_QUALITY,
+                "hash_algorithm": file_hasher.ALGORITHM}
+
+    def _load_manifest(self, manifest_path: Path) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """Recorded files, and whether they were written with the current settings"""
+        try:
+            with open(manifest_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}, False
+        if data.get("version") != MANIFEST_FORMAT_VERSION:
+            return {}, False
+        return data.get("files", {}), data.get("settings") == self._settings()
+
+    def _remove_siblings(self, artifact_dir: Path, entries: Dict[str, Dict[str, Any]]) -> int:
+        removed = 0
+        for rel, entry in entries.items():
+            for name, suffix in FORMATS.items():
+                sibling = artifact_dir / (rel + suffix)
+                if entry.get(name) is not None and sibling.exists():
+                    sibling.unlink()
+                    removed += 1
+        return removed
+
+    def _candidates(self, artifact_dir: Path) -> List[Tuple[str, os.stat_result]]:
+        files = []
+        for dirpath, _, filenames in os.walk(artifact_dir):
+            for name in filenames:
+                if name == MANIFEST_NAME or os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if st.st_size >= MIN_SIZE:
+                    files.append((path, st))
+        return files
+
+    def run(self, artifact_dir: Path, stats: Optional[TreeStats] = None) -> CompressionResult:
+        """
+        Write missing or outdated siblings below artifact_dir
+
+        Args:
+            artifact_dir: Artifact root; the manifest is kept there
+            stats: Artifact statistics to add the siblings to
+
+        Returns:
+            CompressionResult
+        """
+        result = CompressionResult()
+        manifest_path = artifact_dir / MANIFEST_NAME
+        previous, current_settings = self._load_manifest(manifest_path)
+        if not current_settings:
+            # Formats or levels changed: nothing recorded can be reused
+            result.removed += self._remove_siblings(artifact_dir, previous)
+            previous = {}
+        entries: Dict[str, Dict[str, Any]] = {}
+        candidates = self._candidates(artifact_dir)
+
+        def siblings_current(path: str, entry: Dict[str, Any]) -> bool:
+            for name in self.formats:
+                expected = entry.get(name)
+                sibling = path + FORMATS[name]
+                if expected is None:
+                    if os.path.lexists(sibling):
+                        return False
+                elif not os.path.isfile(sibling) or os.path.getsize(sibling) != expected:
+                    return False
+            return True
+
+        # Unchanged stat: trust the recorded hash; otherwise hash to see if the content changed
+        to_hash = []
+        for path, st in candidates:
+            rel = os.path.relpath(path, artifact_dir)
+            entry = previous.get(rel)
+            if entry and entry.get("stat") == [st.st_size, st.st_mtime_ns, st.st_ino] and siblings_current(path, entry):
+                entries[rel] = entry
+            else:
+                to_hash.append((path, st))
+        digests = file_hasher.hash_files([path for path, _ in to_hash], hexdigest=True)
+
+        to_compress = []
+        for path, st in to_hash:
+            rel = os.path.relpath(path, artifact_dir)
+            entry = previous.get(rel)
+            if digests[path] is None:
+                continue
+            if entry and entry.get("hash") == digests[path] and siblings_current(path, entry):
+                entries[rel] = {**entry, "stat": [st.st_size, st.st_mtime_ns, st.st_ino]}
+            else:
+                to_compress.append((path, st, digests[path]))
+        result.skipped = len(entries)
+
+        if to_compress:
+            self.progress.info(f"  🗜️  Compressing {len(to_compress)} files ({', '.join(self.formats)})...")
+            # Largest first so one big .wasm does not finish last on an otherwise idle pool
+            to_compress.sort(key=lambda item: -item[1].st_size)
+            workers = min(self.max_workers, len(to_compress))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_compress_file, path, self.formats, GZIP_LEVEL, BROTLI_QUALITY): (path, st, digest)
+                    for path, st, digest in to_compress
+                }
+                for future, (path, st, digest) in futures.items():
+                    try:
+                        _, sizes = future.result()
+                    except OSError as e:
+                        self.progress.warning(f"⚠️  Could not compress {path}: {e}")
+                        continue
+                    entries[os.path.relpath(path, artifact_dir)] = {
+                        "hash": digest, "stat": [st.st_size, st.st_mtime_ns, st.st_ino], **sizes}
+                    result.compressed += 1
+
+        # Siblings recorded for files that are gone (or no longer compressible)
+        result.removed += self._remove_siblings(
+            artifact_dir, {rel: entry for rel, entry in previous.items() if rel not in entries})
+
+        for rel, entry in entries.items():
+            for name in self.formats:
+                size = entry.get(name)
+                if size is None:
+                    continue
+                bucket = result.by_format.setdefault(name, [0, 0])
+                bucket[0] += entry["stat"][0]
+                bucket[1] += size
+                if stats is not None:
+                    stats.add(rel + FORMATS[name], size)
+            if any(entry.get(name) is not None for name in self.formats):
+                result.original_size += entry["stat"][0]
+
+        temp_path = manifest_path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump({"version": MANIFEST_FORMAT_VERSION, "settings": self._settings(), "files": entries}, f)
+        os.replace(temp_path, manifest_path)
+        if stats is not None:
+            stats.add(MANIFEST_NAME, manifest_path.stat().st_size)
+        return result
+
+
+def remove_precompressed(artifact_dir: Path) -> int:
+    """Delete every sibling recorded in artifact_dir's manifest, and the manifest"""
+    manifest_path = artifact_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return 0
+    try:
+        with open(manifest_path, 'r') as f:
+            entries = json.load(f).get("files", {})
+    except (OSError, ValueError):
+        entries = {}
+    removed = 0
+    for rel in entries:
+        for suffix in FORMATS.values():
+            sibling = artifact_dir / (rel + suffix)
+            if sibling.exists():
+                sibling.unlink()
+                removed += 1
+    manifest_path.unlink()
+    return removed
@@ -0,0 +1,333 @@
+"""
+Export Preset Manager
+=====================
+
+Maintains the "Web" export preset in each project's export_presets.cfg.
+The required preset is merged into whatever presets the project already has,
+per-project overrides from build_config.json are applied on top, and the
+file is only written when its bytes change, so an unchanged preset never
+bumps the file's mtime and never looks like a project change.
+"""
+
+import os
+import re
+import hashlib
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .progress_reporter import ProgressReporter
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+
+
+PRESETS_FILE = "export_presets.cfg"
+
+WEB_PRESET_NAME = "Web"
+
+# Template for the Web preset; existing values in a project's preset are kept
+# except for the required keys below
+WEB_PRESET_TEMPLATE = """[preset.0]
+
+name="Web"
+platform="Web"
+runnable=true
+advanced_options=false
+dedicated_server=false
+custom_features=""
+export_filter="all_resources"
+include_filter=""
+exclude_filter=""
+export_path="exports/web/index.html"
+encryption_include_filters=""
+encryption_exclude_filters=""
+encrypt_pck=false
+encrypt_directory=false
+
+[preset.0.options]
+
+custom_template/debug=""
+custom_template/release=""
+variant/extensions_support=false
+vram_texture_compression/for_desktop=true
+vram_texture_compression/for_mobile=false
+html/export_icon=true
+html/custom_html_shell=""
+html/head_include=""
+html/canvas_resize_policy=2
+html/focus_canvas_on_start=true
+html/experimental_virtual_keyboard=false
+progressive_web_app/enabled=false
+progressive_web_app/offline_page=""
+progressive_web_app/display=1
+progressive_web_app/orientation=0
+progressive_web_app/icon_144x144=""
+progressive_web_app/icon_180x180=""
+progressive_web_app/icon_512x512=""
+progressive_web_app/background_color=Color(0, 0, 0, 1)
+"""
+
+# Preset keys the build depends on, enforced over existing values
+REQUIRED_PRESET_KEYS = {
+    'name': '"Web"',
+    'platform': '"Web"',
+    'export_path': '"exports/web/index.html"',
+}
+
+SECTION_PATTERN = re.compile(r'^\[([^\]]+)\]\s*$')
+PRESET_SECTION_PATTERN = re.compile(r'^preset\.(\d+)$')
+CONSTRUCTOR_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*\(.*\)$', re.DOTALL)
+
+# Ordered sections of (key, raw value) pairs
+Sections = List[Tuple[str, List[Tuple[str, str]]]]
+
+
+@dataclass
+class PresetInfo:
+    """Outcome of ensuring a project's Web preset"""
+    path: Path
+    preset_hash: str  # hash of the effective Web preset, part of the export cache key
+    written: bool
+    # Effective include_filter/exclude_filter of the Web preset (comma-separated globs)
+    include_filter: str = ""
+    exclude_filter: str = ""
+
+
+def parse_presets(text: str) -> Sections:
+    """Parse an export_presets.cfg into ordered sections, keeping raw values"""
+    sections: Sections = []
+    entries = None
+    key = None
+    value_lines: List[str] = []
+
+    for line in text.splitlines():
+        if key is not None:
+            # Continuation of a multi-line string or array value
+            value_lines.append(line)
+            raw = "\n".join(value_lines)
+            if _value_complete(raw):
+                entries.append((key, raw))
+                key = None
+            continue
+
+        stripped = line.strip()
+        if not stripped or stripped.startswith(';'):
+            continue
+
+        match = SECTION_PATTERN.match(stripped)
+        if match:
+            entries = []
+            sections.append((match.group(1), entries))
+            continue
+
+        if entries is None or '=' not in line:
+            continue
+        name, raw = line.split('=', 1)
+        if _value_complete(raw):
+            entries.append((name.strip(), raw))
+        else:
+            key = name.strip()
+            value_lines = [raw]
+
+    if key is not None:
+        entries.append((key, "\n".join(value_lines)))
+    return sections
+
+
+def _value_complete(raw: str) -> bool:
+    """Whether a raw value has balanced quotes and brackets"""
+    in_string = False
+    escaped = False
+    depth = 0
+    for char in raw:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+    return not in_string and depth <= 0
+
+
+def render_presets(sections: Sections) -> str:
+    """Render sections in the layout Godot itself writes"""
+    return "\n".join(
+        f"[{name}]\n\n" + "".join(f"{key}={value}\n" for key, value in entries)
+        for name, entries in sections
+    )
+
+
+def format_value(value: Any) -> str:
+    """Convert a JSON override value to a Godot config literal"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    value = str(value)
+    if CONSTRUCTOR_PATTERN.match(value):
+        # Godot constructors such as Color(0, 0, 0, 1) are written as-is
+        return value
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def unquote_value(raw: str) -> str:
+    """Plain text of a quoted string value ("a, b" -> a, b)"""
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        return raw[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return raw
+
+
+def web_preset_index(sections: Sections) -> Optional[int]:
+    """Index of the preset named "Web", else of any Web-platform preset"""
+    presets = {}
+    for name, entries in sections:
+        match = PRESET_SECTION_PATTERN.match(name)
+        if match:
+            presets[int(match.group(1))] = entries
+    index = next((i for i, entries in sorted(presets.items()) if dict(entries).get('name') == '"Web"'), None)
+    if index is None:
+        index = next((i for i, entries in sorted(presets.items()) if dict(entries).get('platform') == '"Web"'), None)
+    return index
+
+
+def _set(entries: List[Tuple[str, str]], key: str, value: str):
+    for i, (existing, _) in enumerate(entries):
+        if existing == key:
+            entries[i] = (key, value)
+            return
+    entries.append((key, value))
+
+
+class PresetManager:
+    """Merges the Web export preset into projects and writes only real changes"""
+
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None, projects_dir: Optional[Path] = None,
+                 progress_reporter: Optional[ProgressReporter] = None):
+        """
+        Create a preset manager
+
+        Args:
+            overrides: The `export_presets` section of build_config.json:
+                {"preset": {...}, "options": {...}, "projects": {"<pattern>": {"preset": {...}, "options": {...}}}}
+                where patterns match project paths relative to projects_dir
+            projects_dir: Directory project patterns are relative to
+            progress_reporter: Progress reporter
+        """
+        self.overrides = overrides or {}
+        self.projects_dir = Path(projects_dir) if projects_dir else None
+        self.progress = progress_reporter or ProgressReporter()
+        # Parsed once and copied per project
+        template = parse_presets(WEB_PRESET_TEMPLATE)
+        self._template_preset = dict(template[0][1])
+        self._template_options = dict(template[1][1])
+        self.written = 0
+        self.unchanged = 0
+
+    def _project_overrides(self, project_path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Preset and option overrides for a project, most specific last"""
+        preset = dict(self.overrides.get('preset', {}))
+        options = dict(self.overrides.get('options', {}))
+        if self.projects_dir is not None:
+            try:
+                rel = Path(project_path).relative_to(self.projects_dir).as_posix()
+            except ValueError:
+                rel = None
+            for pattern, project in self.overrides.get('projects', {}).items():
+                if rel is not None and (rel == pattern or fnmatch(rel, pattern)):
+                    preset.update(project.get('preset', {}))
+                    options.update(project.get('options', {}))
+        return preset, options
+
+    def merge(self, sections: Sections, project_path: Path) -> Tuple[Sections, str]:
+        """
+        Merge the Web preset into parsed sections
+
+        Returns:
+            Tuple of (merged sections, hash of the effective Web preset)
+        """
+        sections = [(name, list(entries)) for name, entries in sections]
+        preset_overrides, option_overrides = self._project_overrides(project_path)
+
+        # Prefer the preset named "Web", then any Web-platform preset
+        index = web_preset_index(sections)
+
+        if index is None:
+            presets = [int(match.group(1)) for match in (PRESET_SECTION_PATTERN.match(name) for name, _ in sections)
+                       if match]
+            index = max(presets) + 1 if presets else 0
+            sections.append((f"preset.{index}", list(self._template_preset.items())))
+        section_names = [name for name, _ in sections]
+        if f"preset.{index}.options" not in section_names:
+            position = section_names.index(f"preset.{index}") + 1
+            sections.insert(position, (f"preset.{index}.options", []))
+
+        entries = dict(sections)
+        preset_entries = entries[f"preset.{index}"]
+        option_entries = entries[f"preset.{index}.options"]
+
+        present = {key for key, _ in preset_entries}
+        for key, value in self._template_preset.items():
+            if key not in present:
+                preset_entries.append((key, value))
+        present = {key for key, _ in option_entries}
+        for key, value in self._template_options.items():
+            if key not in present:
+                option_entries.append((key, value))
+
+        for key, value in REQUIRED_PRESET_KEYS.items():
+            _set(preset_entries, key, value)
+        for key, value in preset_overrides.items():
+            _set(preset_entries, key, format_value(value))
+        for key, value in option_overrides.items():
+            _set(option_entries, key, format_value(value))
+
+        digest = hashlib.sha256()
+        digest.update(render_presets([("preset", preset_entries), ("options", option_entries)]).encode("utf-8"))
+        return sections, digest.hexdigest()
+
+    def ensure(self, project_path: Path) -> PresetInfo:
+        """
+        Make sure project_path has the Web preset, writing the file only if it changes
+
+        Raises:
+            OSError: The presets file could not be read or written
+        """
+        presets_path = Path(project_path) / PRESETS_FILE
+        try:
+            current = presets_path.read_bytes()
+        except FileNotFoundError:
+            current = None
+
+        sections = parse_presets(current.decode("utf-8", errors="replace")) if current else []
+        merged, preset_hash = self.merge(sections, project_path)
+        content = render_presets(merged).encode("utf-8")
+        preset_entries = dict(dict(merged)[f"preset.{web_preset_index(merged)}"])
+        filters = {key: unquote_value(preset_entries.get(key, '""')) for key in ("include_filter", "exclude_filter")}
+
+        if content == current:
+            self.unchanged += 1
+            return PresetInfo(presets_path, preset_hash, written=False, **filters)
+
+        temp_path = presets_path.with_name(f".{PRESETS_FILE}.{os.getpid()}.tmp")
+        try:
+            temp_path.write_bytes(content)
+            os.replace(temp_path, presets_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        self.written += 1
+        return PresetInfo(presets_path, preset_hash, written=True, **filters)
@@ -0,0 +1,188 @@
+"""
+Project Dependency Graph
+========================
+
+Maps changed files to the Godot projects they affect.
+Each project owns the files below its project.godot (nested projects own
+their own subtree); `res://` references in project.godot, .tscn, .tres and
+.gd files that resolve outside the project (through symlinks or `..`) are
+recorded as shared dependencies so an edit to a shared resource rebuilds
+exactly the projects that use it.
+"""
+
+import os
+import re
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    from .progress_reporter import ProgressReporter
+    from .project_index import ProjectIndex, PRUNED_DIRS
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+    from project_index import ProjectIndex, PRUNED_DIRS
+
+
+# Files whose res:// references are followed
+REFERENCE_SUFFIXES = {".tscn", ".tres", ".gd", ".godot"}
+
+RES_REFERENCE_PATTERN = re.compile(r'res://([^"\'\s)\]]+)')
+
+GRAPH_FORMAT_VERSION = 1
+
+
+class ProjectGraph:
+    """Ownership and shared-resource dependencies of the projects under a root"""
+
+    def __init__(self, root: Path, progress_reporter: Optional[ProgressReporter] = None):
+        self.given_root = Path(os.path.abspath(root))
+        self.root = Path(root).resolve()
+        self.progress = progress_reporter or ProgressReporter()
+        # Project dirs relative to root, deepest first so nesting resolves correctly
+        self.projects: List[str] = []
+        # Resolved absolute path outside a project -> projects referencing it
+        self.shared: Dict[str, Set[str]] = {}
+        # Per-file reference cache: relative path -> [size, mtime_ns, references]
+        self._refs: Dict[str, list] = {}
+
+    @classmethod
+    def build(cls, root: Path, project_index: Optional[ProjectIndex] = None,
+              cache_file: Optional[Path] = None,
+              progress_reporter: Optional[ProgressReporter] = None) -> 'ProjectGraph':
+        """
+        Build the graph for every project under root
+
+        Args:
+            root: Directory containing the Godot projects
+            project_index: Shared index of root, avoids walking the tree again
+            cache_file: Persisted per-file reference cache; files whose size and
+                mtime are unchanged are not re-parsed
+            progress_reporter: Progress reporter
+        """
+        graph = cls(root, progress_reporter)
+        previous = graph._load(cache_file)
+
+        if project_index is not None and project_index.root.resolve() == graph.root:
+            project_dirs = [graph.relative(d) for d in project_index.project_dirs()]
+            sources = [(graph.relative(path), size, mtime_ns)
+                       for d in project_index.project_dirs()
+                       for path, size, mtime_ns in project_index.iter_project_files(d)
+                       if path.suffix in REFERENCE_SUFFIXES]
+        else:
+            project_dirs, sources = graph._walk()
+
+        graph.projects = sorted(project_dirs, key=lambda rel: rel.count("/") if rel else -1, reverse=True)
+
+        parsed = 0
+        for rel_path, size, mtime_ns in sources:
+            cached = previous.get(rel_path)
+            if cached and cached[0] == size and cached[1] == mtime_ns:
+                refs = cached[2]
+            else:
+                refs = graph._parse(rel_path)
+                parsed += 1
+            graph._refs[rel_path] = [size, mtime_ns, refs]
+
+            owner = graph.owner(graph.root / rel_path)
+            if owner is None:
+                continue
+            owner_dir = graph.root / owner if owner else graph.root
+            for ref in refs:
+                target = os.path.realpath(owner_dir / ref)
+                if not graph._is_inside(target, owner_dir):
+                    graph.shared.setdefault(target, set()).add(owner)
+
+        graph._save(cache_file)
+        graph.progress.info(f"  🕸️  Dependency graph: {len(graph.projects)} projects, "
+                            f"{len(graph.shared)} shared resources ({parsed} files parsed)")
+        return graph
+
+    def _walk(self) -> Tuple[List[str], List[Tuple[str, int, int]]]:
+        project_dirs = []
+        sources = []
+        for dirpath, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if d not in PRUNED_DIRS and d != "exports"]
+            rel_dir = Path(dirpath).relative_to(self.root).as_posix()
+            rel_dir = "" if rel_dir == "." else rel_dir
+            if "project.godot" in files:
+                project_dirs.append(rel_dir)
+            for name in files:
+                if os.path.splitext(name)[1] in REFERENCE_SUFFIXES:
+                    rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                    try:
+                        stat = os.stat(os.path.join(dirpath, name))
+                    except OSError:
+                        continue
+                    sources.append((rel_path, stat.st_size, stat.st_mtime_ns))
+        return project_dirs, sources
+
+    def _parse(self, rel_path: str) -> List[str]:
+        try:
+            with open(self.root / rel_path, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read()
+        except OSError:
+            return []
+        return sorted(set(RES_REFERENCE_PATTERN.findall(text)))
+
+    @staticmethod
+    def _is_inside(path: str, directory: Path) -> bool:
+        directory = str(directory)
+        return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+    def relative(self, path: Path) -> Optional[str]:
+        """Path relative to root, accepting paths under either the given or resolved root"""
+        path = Path(os.path.abspath(path))
+        for root in (self.given_root, self.root):
+            try:
+                rel = path.relative_to(root).as_posix()
+                return "" if rel == "." else rel
+            except ValueError:
+                continue
+        return None
+
+    def owner(self, path: Path) -> Optional[str]:
+        """Innermost project containing path, relative to root"""
+        rel = self.relative(path)
+        if rel is None:
+            return None
+        for project in self.projects:
+            if not project or rel == project or rel.startswith(project + "/"):
+                return project
+        return None
+
+    def affected_projects(self, path: Path) -> Set[str]:
+        """Projects whose export depends on path, relative to root"""
+        affected = set()
+        owner = self.owner(path)
+        if owner is not None:
+            affected.add(owner)
+        affected.update(self.shared.get(os.path.realpath(path), ()))
+        return affected
+
+    def _load(self, cache_file: Optional[Path]) -> Dict[str, list]:
+        if cache_file is None or not cache_file.exists():
+            return {}
+        try:
+            with open(cache_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != GRAPH_FORMAT_VERSION or data.get('root') != str(self.root):
+                return {}
+            return data.get('files', {})
+        except (OSError, ValueError) as e:
+            self.progress.warning(f"⚠️  Could not load dependency graph cache: {e}")
+            return {}
+
+    def _save(self, cache_file: Optional[Path]):
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump({'version': GRAPH_FORMAT_VERSION, 'root': str(self.root), 'files': self._refs}, f)
+        except OSError as e:
+            self.progress.warning(f"⚠️  Could not save dependency graph cache: {e}")
@@ -0,0 +1,252 @@
+"""
+Project Index
+=============
+
+Single-pass index of a projects tree.
+One os.scandir walk records every Godot project, README, export directory
+and the stat data of each file, so build stages share one view of the tree
+instead of each walking it with rglob.
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Iterator
+
+try:
+    from .progress_reporter import ProgressReporter
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+
+
+# Never descended into: VCS data, editor state and Python caches
+PRUNED_DIRS = {".git", ".godot", ".import", "__pycache__"}
+
+INDEX_FORMAT_VERSION = 1
+
+
+class ProjectIndex:
+    """In-memory index of projects, READMEs, exports and file stats under a root"""
+
+    def __init__(self, root: Path, progress_reporter: Optional[ProgressReporter] = None):
+        self.root = Path(root)
+        self.progress = progress_reporter or ProgressReporter()
+        # Relative posix path -> (size, mtime_ns) for every file
+        self.files: Dict[str, Tuple[int, int]] = {}
+        # Relative posix dir -> mtime_ns, used to validate a persisted index
+        self.dirs: Dict[str, int] = {}
+        # Relative project dir -> relative paths of the files it owns
+        self.projects: Dict[str, List[str]] = {}
+        self.readmes: List[str] = []
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, root: Path, progress_reporter: Optional[ProgressReporter] = None) -> 'ProjectIndex':
+        """Build an index with one walk of root"""
+        index = cls(root, progress_reporter)
+        if index.root.exists():
+            index._scan("")
+        return index
+
+    def _scan(self, start: str):
+        """Walk the subtree at relative dir start and record it"""
+        owner = self._owning_project(start) if start else None
+        stack = [(start, owner)]
+
+        while stack:
+            rel_dir, owner = stack.pop()
+            abs_dir = self.root / rel_dir if rel_dir else self.root
+            try:
+                entries = list(os.scandir(abs_dir))
+                self.dirs[rel_dir] = abs_dir.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            if any(entry.name == "project.godot" and entry.is_file() for entry in entries):
+                owner = rel_dir
+                self.projects.setdefault(owner, [])
+
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PRUNED_DIRS:
+                            stack.append((rel_path, owner))
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        self.files[rel_path] = (stat.st_size, stat.st_mtime_ns)
+                        if entry.name == "README.md":
+                            self.readmes.append(rel_path)
+                        if owner is not None:
+                            self.projects[owner].append(rel_path)
+                except OSError:
+                    continue
+
+        self.readmes.sort()
+
+    def _owning_project(self, rel_dir: str) -> Optional[str]:
+        """Nearest indexed project containing rel_dir"""
+        parts = rel_dir.split("/")
+        for i in range(len(parts), -1, -1):
+            candidate = "/".join(parts[:i])
+            if candidate in self.projects:
+                return candidate
+        return None
+
+    def refresh(self, project_dir: Path):
+        """Rescan one project after a stage changed its files (e.g. an export)"""
+        rel_dir = self._rel(project_dir)
+        with self._lock:
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            for rel_path in [p for p in self.files if p.startswith(prefix)]:
+                del self.files[rel_path]
+            for rel in [d for d in self.dirs if d == rel_dir or d.startswith(prefix)]:
+                del self.dirs[rel]
+            for rel in [p for p in self.projects if p == rel_dir or p.startswith(prefix)]:
+                del self.projects[rel]
+            self.readmes = [r for r in self.readmes if not r.startswith(prefix)]
+            self._scan(rel_dir)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _rel(self, path: Path) -> str:
+        rel = Path(path).relative_to(self.root).as_posix()
+        return "" if rel == "." else rel
+
+    def _abs(self, rel_path: str) -> Path:
+        return self.root / rel_path if rel_path else self.root
+
+    def project_dirs(self) -> List[Path]:
+        """All project directories, sorted"""
+        return [self._abs(rel) for rel in sorted(self.projects)]
+
+    def project_files(self) -> List[Path]:
+        """All project.godot files, sorted (drop-in for rglob("project.godot"))"""
+        return [path / "project.godot" for path in self.project_dirs()]
+
+    def readme_files(self) -> List[Path]:
+        """All README.md files, sorted"""
+        return [self._abs(rel) for rel in self.readmes]
+
+    def contains(self, path: Path) -> bool:
+        """Whether path lies inside the indexed root"""
+        try:
+            Path(path).relative_to(self.root)
+            return True
+        except ValueError:
+            return False
+
+    def has_file(self, path: Path) -> bool:
+        try:
+            return self._rel(path) in self.files
+        except ValueError:
+            return False
+
+    def iter_project_files(self, project_dir: Path, include_exports: bool = False) -> Iterator[Tuple[Path, int, int]]:
+        """Yield (path, size, mtime_ns) for files owned by a project"""
+        rel_dir = self._rel(project_dir)
+        exports_prefix = f"{rel_dir}/exports/" if rel_dir else "exports/"
+        with self._lock:
+            owned = [(rel_path, self.files.get(rel_path)) for rel_path in self.projects.get(rel_dir, [])]
+        for rel_path, stat in owned:
+            if stat is None or (not include_exports and rel_path.startswith(exports_prefix)):
+                continue
+            yield self._abs(rel_path), stat[0], stat[1]
+
+    def export_dirs(self, project_dir: Path) -> List[Path]:
+        """Export directories (exports/<platform>) of a project"""
+        rel_dir = self._rel(project_dir)
+        exports_prefix = f"{rel_dir}/exports/" if rel_dir else "exports/"
+        found = set()
+        with self._lock:
+            owned = list(self.projects.get(rel_dir, []))
+        for rel_path in owned:
+            if rel_path.startswith(exports_prefix):
+                remainder = rel_path[len(exports_prefix):]
+                if "/" in remainder:
+                    found.add(remainder.split("/", 1)[0])
+        return [self._abs(exports_prefix + platform) for platform in sorted(found)]
+
+    def iter_tree(self, directory: Path) -> Iterator[Tuple[Path, int, int]]:
+        """Yield (path, size, mtime_ns) for every indexed file below directory"""
+        rel_dir = self._rel(directory)
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        with self._lock:
+            matches = [(rel_path, stat) for rel_path, stat in self.files.items() if rel_path.startswith(prefix)]
+        for rel_path, (size, mtime_ns) in matches:
+            yield self._abs(rel_path), size, mtime_ns
+
+    def tree_size(self, directory: Path) -> int:
+        """Total size of indexed files below directory"""
+        return sum(size for _, size, _ in self.iter_tree(directory))
+
+    def stat(self, path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            return self.files.get(self._rel(path))
+        except ValueError:
+            return None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, index_file: Path):
+        """Persist the index so the next run can skip directory listings"""
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(index_file, 'w') as f:
+                json.dump({
+                    'version': INDEX_FORMAT_VERSION,
+                    'root': str(self.root.resolve()),
+                    'dirs': self.dirs,
+                    'projects': self.projects,
+                    'readmes': self.readmes,
+                    'files': sorted(self.files),
+                }, f)
+        except Exception as e:
+            self.progress.warning(f"⚠️  Could not save project index: {e}")
+
+    @classmethod
+    def load_or_build(cls, root: Path, index_file: Optional[Path] = None,
+                      progress_reporter: Optional[ProgressReporter] = None) -> 'ProjectIndex':
+        """
+        Reuse a persisted index when no directory changed, else rebuild it
+
+        Adding, removing or renaming an entry changes its directory's mtime,
+        so unchanged directory mtimes mean the persisted listing is still
+        valid. File stat data is always refreshed.
+        """
+        index = cls(root, progress_reporter)
+        if index_file is None or not index_file.exists():
+            return cls.build(root, progress_reporter)
+
+        try:
+            with open(index_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_FORMAT_VERSION or data.get('root') != str(index.root.resolve()):
+                return cls.build(root, progress_reporter)
+
+            for rel_dir, mtime_ns in data['dirs'].items():
+                if index._abs(rel_dir).stat().st_mtime_ns != mtime_ns:
+                    return cls.build(root, progress_reporter)
+
+            for rel_path in data['files']:
+                stat = index._abs(rel_path).stat()
+                index.files[rel_path] = (stat.st_size, stat.st_mtime_ns)
+            index.dirs = data['dirs']
+            index.projects = data['projects']
+            index.readmes = data['readmes']
+            return index
+        except (OSError, ValueError, KeyError):
+            return cls.build(root, progress_reporter)
@@ -0,0 +1,141 @@
+"""
+README Title Index
+==================
+
+Persistent cache of the first H1 title of each README, keyed by path, size
+and mtime. A README is only read when its stat data changed, and then only
+up to its first H1 line. The index also remembers the inputs and output of
+the last sidebar render, so an unchanged docs tree skips rendering entirely.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from .progress_reporter import ProgressReporter
+except ImportError:
+    # Fallback for CLI execution
+    import sys
+    import os
+    sys.path.append(os.path.dirname(__file__))
+    from progress_reporter import ProgressReporter
+
+
+INDEX_FORMAT_VERSION = 1
+
+
+def read_first_h1(readme_path: Path) -> Optional[str]:
+    """Title of the first non-empty '# ' line, reading no further than that line"""
+    with open(readme_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('# '):
+                title = line[2:].strip()
+                if title:
+                    return title
+    return None
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly these bytes"""
+    data = content.encode('utf-8')
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+    return True
+
+
+class ReadmeTitleIndex:
+    """README path -> (size, mtime_ns, title), persisted between runs"""
+
+    def __init__(self, index_file: Optional[Path] = None, progress_reporter: Optional[ProgressReporter] = None):
+        self.index_file = Path(index_file) if index_file else None
+        self.progress = progress_reporter or ProgressReporter()
+        self.entries: Dict[str, Tuple[int, int, Optional[str]]] = {}
+        self.sidebar: Dict[str, Any] = {}  # {"key": ..., "content": ..., "stats": ...} of the last render
+        self.hits = 0
+        self.reads = 0
+        self._seen = set()
+        self._dirty = False
+        if self.index_file is not None:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_FORMAT_VERSION:
+            return
+        self.entries = {path: tuple(entry) for path, entry in data.get('titles', {}).items()}
+        self.sidebar = data.get('sidebar', {})
+
+    def title(self, readme_path: Path, stat: Optional[Tuple[int, int]] = None) -> Optional[str]:
+        """
+        First H1 title of readme_path, read from disk only if it changed
+
+        Args:
+            readme_path: README file
+            stat: (size, mtime_ns) if the caller already has it (e.g. from ProjectIndex)
+
+        Raises:
+            OSError, UnicodeDecodeError: README could not be read
+        """
+        key = str(readme_path)
+        if stat is None:
+            st = os.stat(readme_path)
+            stat = (st.st_size, st.st_mtime_ns)
+        self._seen.add(key)
+        entry = self.entries.get(key)
+        if entry is not None and (entry[0], entry[1]) == tuple(stat):
+            self.hits += 1
+            return entry[2]
+        title = read_first_h1(readme_path)
+        self.reads += 1
+        self.entries[key] = (stat[0], stat[1], title)
+        self._dirty = True
+        return title
+
+    def sidebar_key(self, inputs: Any) -> str:
+        """Digest of everything a sidebar render depends on"""
+        payload = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(f"{INDEX_FORMAT_VERSION}\0{payload}".encode('utf-8')).hexdigest()
+
+    def cached_sidebar(self, key: str) -> Optional[Dict[str, Any]]:
+        """Last render, if it was made from the same inputs"""
+        if self.sidebar.get('key') == key and 'content' in self.sidebar:
+            return self.sidebar
+        return None
+
+    def remember_sidebar(self, key: str, content: str, stats: Dict[str, int]):
+        self.sidebar = {'key': key, 'content': content, 'stats': dict(stats)}
+        self._dirty = True
+
+    def save(self):
+        """Persist the index, dropping READMEs not looked up this run"""
+        if self.index_file is None:
+            return
+        stale = set(self.entries) - self._seen
+        if not self._dirty and not stale:
+            return
+        for key in stale:
+            del self.entries[key]
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w') as f:
+                json.dump({'version': INDEX_FORMAT_VERSION, 'titles': self.entries, 'sidebar': self.sidebar}, f)
+            os.replace(temp_path, self.index_file)
+            self._dirty = False
+        except OSError as e:
+            self.progress.warning(f"⚠️  Could not save README title index: {e}")
@@ -14,6 +14,9 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from project_config import BuildSystemConfig
+from tools.project_index import ProjectIndex
+from tools.readme_titles import ReadmeTitleIndex
+from tools.link_checker import LinkChecker
 
 
 @dataclass
@@ -38,8 +41,15 @@ class ProjectInfo:
 class SidebarGenerator:
     """Enhanced sidebar generator with hierarchy support and validation"""
     
-    def __init__(self, config: BuildSystemConfig):
+    def __init__(self, config: BuildSystemConfig, project_index: Optional[ProjectIndex] = None,
+                 title_index: Optional[ReadmeTitleIndex] = None):
         self.config = config
+        self.project_index = project_index
+        self.title_index = title_index or ReadmeTitleIndex()
+        # Index built here when no shared one covers the projects dir
+        self._local_index: Optional[ProjectIndex] = None
+        self.projects: List[ProjectInfo] = []
+        self._link_checker: Optional[LinkChecker] = None
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.stats = {
@@ -53,6 +63,9 @@ class SidebarGenerator:
         """
         Extract the first H1 title from a README.md file
         
+        Served from the title index when the README's size and mtime are
+        unchanged; otherwise only read up to the first H1.
+        
         Args:
             readme_path: Path to the README.md file
             
@@ -60,18 +73,7 @@ class SidebarGenerator:
             Extracted title or None if not found
         """
         try:
-            content = readme_path.read_text(encoding='utf-8')
-            lines = content.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('# '):
-                    # Extract title after '# '
-                    title = line[2:].strip()
-                    if title:
-                        return title
-            
-            return None
+            return self.title_index.title(readme_path, self._stat(readme_path))
         except Exception as e:
             self.warnings.append(f"Failed to read README {readme_path}: {e}")
             return None
@@ -91,10 +93,11 @@ class SidebarGenerator:
             return []
         
         projects = []
+        index = self._index_for(projects_dir)
         
         # First, find all Godot projects
         exclude_dirs = {'.github', 'docs'}
-        project_files = [pf for pf in projects_dir.rglob("project.godot")
+        project_files = [pf for pf in index.project_files()
                         if not any(ex in pf.parts for ex in exclude_dirs)]
         
         for project_file in project_files:
@@ -108,7 +111,7 @@ class SidebarGenerator:
             
             # Check for README and extract title
             readme_path = project_dir / "README.md"
-            has_readme = readme_path.exists()
+            has_readme = self._file_exists(readme_path)
             display_title = parts[-1]  # Default to folder name
             
             if has_readme:
@@ -138,7 +141,7 @@ class SidebarGenerator:
                 self.stats['projects_with_readme'] += 1
         
         # Second, find standalone README files in directories without project.godot
-        all_readme_files = [rf for rf in projects_dir.rglob("README.md")
+        all_readme_files = [rf for rf in index.readme_files()
                             if not any(ex in rf.parts for ex in exclude_dirs)]
         project_dirs = {p.path for p in projects}  # Set of directories that already have projects
         
@@ -180,63 +183,38 @@ class SidebarGenerator:
             self.stats['projects_found'] += 1
             self.stats['projects_with_readme'] += 1
         
+        self.projects = projects
         return projects
-        """
-        Discover all Godot projects with enhanced hierarchy analysis
-        
-        Args:
-            projects_dir: Base directory to search for projects
-            
-        Returns:
-            List of ProjectInfo objects
-        """
-        if not projects_dir.exists():
-            self.errors.append(f"Projects directory not found: {projects_dir}")
-            return []
-        
-        project_files = list(projects_dir.rglob("project.godot"))
-        projects = []
-        
-        for project_file in project_files:
-            project_dir = project_file.parent
-            relative_path = project_dir.relative_to(projects_dir)
-            parts = relative_path.parts
-            
-            if not parts:
-                self.warnings.append(f"Project at root level: {project_dir}")
-                continue
-            
-            # Check for README and extract title
-            readme_path = project_dir / "README.md"
-            has_readme = readme_path.exists()
-            display_title = parts[-1]  # Default to folder name
-            
-            if has_readme:
-                extracted_title = self.extract_title_from_readme(readme_path)
-                if extracted_title:
-                    display_title = extracted_title
-                else:
-                    self.warnings.append(f"No H1 title found in README: {relative_path}")
-            else:
-                self.warnings.append(f"Missing README.md: {relative_path}")
-            
-            project_info = ProjectInfo(
-                name=parts[-1],  # Last directory name (for technical use)
-                display_title=display_title,  # Human-readable title from README
-                path=project_dir,
-                relative_path=relative_path,
-                depth=len(parts) - 1,  # Depth beyond category
-                category=parts[0],
-                has_readme=has_readme,
-                readme_path=readme_path if has_readme else None
-            )
-            
-            projects.append(project_info)
-            self.stats['projects_found'] += 1
-            if has_readme:
-                self.stats['projects_with_readme'] += 1
-        
-        return projects
+    
+    def _index_for(self, projects_dir: Path) -> ProjectIndex:
+        """Shared project index if it covers projects_dir, else one built with a single walk"""
+        if self.project_index is not None and self.project_index.root == projects_dir:
+            return self.project_index
+        if self._local_index is None or self._local_index.root != projects_dir:
+            self._local_index = ProjectIndex.build(projects_dir)
+        return self._local_index
+    
+    def _indexes(self) -> List[ProjectIndex]:
+        return [index for index in (self.project_index, self._local_index) if index is not None]
+    
+    def _file_exists(self, path: Path) -> bool:
+        for index in self._indexes():
+            if index.contains(path):
+                return index.has_file(path)
+        return path.exists()
+    
+    def link_checker(self, cache_file: Optional[Path] = None) -> LinkChecker:
+        """Link checker over the indexes discovery used (created on first use)"""
+        if self._link_checker is None:
+            self._link_checker = LinkChecker(self._indexes(), cache_file)
+        return self._link_checker
+    
+    def _stat(self, path: Path) -> Optional[Tuple[int, int]]:
+        """(size, mtime_ns) from an index covering path, if any"""
+        for index in self._indexes():
+            if index.contains(path):
+                return index.stat(path)
+        return None
     
     def group_projects_by_category(self, projects: List[ProjectInfo]) -> Dict[str, List[ProjectInfo]]:
         """
@@ -341,6 +319,9 @@ class SidebarGenerator:
         """
         Validate all markdown links in the generated content
         
+        Targets are looked up in the path set of the project index(es)
+        rather than stat'ed one by one.
+        
         Args:
             content: Generated sidebar content
             base_dir: Base directory for resolving relative paths
@@ -350,6 +331,7 @@ class SidebarGenerator:
             List of broken link descriptions
         """
         broken_links = []
+        checker = self.link_checker()
         
         # Extract all markdown links
         link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
@@ -372,7 +354,7 @@ class SidebarGenerator:
                 actual_path = base_dir / link_path
             
             # Check if file exists
-            if not actual_path.exists():
+            if not checker.exists(actual_path):
                 broken_links.append(f"'{link_text}' -> {link_path}")
         
         return broken_links
@@ -406,17 +388,42 @@ class SidebarGenerator:
         # Group by category
         categories = self.group_projects_by_category(projects)
         
+        category_titles = {}
+        for category_name in categories:
+            category_readme_path = projects_dir / category_name / "README.md"
+            if self._file_exists(category_readme_path):
+                category_titles[category_name] = (self.extract_title_from_readme(category_readme_path)
+                                                  or f"{category_name.upper()} Demos")
+        
+        # Same projects, titles and settings as the last render: reuse its output
+        sidebar_key = self.title_index.sidebar_key({
+            'projects_dir': self.config.structure.projects_dir,
+            'use_hierarchy': use_hierarchy,
+            'projects': sorted((p.relative_path.as_posix(), p.display_title, p.has_readme, p.is_project)
+                               for p in projects),
+            'categories': category_titles,
+        })
+        cached = self.title_index.cached_sidebar(sidebar_key)
+        if cached is not None:
+            self.stats['broken_links'] = cached.get('stats', {}).get('broken_links', 0)
+            return cached['content']
+        
+        content = self._render_sidebar(projects_dir, categories, category_titles, use_hierarchy)
+        self.title_index.remember_sidebar(sidebar_key, content, self.stats)
+        return content
+    
+    def _render_sidebar(self, projects_dir: Path, categories: Dict[str, List[ProjectInfo]],
+                        category_titles: Dict[str, str], use_hierarchy: bool) -> str:
+        """Render the sidebar markdown for grouped projects"""
         # Generate content without title (Docsify handles titles separately)
         content = ""
         
         for category_name in sorted(categories.keys()):
             category_projects = categories[category_name]
             # Only add the category header once
-            category_readme_path = projects_dir / category_name / "README.md"
-            if category_readme_path.exists():
-                category_title = self.extract_title_from_readme(category_readme_path)
-                if not category_title:
-                    category_title = f"{category_name.upper()} Demos"
+            has_category_readme = category_name in category_titles
+            if has_category_readme:
+                category_title = category_titles[category_name]
                 category_link = f"/{str(self.config.structure.projects_dir)}/{category_name}/README.md".replace('/./', '/')
                 content += f"- [{category_title}]({category_link})\n"
             else:
@@ -427,13 +434,12 @@ class SidebarGenerator:
                 base_path = str(self.config.structure.projects_dir) if self.config.structure.projects_dir else ""
                 # If category has README, skip it in hierarchy rendering
                 skip_link = None
-                if category_readme_path.exists():
+                if has_category_readme:
                     skip_link = f"/{base_path}/{category_name}/README.md".replace('/./', '/')
                 category_content = self.render_hierarchy_markdown(
                     tree, base_path, depth=1, skip_category_readme=skip_link
                 )
             else:
-                has_category_readme = category_readme_path.exists()
                 for project in sorted(category_projects, key=lambda p: p.display_title.lower()):
                     if (has_category_readme and 
                         len(project.relative_path.parts) == 1 and 
@@ -451,6 +457,7 @@ class SidebarGenerator:
             content += "\n"
         
         return content
+    
     def generate_report(self) -> str:
         """Generate a status report of the sidebar generation"""
         report = []
@@ -475,21 +482,30 @@ class SidebarGenerator:
 
 def generate_sidebar(projects_dir: Path, config: BuildSystemConfig, 
                             validate: bool = True, verbose: bool = False,
-                            use_hierarchy: bool = False) -> Tuple[str, List[str]]:
+                            use_hierarchy: bool = False,
+                            project_index: Optional[ProjectIndex] = None,
+                            title_index_file: Optional[Path] = None,
+                            link_cache_file: Optional[Path] = None) -> Tuple[str, List[str]]:
     """
-                actual_path = base_dir / Path(link_path[1:])  # Remove leading slash, ensure Path
+    Generate the Docsify sidebar for a projects directory
     
     Args:
-                actual_path = base_dir / Path(link_path)
+        projects_dir: Directory containing Godot projects
         config: Build system configuration
         validate: Whether to validate generated links
         verbose: Whether to show detailed progress
         use_hierarchy: Whether to use hierarchical nesting for complex structures
+        project_index: Shared index of the projects tree
+        title_index_file: Persisted README title index; titles of unchanged
+            READMEs and an unchanged sidebar are reused from it
+        link_cache_file: Persisted links extracted from each README (by content
+            hash), used when validating README links
         
     Returns:
         Tuple of (sidebar_content, errors)
     """
-    generator = SidebarGenerator(config)
+    title_index = ReadmeTitleIndex(title_index_file)
+    generator = SidebarGenerator(config, project_index, title_index)
     
     if verbose:
         print(f"🔍 Scanning for projects in: {projects_dir}")
@@ -504,18 +520,31 @@ def generate_sidebar(projects_dir: Path, config: BuildSystemConfig,
         # Determine sidebar base path for validation (e.g. deployment root)
         # Dynamically set sidebar_base_path to the folder name of projects_dir
         sidebar_base_path = projects_dir.name
+        checker = generator.link_checker(link_cache_file)
         broken_links = generator.validate_links(content, projects_dir.parent, sidebar_base_path=sidebar_base_path)
         if broken_links:
             generator.errors.extend([f"Broken link: {link}" for link in broken_links])
 
         # Per-project README validation
-        for category_projects in generator.group_projects_by_category(generator.discover_projects_and_readmes(projects_dir)).values():
-            for project in category_projects:
-                if not project.has_readme:
-                    generator.errors.append(f"Missing README.md for project: {project.path}")
+        for project in sorted(generator.projects, key=lambda p: (p.category, p.relative_path)):
+            if not project.has_readme:
+                generator.errors.append(f"Missing README.md for project: {project.path}")
+        
+        # Relative links and images inside every README; absolute ones (/<projects dir>/...)
+        # resolve against the site root, the directory holding projects_dir
+        readmes = sorted(project.readme_path for project in generator.projects if project.readme_path)
+        for link in checker.check_readmes(readmes, projects_dir.parent):
+            generator.errors.append(
+                f"Broken link in {Path(link.source).relative_to(projects_dir).as_posix()}: {link}")
+        checker.save()
+        if verbose:
+            print(f"🔗 README links: {checker.cached} READMEs cached, {checker.parsed} parsed")
+    
+    title_index.save()
     
     # Show report if verbose
     if verbose:
+        print(f"📖 README titles: {title_index.hits} cached, {title_index.reads} read")
         print(generator.generate_report())
     
     return content, generator.errors
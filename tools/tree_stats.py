@@ -0,0 +1,127 @@
+"""
+Tree Statistics
+===============
+
+Size, file count and per-extension breakdown of a directory tree in one
+os.scandir pass, with top-level subdirectories scanned in parallel.
+Artifact staging records the same statistics while it stages files, so the
+staged tree never has to be walked again.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+PathLike = Union[str, os.PathLike]
+
+
+@dataclass
+class TreeStats:
+    """Aggregate statistics of a set of files"""
+    total_size: int = 0
+    file_count: int = 0
+    # Lower-case extension ("" for none) -> [file count, total size]
+    by_extension: Dict[str, List[int]] = field(default_factory=dict)
+
+    def add(self, name: str, size: int):
+        """Record one file"""
+        self.total_size += size
+        self.file_count += 1
+        bucket = self.by_extension.setdefault(os.path.splitext(name)[1].lower(), [0, 0])
+        bucket[0] += 1
+        bucket[1] += size
+
+    def remove(self, name: str, size: int):
+        """Forget one file recorded earlier"""
+        self.total_size -= size
+        self.file_count -= 1
+        bucket = self.by_extension.get(os.path.splitext(name)[1].lower())
+        if bucket is not None:
+            bucket[0] -= 1
+            bucket[1] -= size
+            if bucket[0] <= 0:
+                del self.by_extension[os.path.splitext(name)[1].lower()]
+
+    def merge(self, other: 'TreeStats') -> 'TreeStats':
+        """Fold another set of statistics into this one"""
+        self.total_size += other.total_size
+        self.file_count += other.file_count
+        for ext, (count, size) in other.by_extension.items():
+            bucket = self.by_extension.setdefault(ext, [0, 0])
+            bucket[0] += count
+            bucket[1] += size
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form, extensions ordered by size"""
+        return {
+            "total_size": self.total_size,
+            "total_files": self.file_count,
+            "by_extension": {
+                ext or "(none)": {"files": count, "size": size}
+                for ext, (count, size) in sorted(self.by_extension.items(), key=lambda item: -item[1][1])
+            },
+        }
+
+
+def _scan(directory: str, skip: Optional[Callable[[str], bool]]) -> TreeStats:
+    stats = TreeStats()
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if skip is None or not skip(entry.name):
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        stats.add(entry.name, entry.stat().st_size)
+                except OSError:
+                    continue
+    return stats
+
+
+def scan_tree(root: PathLike, skip: Optional[Callable[[str], bool]] = None,
+              max_workers: Optional[int] = None) -> TreeStats:
+    """
+    Collect statistics for every file below root
+
+    Args:
+        root: Directory to scan
+        skip: Called with each directory name; True prunes that directory
+        max_workers: Threads scanning top-level subdirectories (default: CPU count, capped at 16)
+
+    Returns:
+        TreeStats for the tree (empty if root is missing)
+    """
+    stats = TreeStats()
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if skip is None or not skip(entry.name):
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        stats.add(entry.name, entry.stat().st_size)
+                except OSError:
+                    continue
+    except OSError:
+        return stats
+
+    if len(subdirs) < 2:
+        for subdir in subdirs:
+            stats.merge(_scan(subdir, skip))
+        return stats
+
+    workers = min(len(subdirs), max_workers or min(16, os.cpu_count() or 4))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for sub_stats in executor.map(lambda subdir: _scan(subdir, skip), subdirs):
+            stats.merge(sub_stats)
+    return stats